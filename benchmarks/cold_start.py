@@ -0,0 +1,159 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Where the cold start of a short lingua_franca job goes
+
+Run with:
+
+    python benchmarks/cold_start.py
+
+Three measurements, each in fresh interpreters:
+
+1. A short CLI job (import, extract_datetime, extract_number and
+   nice_date_time), as it runs now and with the multiprocessing import that
+   parse.py used to do at module level ("before").
+2. Importing and loading every language.
+3. For the derived tables (number tables built from invert_dict and the
+   generate_plurals_* / generate_fractions_* helpers, and the compiled
+   date_time.json of DateTimeFormat), the time to build them against the
+   time to unpickle them, which is what loading a serialized bundle of them
+   would cost.
+
+The serialized bundle was left out because of 3.: building the tables takes
+about as long as unpickling them, a fraction of a millisecond per language,
+against tens of milliseconds for the imports in 1. and 2.
+"""
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import timeit
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+REPEATS = 15
+
+CLI_JOB = """
+from datetime import datetime
+import lingua_franca
+from lingua_franca.parse import extract_datetime, extract_number
+from lingua_franca.format import nice_date_time
+lingua_franca.load_language("en")
+extract_datetime("remind me tomorrow at 5 pm")
+extract_number("twenty two and a half")
+nice_date_time(datetime(2017, 6, 27, 13, 4))
+"""
+
+LOAD_ALL = """
+import lingua_franca
+from lingua_franca.internal import _SUPPORTED_LANGUAGES
+lingua_franca.load_languages(list(_SUPPORTED_LANGUAGES))
+"""
+
+# what parse.py imported at module level before it was deferred
+BEFORE = "from concurrent.futures import ProcessPoolExecutor\n"
+
+TIMED = """
+from time import perf_counter
+start = perf_counter()
+{}
+print(perf_counter() - start)
+"""
+
+
+def run_fresh(code):
+    """ Median seconds of code over fresh interpreters """
+    times = []
+    for _ in range(REPEATS):
+        out = subprocess.run([sys.executable, "-c", TIMED.format(code)],
+                             check=True, cwd=ROOT, stdout=subprocess.PIPE,
+                             universal_newlines=True).stdout
+        times.append(float(out.split()[-1]))
+    return statistics.median(times)
+
+
+def build_vs_load(build):
+    """ Best microseconds of building the tables and of unpickling them """
+    data = pickle.dumps(build(), pickle.HIGHEST_PROTOCOL)
+    built = min(timeit.repeat(build, number=1, repeat=REPEATS))
+    loaded = min(timeit.repeat(lambda: pickle.loads(data), number=1,
+                               repeat=REPEATS))
+    return built * 1e6, loaded * 1e6, len(data)
+
+
+def number_tables(module_name, function_name, cache_name, args):
+    module = import_module(module_name)
+    function = getattr(module, function_name)
+    cache = getattr(module, cache_name)
+
+    def build():
+        cache.clear()
+        return [function(*arg) for arg in args]
+    return build
+
+
+def date_time_tables(lang):
+    from lingua_franca.format import DateTimeFormat, date_time_format
+
+    def build():
+        formatter = DateTimeFormat(date_time_format.config_path)
+        formatter.cache(lang)
+        return formatter.lang_config[lang]
+    return build
+
+
+def main():
+    print("fresh interpreter, median of {} runs".format(REPEATS))
+    after = run_fresh(CLI_JOB)
+    before = run_fresh(BEFORE + CLI_JOB)
+    print("  short CLI job           before {:6.1f}ms  after {:6.1f}ms"
+          .format(before * 1e3, after * 1e3))
+    print("  load every language     {:6.1f}ms"
+          .format(run_fresh(LOAD_ALL) * 1e3))
+    print()
+    print("derived tables, best of {} runs".format(REPEATS))
+    print("  {:<24} {:>10} {:>10} {:>8}".format(
+        "", "build", "unpickle", "bytes"))
+    both_scales = [(True,), (False,)]
+    cases = [
+        ("en numbers", number_tables("lingua_franca.lang.parse_en",
+                                     "_initialize_number_data_en",
+                                     "_NUMBER_DATA_EN",
+                                     [(True, True), (False, True),
+                                      (True, False), (False, False)])),
+        ("nl numbers", number_tables("lingua_franca.lang.parse_nl",
+                                     "_initialize_number_data_nl",
+                                     "_NUMBER_DATA_NL", both_scales)),
+        ("cs numbers", number_tables("lingua_franca.lang.parse_cs",
+                                     "_initialize_number_data",
+                                     "_NUMBER_DATA_CS", both_scales)),
+        ("pl numbers", number_tables("lingua_franca.lang.parse_pl",
+                                     "_initialize_number_data",
+                                     "_NUMBER_DATA_PL", both_scales)),
+        ("ru numbers", number_tables("lingua_franca.lang.parse_ru",
+                                     "_initialize_number_data",
+                                     "_NUMBER_DATA_RU", both_scales)),
+        ("en-us date_time.json", date_time_tables("en-us")),
+        ("ru-ru date_time.json", date_time_tables("ru-ru")),
+    ]
+    for name, build in cases:
+        print("  {:<24} {:>8.0f}us {:>8.0f}us {:>8}".format(
+            name, *build_vs_load(build)))
+
+
+if __name__ == "__main__":
+    main()
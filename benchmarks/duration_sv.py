@@ -0,0 +1,55 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""How extract_duration_sv scales with the length of the text
+
+Run with:
+
+    python benchmarks/duration_sv.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+A 17-word phrase with four durations is repeated 10, 40 and 160 times.
+The duration found is printed too, it should be the same in both trees.
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+PHRASE = "hämta mig om två timmar och en kvart sedan 5 minuter och tre " \
+         "sekunder efter en halvtimme"
+
+
+def main():
+    from lingua_franca.lang.parse_sv import extract_duration_sv
+
+    print("ms per call, best of {} runs".format(REPEATS))
+    for count in (10, 40, 160):
+        text = " ".join([PHRASE] * count)
+        best = min(timeit.repeat(lambda: extract_duration_sv(text),
+                                 number=1, repeat=REPEATS))
+        print("  {:5} words  {:6.1f}ms  {}".format(
+            len(text.split()), best * 1e3, extract_duration_sv(text)[0]))
+
+
+if __name__ == "__main__":
+    main()
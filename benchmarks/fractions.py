@@ -0,0 +1,79 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of is_fractional_* per word
+
+Run with:
+
+    python benchmarks/fractions.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+Each language's is_fractional_xx runs over a mix of fraction words,
+singular and plural, and other words, the time is per word. The words
+are lowercase, the functions before the change raised on others.
+"""
+import os
+import sys
+import timeit
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+WORDS = {
+    "en": ["half", "third", "quarters", "fifths", "sixteenth", "apple",
+           "twenty", "the", "minutes", "seconds"],
+    "nl": ["half", "derde", "kwart", "vijfde", "zestiende", "appel",
+           "twintig", "de", "minuten", "seconden"],
+    "it": ["mezzo", "terzo", "quarti", "quinti", "sedicesimo", "mela",
+           "venti", "il", "minuti", "secondi"],
+    "ru": ["половина", "треть", "четверть", "пятая", "шестнадцатая",
+           "яблоко", "двадцать", "и", "минуты", "секунды"],
+    "es": ["medio", "tercio", "cuarto", "quintos", "dieciseisavo",
+           "manzana", "veinte", "el", "minutos", "segundos"],
+    "eu": ["erdi", "heren", "laurden", "bosten", "hamaseirren", "sagar",
+           "hogei", "eta", "minutu", "segundo"],
+    "pt": ["meio", "terço", "quarto", "quintos", "dezesseis avos", "maçã",
+           "vinte", "o", "minutos", "segundos"],
+    "ca": ["mig", "terç", "quart", "cinquens", "setzè", "poma", "vint",
+           "el", "minuts", "segons"],
+    "fr": ["demi", "tiers", "quart", "cinquièmes", "seizième", "pomme",
+           "vingt", "le", "minutes", "secondes"],
+    "sv": ["halv", "tredjedel", "fjärdedel", "femtedelar", "sextondel",
+           "äpple", "tjugo", "och", "minuter", "sekunder"],
+}
+
+
+def main():
+    print("us per word, best of {} runs".format(REPEATS))
+    for lang, words in WORDS.items():
+        module = import_module("lingua_franca.lang.parse_" + lang)
+        is_fractional = getattr(module, "is_fractional_" + lang)
+
+        def run():
+            for word in words:
+                is_fractional(word)
+        per_word = min(timeit.repeat(run, number=1000, repeat=REPEATS)) / \
+            (1000 * len(words)) * 1e6
+        print("  {}  {:5.2f}us".format(lang, per_word))
+
+
+if __name__ == "__main__":
+    main()
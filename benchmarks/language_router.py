@@ -0,0 +1,127 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""How well and how fast lang="auto" picks the language of a text
+
+Run with:
+
+    python benchmarks/language_router.py
+
+The texts are the utterances passed to the parse functions in the
+per-language test files (test/test_parse_xx.py, test/test_parse.py for
+English), and the candidates every supported language. Measured:
+
+1. The time to build the lexicons, on the first route.
+2. The share of texts routed to the language of their test file, with
+   English as the default for ties, and without a default, where ties
+   go to the first candidate.
+3. The time to route a text.
+4. extract_number on every fifth text, called for every candidate
+   language, against one call with lang="auto".
+"""
+import ast
+import os
+import re
+import sys
+import timeit
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lingua_franca import load_languages  # noqa: E402
+from lingua_franca.internal import _SUPPORTED_LANGUAGES  # noqa: E402
+from lingua_franca.lang.parse_common import LanguageRouter  # noqa: E402
+from lingua_franca.parse import extract_number  # noqa: E402
+
+REPEATS = 3
+WORD = re.compile(r"[^\W\d_]+")
+PARSE_FUNCTIONS = ("extract", "testExtract", "normalize", "is_fractional",
+                   "get_gender")
+
+
+def utterances(lang):
+    """ The texts with words the test file of lang passes to parsers """
+    name = "test_parse.py" if lang == "en" else \
+        "test_parse_{}.py".format(lang)
+    path = os.path.join(ROOT, "test", name)
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf8") as f:
+        tree = ast.parse(f.read())
+    texts = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and node.args and \
+                isinstance(node.args[0], ast.Constant) and \
+                isinstance(node.args[0].value, str):
+            function = getattr(node.func, "id",
+                               getattr(node.func, "attr", ""))
+            text = node.args[0].value
+            if function.startswith(PARSE_FUNCTIONS) and WORD.search(text):
+                texts.add(text)
+    return texts
+
+
+def extract_number_or_none(text, lang):
+    try:
+        return extract_number(text, lang=lang)
+    except Exception:
+        return None
+
+
+def main():
+    langs = list(_SUPPORTED_LANGUAGES)
+    texts = [(lang, text) for lang in langs
+             for text in sorted(utterances(lang))]
+    router = LanguageRouter(langs)
+    start = perf_counter()
+    router.route("")
+    print("{} texts, {} languages".format(len(texts), len(langs)))
+    print("  lexicons built in {:.0f}ms".format(
+        (perf_counter() - start) * 1e3))
+
+    for name, default in (("default en", "en"), ("no default", None)):
+        right = sum(router.route(text, default) == lang
+                    for lang, text in texts)
+        print("  accuracy, {:<11} {:5.1f}%".format(
+            name, right / len(texts) * 100))
+
+    def route_all():
+        for lang, text in texts:
+            router.route(text, "en")
+    print("  routing             {:5.1f}us per text".format(min(
+        timeit.repeat(route_all, number=1, repeat=REPEATS)) /
+        len(texts) * 1e6))
+
+    load_languages(langs)
+    sample = [text for lang, text in texts[::5]]
+
+    def every_candidate():
+        for text in sample:
+            for lang in langs:
+                extract_number_or_none(text, lang)
+
+    def auto():
+        for text in sample:
+            extract_number_or_none(text, "auto")
+    for name, function in (("every candidate", every_candidate),
+                           ('lang="auto"', auto)):
+        print("  extract_number, {:<16} {:5.2f}ms per text".format(
+            name, min(timeit.repeat(function, number=1, repeat=REPEATS)) /
+            len(sample) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of nice_response for de/da/nl/sv on long responses
+
+Run with:
+
+    python benchmarks/nice_response.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+A paragraph with two dates and two exponents is repeated to about 440
+and 1,500 words. The nl dates have two digits, the nl code before the
+single word pass raised on some single digit dates.
+"""
+import os
+import sys
+import timeit
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+PARAGRAPHS = {
+    "de": "das treffen ist am 31. mai und danach am 12. juni im großen "
+          "saal es kostet 10 ^ 2 euro und die halle hat 2 ^ 8 plätze für "
+          "alle gäste",
+    "da": "mødet er den 31. maj og derefter den 12. juni i den store sal "
+          "det koster 10 ^ 2 kroner og salen har 2 ^ 8 pladser til alle "
+          "gæster",
+    "nl": "de vergadering is op 31 mei en daarna op 12 juni in de grote "
+          "zaal het kost 10 ^ 2 euro en de zaal heeft 2 ^ 8 plaatsen voor "
+          "alle gasten",
+    "sv": "mötet är den 31. maj och sedan den 12. juni i den stora salen "
+          "det kostar 10 ^ 2 kronor och salen har 2 ^ 8 platser för alla "
+          "gäster",
+}
+
+
+def main():
+    print("ms per call, best of {} runs".format(REPEATS))
+    for lang, paragraph in PARAGRAPHS.items():
+        nice_response = getattr(
+            import_module("lingua_franca.lang.format_" + lang),
+            "nice_response_" + lang)
+        for words in (440, 1500):
+            text = " ".join([paragraph] * (words // len(paragraph.split())))
+            best = min(timeit.repeat(lambda: nice_response(text), number=1,
+                                     repeat=REPEATS))
+            print("  {}  {:5} words  {:7.2f}ms".format(
+                lang, len(text.split()), best * 1e3))
+
+
+if __name__ == "__main__":
+    main()
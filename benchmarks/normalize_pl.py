@@ -0,0 +1,69 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of normalize_pl, and of the nl/sv/de/da normalizers, on long text
+
+Run with:
+
+    python benchmarks/normalize_pl.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+A transcript is a sentence with number and ordinal words repeated to
+about 2,500 and 20,000 words, each normalizer runs on it once per run.
+"""
+import os
+import sys
+import timeit
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+SENTENCES = {
+    "pl": "w następną środę o siódmej spotkamy się z dwadzieścia trzy "
+          "osoby i kupimy pierwszy bilet za sto pięćdziesiąt złotych",
+    "nl": "volgende week woensdag om zeven uur komen drieëntwintig "
+          "mensen en kopen we het eerste kaartje voor honderd euro",
+    "sv": "nästa onsdag klockan sju kommer tjugotre personer och vi "
+          "köper den första biljetten för etthundra kronor idag",
+    "de": "nächsten mittwoch um sieben uhr kommen dreiundzwanzig leute "
+          "und wir kaufen das erste ticket für hundert euro heute",
+    "da": "næste onsdag klokken syv kommer treogtyve personer og vi "
+          "køber den første billet for hundrede kroner i dag",
+}
+
+
+def main():
+    print("ms per call, best of {} runs".format(REPEATS))
+    for lang, sentence in SENTENCES.items():
+        normalize = getattr(
+            import_module("lingua_franca.lang.parse_" + lang),
+            "normalize_" + lang)
+        words = len(sentence.split())
+        for length in (2500, 20000):
+            text = " ".join([sentence] * (length // words))
+            best = min(timeit.repeat(lambda: normalize(text), number=1,
+                                     repeat=REPEATS))
+            print("  {}  {:6} words  {:7.1f}ms".format(
+                lang, len(text.split()), best * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""How the es/pt/ca/it/eu/fr normalizers scale with the length of the text
+
+Run with:
+
+    python benchmarks/normalize_romance.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+Each normalizer runs on 100, 200, 400 and 800 repetitions of a 13-word
+sentence, the time should double with the length.
+"""
+import os
+import sys
+import timeit
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+LENGTHS = (100, 200, 400, 800)
+
+SENTENCES = {
+    "es": "el martes compré dos kilos de manzanas y tres botellas de "
+          "agua fría",
+    "pt": "na terça feira comprei dois quilos de maçãs e três garrafas "
+          "de água",
+    "ca": "el dimarts vaig comprar dos quilos de pomes i tres ampolles "
+          "d'aigua freda",
+    "it": "martedì ho comprato due chili di mele e tre bottiglie di "
+          "acqua fresca",
+    "eu": "asteartean bi kilo sagar eta hiru botila ur hotz erosi nituen "
+          "denda txikian gaur",
+    "fr": "mardi j'ai acheté deux kilos de pommes et trois bouteilles "
+          "d'eau fraîche",
+}
+
+
+def main():
+    print("ms per call for {} repetitions, best of {} runs".format(
+        "/".join(map(str, LENGTHS)), REPEATS))
+    for lang, sentence in SENTENCES.items():
+        normalize = getattr(
+            import_module("lingua_franca.lang.parse_" + lang),
+            "normalize_" + lang)
+        times = []
+        for length in LENGTHS:
+            text = " ".join([sentence] * length)
+            times.append(min(timeit.repeat(lambda: normalize(text),
+                                           number=1, repeat=REPEATS)))
+        print("  {}  {}".format(lang, "/".join(
+            "{:.1f}".format(time * 1e3) for time in times)))
+
+
+if __name__ == "__main__":
+    main()
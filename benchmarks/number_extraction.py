@@ -0,0 +1,93 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of ReplaceableNumber and of the token based number extractors
+
+Run with:
+
+    python benchmarks/number_extraction.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+Two measurements:
+
+1. Creating a ReplaceableNumber, and its size, with its __dict__ if it
+   has one.
+2. extract_numbers_xx for the languages parsing through tokens (en, nl,
+   pl, ru, cs), on a sentence with numbers repeated to 220-300 words:
+   the time and the peak of memory allocated during one call, as
+   reported by tracemalloc.
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+from importlib import import_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+SENTENCES = {
+    "en": "i bought twenty two apples and three hundred and five pears "
+          "for one and a half dollars and the 2nd time four thousand",
+    "nl": "ik kocht tweeëntwintig appels en driehonderd vijf peren voor "
+          "anderhalve euro en de tweede keer vierduizend",
+    "pl": "kupiłem dwadzieścia dwa jabłka i trzysta pięć gruszek za "
+          "półtora złotego a drugi raz cztery tysiące",
+    "ru": "я купил двадцать два яблока и триста пять груш за полтора "
+          "рубля а во второй раз четыре тысячи",
+    "cs": "koupil jsem dvacet dva jablek a tři sta pět hrušek za jeden "
+          "a půl koruny a podruhé čtyři tisíce",
+}
+WORDS = 250
+
+
+def main():
+    from lingua_franca.lang.parse_common import ReplaceableNumber, Token
+
+    tokens = [Token("twenty", 0), Token("two", 1)]
+    print("ReplaceableNumber, best of {} runs".format(REPEATS))
+    print("  construction  {:5.2f}us".format(min(timeit.repeat(
+        lambda: ReplaceableNumber(22, tokens), number=100000,
+        repeat=REPEATS)) / 100000 * 1e6))
+    number = ReplaceableNumber(22, tokens)
+    size = sys.getsizeof(number)
+    if hasattr(number, "__dict__"):
+        size += sys.getsizeof(number.__dict__)
+    print("  size          {:5} bytes".format(size))
+    print()
+    print("extract_numbers, best of {} runs".format(REPEATS))
+    for lang, sentence in SENTENCES.items():
+        extract_numbers = getattr(
+            import_module("lingua_franca.lang.parse_" + lang),
+            "extract_numbers_" + lang)
+        text = " ".join([sentence] * (WORDS // len(sentence.split())))
+        extract_numbers(text)
+        best = min(timeit.repeat(lambda: extract_numbers(text), number=1,
+                                 repeat=REPEATS))
+        tracemalloc.start()
+        extract_numbers(text)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("  {}  {:3} words  {:5.1f}ms  {:5.1f}KiB".format(
+            lang, len(text.split()), best * 1e3, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
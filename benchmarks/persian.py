@@ -0,0 +1,106 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Throughput of the Persian number parser and formatter
+
+Run with:
+
+    python benchmarks/persian.py
+
+Two measurements:
+
+1. The formal/conversational rewriting alone, done the way parse_fa and
+   format_fa used to, with one str.replace per _FORMAL_VARIANT entry
+   ("before"), and with the single-pass rewriters of common_data_fa
+   ("after"), on one sentence and on 52 sentences joined together.
+2. extract_numbers_fa on sentences with numbers, and
+   pronounce_number_fa(variant="formal"), in calls per second.
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lingua_franca.lang.common_data_fa import _FORMAL_VARIANT, \
+    _TO_CONVERSATIONAL_FA, _TO_FORMAL_FA  # noqa: E402
+from lingua_franca.lang.format_fa import pronounce_number_fa  # noqa: E402
+from lingua_franca.lang.parse_fa import extract_numbers_fa  # noqa: E402
+
+REPEATS = 5
+
+SENTENCES = [
+    "هفده سیب و بیست و سه پرتقال",
+    "ساعت پانزده و سی دقیقه",
+    "هزار و دویست و شانزده",
+    "دو میلیون و هجده هزار و نهصد",
+]
+NUMBERS = [15, 16, 17, 18, 1517, 216, 18018, 1999999]
+
+
+def replace_each(text):
+    """ The rewriting before, one pass per table entry """
+    for key, value in _FORMAL_VARIANT.items():
+        text = text.replace(key, value)
+    return text
+
+
+def replace_each_back(text):
+    for key, value in _FORMAL_VARIANT.items():
+        text = text.replace(value, key)
+    return text
+
+
+def best(function, number):
+    """ Best microseconds per call of function over REPEATS runs """
+    return min(timeit.repeat(function, number=number,
+                             repeat=REPEATS)) / number * 1e6
+
+
+def main():
+    sentence = SENTENCES[0]
+    long_text = " ".join(SENTENCES * 13)
+    formal = pronounce_number_fa(1517)
+    print("rewriting, best of {} runs".format(REPEATS))
+    for name, before, after, text in (
+            ("to conversational, 1 sentence", replace_each,
+             _TO_CONVERSATIONAL_FA, sentence),
+            ("to conversational, 52 sentences", replace_each,
+             _TO_CONVERSATIONAL_FA, long_text),
+            ("to formal, pronounce_number", replace_each_back,
+             _TO_FORMAL_FA, formal)):
+        assert before(text) == after(text)
+        print("  {:<34} before {:6.2f}us  after {:6.2f}us".format(
+            name, best(lambda: before(text), 20000),
+            best(lambda: after(text), 20000)))
+    print()
+    print("calls per second, best of {} runs".format(REPEATS))
+
+    def parse():
+        for text in SENTENCES:
+            extract_numbers_fa(text)
+
+    def pronounce():
+        for number in NUMBERS:
+            pronounce_number_fa(number, variant="formal")
+    print("  extract_numbers_fa                 {:8.0f}/s".format(
+        len(SENTENCES) / best(parse, 2000) * 1e6))
+    print("  pronounce_number_fa formal         {:8.0f}/s".format(
+        len(NUMBERS) / best(pronounce, 2000) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
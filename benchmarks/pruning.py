@@ -0,0 +1,101 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of the pt/ca word pruning and of the extract_datetime calling it
+
+Run with:
+
+    python benchmarks/pruning.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+Two measurements:
+
+1. _pt_pruning on one sentence and on 20 sentences, _ca_pruning on one
+   sentence, and extract_datetime_pt/_ca.
+2. When the tree has the prebuilt pruning tables, replacing the symbols
+   and accents of parse_pt with one str.translate call, against the
+   chain of str.replace calls _pt_pruning makes.
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+NUMBER = 10000
+
+SENTENCE_PT = "marca a reunião de amanhã às três da tarde, na sala do " \
+              "terceiro andar; não te esqueças do relatório!"
+SENTENCE_CA = "recorda'm la reunió de demà a les tres de la tarda, a la " \
+              "sala del tercer pis; no t'oblidis l'informe!"
+DATETIME_PT = "marca o jantar para amanhã às oito da noite"
+DATETIME_CA = "recorda'm el sopar de demà a les vuit del vespre"
+
+
+def best(function, number=NUMBER):
+    """ Best microseconds per call of function over REPEATS runs """
+    return min(timeit.repeat(function, number=number,
+                             repeat=REPEATS)) / number * 1e6
+
+
+def translate_vs_replace(parse_pt):
+    pairs = parse_pt._PRUNED_SYMBOLS_PT + parse_pt._PRUNED_ACCENTS_PT
+    table = str.maketrans(dict(pairs))
+
+    def replace(text):
+        for character, replacement in pairs:
+            text = text.replace(character, replacement)
+        return text
+
+    print("pt symbols and accents, best of {} runs".format(REPEATS))
+    for name, text in (("one sentence", SENTENCE_PT),
+                       ("20 sentences", " ".join([SENTENCE_PT] * 20))):
+        assert text.translate(table) == replace(text)
+        print("  {:<14} str.translate {:6.1f}us  str.replace {:6.1f}us"
+              .format(name, best(lambda: text.translate(table)),
+                      best(lambda: replace(text))))
+
+
+def main():
+    from lingua_franca.lang import parse_ca, parse_pt
+
+    anchor = datetime(2017, 6, 27, 13, 4)
+    long_pt = " ".join([SENTENCE_PT] * 20)
+    print("us per call, best of {} runs".format(REPEATS))
+    for name, function in (
+            ("_pt_pruning, one sentence",
+             lambda: parse_pt._pt_pruning(SENTENCE_PT)),
+            ("_pt_pruning, 20 sentences",
+             lambda: parse_pt._pt_pruning(long_pt)),
+            ("_ca_pruning, one sentence",
+             lambda: parse_ca._ca_pruning(SENTENCE_CA)),
+            ("extract_datetime (pt)",
+             lambda: parse_pt.extract_datetime_pt(DATETIME_PT, anchor)),
+            ("extract_datetime (ca)",
+             lambda: parse_ca.extract_datetime_ca(DATETIME_CA, anchor))):
+        print("  {:<26} {:6.1f}us".format(name, best(function)))
+    if hasattr(parse_pt, "_PRUNED_SYMBOLS_PT"):
+        print()
+        translate_vs_replace(parse_pt)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of reading the resource files, and of the functions reading them
+
+Run with:
+
+    python benchmarks/resources.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+Two measurements:
+
+1. Reading every file under res/ one by one, against reading them all
+   from a resource pack, which is built in a temporary folder. Skipped
+   for trees without lingua_franca.resource_pack.
+2. _translate_word("day") and nice_duration(93784), which reads several
+   .word files, in English.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+
+
+def best(function, number):
+    """ Best microseconds per call of function over REPEATS runs """
+    return min(timeit.repeat(function, number=number,
+                             repeat=REPEATS)) / number * 1e6
+
+
+def read_files(res_dir):
+    for path, directories, filenames in os.walk(res_dir):
+        for name in filenames:
+            with open(os.path.join(path, name), "rb") as f:
+                f.read()
+
+
+def pack_vs_files():
+    from lingua_franca.resource_pack import DEFAULT_RES_DIR, ResourcePack, \
+        build_resource_pack
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "res.pack")
+        build_resource_pack(DEFAULT_RES_DIR, filename)
+        pack = ResourcePack(filename)
+        names = pack.names()
+
+        def read_pack():
+            for name in names:
+                pack.read(name)
+        print("all {} resources, {}KB, best of {} runs".format(
+            len(names), os.path.getsize(filename) // 1024, REPEATS))
+        print("  one file each  {:6.2f}ms".format(
+            best(lambda: read_files(DEFAULT_RES_DIR), 20) / 1e3))
+        print("  from the pack  {:6.2f}ms".format(best(read_pack, 20) / 1e3))
+        pack._map.close()
+
+
+def main():
+    import lingua_franca
+    from lingua_franca.format import _translate_word, nice_duration
+
+    try:
+        pack_vs_files()
+        print()
+    except ImportError:
+        pass
+    lingua_franca.load_language("en")
+    print("us per call, best of {} runs".format(REPEATS))
+    print("  _translate_word        {:6.1f}us".format(
+        best(lambda: _translate_word("day", "en"), 10000)))
+    print("  nice_duration(93784)   {:6.1f}us".format(
+        best(lambda: nice_duration(93784, "en"), 10000)))
+
+
+if __name__ == "__main__":
+    main()
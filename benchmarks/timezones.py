@@ -0,0 +1,65 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cost of the timezone handling in lingua_franca.time and its callers
+
+Run with:
+
+    python benchmarks/timezones.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+English is loaded with timezone injection on (the default) and no
+default timezone set, so the system timezone is used. nice_time and
+nice_relative_time get naive datetimes, to_utc gets both a naive and
+an aware one, to_local an aware one.
+"""
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(sys.argv[1]) if len(sys.argv) > 1
+                else ROOT)
+REPEATS = 5
+NUMBER = 10000
+
+
+def main():
+    import lingua_franca
+    from lingua_franca.format import nice_relative_time, nice_time
+    from lingua_franca.time import now_local, to_local, to_utc
+
+    lingua_franca.load_language("en")
+    naive = datetime(2017, 1, 31, 13, 22, 3)
+    later = naive + timedelta(hours=2, minutes=5)
+    aware = now_local()
+    print("us per call, best of {} runs".format(REPEATS))
+    for name, function in (
+            ("nice_time", lambda: nice_time(naive)),
+            ("nice_relative_time",
+             lambda: nice_relative_time(later, naive)),
+            ("to_utc naive", lambda: to_utc(naive)),
+            ("to_utc aware", lambda: to_utc(aware)),
+            ("to_local", lambda: to_local(aware))):
+        best = min(timeit.repeat(function, number=NUMBER, repeat=REPEATS))
+        print("  {:<20} {:6.1f}us".format(name, best / NUMBER * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""What lingua_franca.warmup() saves in forked workers
+
+Run with:
+
+    python benchmarks/warmup.py [TREE]
+
+TREE is another lingua_franca checkout to measure instead of this one,
+e.g. one made with "git worktree add ../before <commit>^" to time the
+code as it was before that commit.
+
+A fresh interpreter loads the languages, with and without calling
+warmup() after that, then forks the workers. Each worker calls
+extract_datetime, extract_numbers, nice_date and nice_number once per
+language, timing that first round, then does 20 more rounds and reads
+its PSS and private dirty memory from /proc/self/smaps_rollup (so this
+only runs on Linux). The values are averaged over the workers.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TREE = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else ROOT
+WORKERS = 4
+ROUNDS = 20
+LANGS = ["en", "nl", "de", "da", "sv", "fr", "es", "pt", "it", "ca", "pl",
+         "ru"]
+
+SERVER = """
+import os
+from datetime import datetime
+from time import perf_counter
+import lingua_franca
+from lingua_franca.format import nice_date, nice_number
+from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.parse import extract_datetime, extract_numbers
+
+LANGS = {langs!r}
+lingua_franca.load_languages(LANGS)
+if {warm!r}:
+    lingua_franca.warmup(LANGS)
+
+
+CALLS = (lambda lang: extract_datetime("tomorrow at 5 pm", lang=lang),
+         lambda lang: extract_numbers("2 and 3.5", lang=lang),
+         lambda lang: nice_date(datetime(2017, 6, 27), lang=lang),
+         lambda lang: nice_number(3.5, lang=lang, speech=True))
+
+
+def round_():
+    for lang in LANGS:
+        for call in CALLS:
+            try:
+                call(lang)
+            except FunctionNotLocalizedError:
+                pass
+
+
+def memory():
+    with open("/proc/self/smaps_rollup") as smaps:
+        fields = dict(line.split()[:2] for line in smaps
+                      if line.endswith("kB\\n"))
+    return int(fields["Pss:"]), int(fields["Private_Dirty:"])
+
+
+pipes = []
+for _ in range({workers}):
+    read, write = os.pipe()
+    if os.fork() == 0:
+        os.close(read)
+        start = perf_counter()
+        round_()
+        first = perf_counter() - start
+        for _ in range({rounds}):
+            round_()
+        os.write(write, "{{}} {{}} {{}}".format(first, *memory()).encode())
+        os._exit(0)
+    os.close(write)
+    pipes.append(read)
+for read in pipes:
+    print(os.read(read, 100).decode())
+    os.close(read)
+while True:
+    try:
+        os.wait()
+    except ChildProcessError:
+        break
+"""
+
+
+def run(warm):
+    """ Average first round seconds, PSS and private dirty kB per worker """
+    code = SERVER.format(langs=LANGS, warm=warm, workers=WORKERS,
+                         rounds=ROUNDS)
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         cwd=TREE, stdout=subprocess.PIPE,
+                         universal_newlines=True).stdout
+    workers = [list(map(float, line.split())) for line in out.splitlines()]
+    return [sum(column) / len(workers) for column in zip(*workers)]
+
+
+def main():
+    print("{} languages, {} workers, averages per worker".format(
+        len(LANGS), WORKERS))
+    for name, warm in (("without warmup", False), ("with warmup", True)):
+        first, pss, dirty = run(warm)
+        print("  {:<15} first round {:5.3f}s  PSS {:5.1f}MB  "
+              "private dirty {:5.1f}MB".format(name, first, pss / 1024,
+                                               dirty / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 from .internal import get_default_lang, set_default_lang, get_default_loc, \
     get_active_langs, _set_active_langs, get_primary_lang_code, \
-    get_full_lang_code, resolve_resource_file, load_language, \
-    load_languages, unload_language, unload_languages, get_supported_langs
+    get_full_lang_code, resolve_resource_file, read_resource_file, \
+    clear_resource_cache, \
+    load_language, load_languages, unload_language, unload_languages, \
+    get_supported_langs, warmup, stats, enable_stats, disable_stats, \
+    enable_slow_call_log, disable_slow_call_log, slow_calls, dump_slow_calls
 
 from lingua_franca import config
@@ -0,0 +1,147 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""asyncio counterparts of the parse and format functions
+
+Every function here takes the same arguments as its namesake in
+lingua_franca.parse or lingua_franca.format, and runs it in an executor so
+the event loop isn't blocked while parsing.
+
+    >>> from lingua_franca import aio
+    >>> await aio.extract_datetime("tomorrow at 5 pm", lang="en")
+
+At most `max_concurrency` calls run at once, further calls wait for a free
+slot. Identical calls (same function, arguments, default language,
+default timezone and config settings) made while one of them is still
+running share its result, mutable results like lists are shared as well
+and should not be modified.
+
+Use configure() to run the calls in your own thread or process pool. Note
+that a process pool created with the "spawn" start method doesn't inherit
+the loaded languages, set load_langs_on_demand or load them in an
+initializer.
+"""
+import asyncio
+import os
+from functools import partial, wraps
+from weakref import WeakKeyDictionary
+
+from lingua_franca import config, parse as _parse, format as _format
+from lingua_franca.internal import get_default_lang
+from lingua_franca.time import default_timezone
+
+__executor = None
+__max_concurrency = os.cpu_count() or 1
+# per event loop: (semaphore limiting the running calls, calls in flight)
+__loop_state = WeakKeyDictionary()
+
+
+def configure(executor=None, max_concurrency=None):
+    """ Set where and how many calls run at once
+
+    Calls already waiting or running are not affected.
+
+    Args:
+        executor (concurrent.futures.Executor): the executor to run calls
+            in, None uses the event loop's default executor
+        max_concurrency (int): the maximum number of calls running at once,
+            None uses the number of CPUs
+    """
+    global __executor, __max_concurrency
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    __executor = executor
+    __max_concurrency = max_concurrency or os.cpu_count() or 1
+    __loop_state.clear()
+
+
+def _get_loop_state(loop):
+    try:
+        return __loop_state[loop]
+    except KeyError:
+        state = __loop_state[loop] = \
+            (asyncio.Semaphore(__max_concurrency), {})
+        return state
+
+
+async def _call(loop, semaphore, func, args, kwargs):
+    async with semaphore:
+        return await loop.run_in_executor(__executor,
+                                          partial(func, *args, **kwargs))
+
+
+async def run(func, *args, **kwargs):
+    """ Run a function in the configured executor
+
+    Identical calls in flight are coalesced into one, see module docs.
+
+    Args:
+        func (callable): the function to run, must be picklable if running
+                         in a process pool
+        args: positional arguments for func
+        kwargs: keyword arguments for func
+
+    Returns:
+        whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    semaphore, in_flight = _get_loop_state(loop)
+    # the defaults and settings the call runs with are part of it, tzinfo
+    # objects aren't always hashable, their repr names them
+    key = (func, get_default_lang(), repr(default_timezone()),
+           config.inject_timezones, config.load_langs_on_demand,
+           args, tuple(sorted(kwargs.items())))
+    try:
+        task = in_flight.get(key)
+    except TypeError:  # unhashable arguments, can't be coalesced
+        key = task = None
+
+    if task is None:
+        task = loop.create_task(_call(loop, semaphore, func, args, kwargs))
+        if key is not None:
+            in_flight[key] = task
+            task.add_done_callback(lambda _: in_flight.pop(key, None))
+    # a cancelled caller mustn't cancel the call for the others waiting
+    return await asyncio.shield(task)
+
+
+def _asynchronous(func):
+    @wraps(func)
+    async def call_in_executor(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+    return call_in_executor
+
+
+extract_numbers = _asynchronous(_parse.extract_numbers)
+extract_number = _asynchronous(_parse.extract_number)
+extract_duration = _asynchronous(_parse.extract_duration)
+extract_datetime = _asynchronous(_parse.extract_datetime)
+normalize = _asynchronous(_parse.normalize)
+get_gender = _asynchronous(_parse.get_gender)
+is_fractional = _asynchronous(_parse.is_fractional)
+is_ordinal = _asynchronous(_parse.is_ordinal)
+fuzzy_match = _asynchronous(_parse.fuzzy_match)
+match_one = _asynchronous(_parse.match_one)
+
+nice_number = _asynchronous(_format.nice_number)
+nice_time = _asynchronous(_format.nice_time)
+pronounce_number = _asynchronous(_format.pronounce_number)
+nice_date = _asynchronous(_format.nice_date)
+nice_date_time = _asynchronous(_format.nice_date_time)
+nice_year = _asynchronous(_format.nice_year)
+nice_duration = _asynchronous(_format.nice_duration)
+join_list = _asynchronous(_format.join_list)
+nice_response = _asynchronous(_format.nice_response)
+nice_relative_time = _asynchronous(_format.nice_relative_time)
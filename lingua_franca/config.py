@@ -1,2 +1,3 @@
 load_langs_on_demand = False
 inject_timezones = True
+prefilter = True
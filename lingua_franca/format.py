@@ -28,7 +28,7 @@ from lingua_franca.internal import localized_function, \
     get_full_lang_code, get_default_lang, get_default_loc, \
     is_supported_full_lang, _raise_unsupported_language, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError
+    FunctionNotLocalizedError, read_resource_file
 from lingua_franca.time import now_local, to_utc
 
 
@@ -53,7 +53,7 @@ def _translate_word(name, lang=''):
     Returns:
         str: translated version of resource name
     """
-    from lingua_franca.internal import resolve_resource_file
+    from lingua_franca.internal import read_resource_file
     if not lang:
         if lang is None:
             warn(NoneLangWarning)
@@ -62,18 +62,16 @@ def _translate_word(name, lang=''):
     lang_code = lang if is_supported_full_lang(lang) else \
         get_full_lang_code(lang)
 
-    filename = resolve_resource_file(join("text", lang_code, name + ".word"))
-    if filename:
-        # open the file
-        try:
-            with open(filename, 'r', encoding='utf8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word.startswith("#"):
-                        continue  # skip comment lines
-                    return word
-        except Exception:
-            pass
+    try:
+        content = read_resource_file(join("text", lang_code, name + ".word"))
+    except Exception:
+        content = None
+    if content:
+        for line in content.splitlines():
+            word = line.strip()
+            if word.startswith("#"):
+                continue  # skip comment lines
+            return word
     return name  # use resource name as the word
 
 
@@ -88,20 +86,27 @@ class DateTimeFormat:
         self.lang_config = {}
         self.config_path = config_path
 
+    def _read_config(self, lang):
+        """ The content of a language's date_time.json, None if missing """
+        # the package's own files are read like its other resources, from
+        # the resource pack when there is one
+        if os.path.abspath(self.config_path) == _PACKAGE_TEXT_DIR:
+            return read_resource_file(join("text", lang, "date_time.json"))
+        try:
+            with open(self.config_path + '/' + lang + '/date_time.json',
+                      'r', encoding='utf8') as lang_config_file:
+                return lang_config_file.read()
+        except FileNotFoundError:
+            return None
+
     def cache(self, lang):
         if lang not in self.lang_config:
-            try:
-                # Attempt to load the language-specific formatting data
-                with open(self.config_path + '/' + lang + '/date_time.json',
-                          'r', encoding='utf8') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
-            except FileNotFoundError:
+            # Attempt to load the language-specific formatting data
+            content = self._read_config(lang)
+            if content is None:
                 # Fallback to English formatting
-                with open(self.config_path + '/en-us/date_time.json',
-                          'r') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
+                content = self._read_config('en-us')
+            self.lang_config[lang] = json.loads(content)
 
             for x in ['decade_format', 'hundreds_format', 'thousand_format',
                       'year_format']:
@@ -240,10 +245,41 @@ class DateTimeFormat:
                           bc=formatted_bc)).strip()
 
 
+_PACKAGE_TEXT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                 'res', 'text'))
+
 date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__),
                                                'res/text'))
 
 
+def _warmup(lang):
+    """ Run the formatters once, see lingua_franca.warmup()
+
+    Args:
+        lang (str): the BCP-47 code for the language to warm up
+    """
+    date_time_format.cache(get_full_lang_code(lang))
+    dt = datetime.datetime(2017, 1, 31, 13, 22, 3, tzinfo=now_local().tzinfo)
+    for function, args in ((nice_number, (5.5, True)),
+                           (nice_time, (dt,)),
+                           (pronounce_number, (1234.5,)),
+                           (nice_date, (dt,)),
+                           (nice_date_time, (dt,)),
+                           (nice_year, (dt,)),
+                           (nice_duration, (3723,)),
+                           (nice_response, ("the 5th",)),
+                           (nice_relative_time, (dt, dt)),
+                           (join_list, (["one", "two"], "and"))):
+        try:
+            function(*args, lang=lang)
+        except NotImplementedError:
+            # not localized
+            pass
+        except Exception as e:
+            warn("warmup: {}() failed for '{}': {!r}".format(
+                function.__name__, lang, e))
+
+
 @localized_function(run_own_code_on=[UnsupportedLanguageError])
 def nice_number(number, lang='', speech=True, denominators=None):
     """Format a float to human readable functions
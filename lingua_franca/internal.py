@@ -1,7 +1,13 @@
+import gc
+import json
 import os.path
+from bisect import bisect_left
+from collections import deque
 from functools import wraps
 from importlib import import_module
 from inspect import signature
+from threading import Lock, local
+from time import perf_counter, time
 
 from warnings import warn
 from datetime import datetime
@@ -43,6 +49,29 @@ __loaded_langs = []
 
 _localized_functions = {}
 
+__resource_pack = None
+__resource_cache = {}
+
+__language_routers = {}
+
+# whether calls go through _call_and_record(), for the stats or the slow
+# call log
+__instrumented = False
+__stats_enabled = False
+__stats_exporter = None
+__stats_lock = Lock()
+# (function name, language): _CallStats
+__call_stats = {}
+# upper bounds, in seconds, of the latency histogram's buckets
+_STATS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                  0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf"))
+# slow calls kept, logging them is off while the threshold is None
+__slow_calls = deque(maxlen=100)
+__slow_call_threshold = None
+__slow_call_profile = False
+# whether a call of this thread is being profiled
+__profiling = local()
+
 # TODO the deprecation of 'lang=None' and 'lang=<invalid>' can refer to
 # commit 35efd0661a178e82f6745ad17e10e607c0d83472 for the "proper" state
 # of affairs, raising the errors below instead of deprecation warnings
@@ -229,6 +258,325 @@ def unload_languages(langs):
     _set_active_langs(__loaded_langs)
 
 
+def warmup(langs=None, modules=("parse", "format"), freeze=True):
+    """Load languages and build everything their functions use up front.
+
+       Imports the language modules, loads their resources and runs every
+       function of the given top-level modules once per language, so the
+       tables, compiled regexes and caches they build lazily already exist.
+       Then freezes the garbage collector: in preforking servers (gunicorn,
+       uWSGI...) call this before the workers fork, so the first request
+       in each worker is fast and the memory stays shared between them.
+       Functions which are not localized are skipped, other errors are
+       reported with a warning.
+
+    Arguments:
+        langs (list(str) or str): language codes to load and warm up,
+                                  None warms up the loaded languages
+        modules (tuple(str)): top-level modules to warm up
+        freeze (bool): call gc.freeze(), so that garbage collection in the
+                       workers doesn't write to (and copy) the shared memory
+    """
+    if isinstance(langs, str):
+        langs = [langs]
+    langs = list(langs or get_active_langs())
+    load_languages(langs)
+    for lf_module in modules:
+        warm = getattr(import_module("." + lf_module, "lingua_franca"),
+                       "_warmup")
+        for lang in langs:
+            warm(lang)
+    gc.collect()
+    if freeze:
+        gc.freeze()
+
+
+class _CallStats:
+    __slots__ = ("calls", "errors", "fallbacks", "on_demand_loads",
+                 "total_seconds", "max_seconds", "histogram", "exceptions")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.fallbacks = 0
+        self.on_demand_loads = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * len(_STATS_BUCKETS)
+        self.exceptions = {}
+
+    def snapshot(self):
+        return {"calls": self.calls,
+                "errors": self.errors,
+                "fallbacks": self.fallbacks,
+                "on_demand_loads": self.on_demand_loads,
+                "total_seconds": self.total_seconds,
+                "max_seconds": self.max_seconds,
+                "histogram": list(zip(_STATS_BUCKETS, self.histogram)),
+                "exceptions": dict(self.exceptions)}
+
+
+def enable_stats(exporter=None):
+    """Start recording the calls to localized functions.
+
+       Every call to a function of the top-level modules (parse.extract_number,
+       format.nice_time...) is timed and counted per function and language,
+       see stats(). A call includes the calls it makes to other localized
+       functions, which are recorded as well.
+
+       Recording is off by default, and costs next to nothing then.
+
+    Arguments:
+        exporter (callable): optional, called after each call as
+            exporter(name, lang, seconds, error) with the function's name
+            ("parse.extract_number"), the primary language code, the
+            duration and the exception raised (None if the call returned),
+            to forward the calls to a metrics system. It runs in the caller's
+            thread, exceptions it raises are turned into warnings.
+    """
+    global __stats_enabled, __stats_exporter, __instrumented
+    __stats_exporter = exporter
+    __stats_enabled = __instrumented = True
+
+
+def disable_stats():
+    """Stop recording the calls to localized functions.
+
+       The statistics recorded so far are kept, see stats().
+    """
+    global __stats_enabled, __stats_exporter, __instrumented
+    __stats_enabled = False
+    __stats_exporter = None
+    __instrumented = __slow_call_threshold is not None
+
+
+def stats(reset=False):
+    """Snapshot of the calls recorded since enable_stats()
+
+    Arguments:
+        reset (bool): clear the statistics after taking the snapshot
+
+    Returns:
+        dict: {function name: {language: statistics}}, with the statistics
+              of a function in a language being a dict of
+
+              calls: number of calls
+              errors: calls which raised an exception
+              fallbacks: calls answered by the function's own code, because
+                  the localized one raised an error the function handles
+                  itself (FunctionNotLocalizedError, for instance)
+              on_demand_loads: calls which had to load the language first
+                  (see config.load_langs_on_demand), the other calls found
+                  it loaded
+              total_seconds, max_seconds: time spent in the calls
+              histogram: list of (upper bound in seconds, number of calls),
+                  each call counted in the first bucket it fits in
+              exceptions: {exception type name: count}, for both the
+                  exceptions raised and those handled by a fallback
+    """
+    global __call_stats
+    with __stats_lock:
+        recorded = __call_stats
+        if reset:
+            __call_stats = {}
+        snapshot = {}
+        for (name, lang), call_stats in recorded.items():
+            snapshot.setdefault(name, {})[lang] = call_stats.snapshot()
+    return snapshot
+
+
+def enable_slow_call_log(threshold_ms=100, max_entries=100, profile=False):
+    """Keep the calls to localized functions which take too long.
+
+       The last `max_entries` calls taking at least `threshold_ms` are kept
+       with their arguments, see slow_calls() and dump_slow_calls(), to
+       reproduce and profile them offline. As with stats(), a call includes
+       the calls it makes to other localized functions, which are checked
+       as well.
+
+    Arguments:
+        threshold_ms (float): minimum duration of the calls to keep
+        max_entries (int): number of calls kept, the oldest are dropped
+        profile (bool): profile every call, and keep the profile of the
+                        slow ones. This slows all the calls down, use it
+                        while investigating only.
+    """
+    global __slow_calls, __slow_call_threshold, __slow_call_profile, \
+        __instrumented
+    if max_entries < 1:
+        raise ValueError("max_entries must be at least 1")
+    __slow_calls = deque(__slow_calls, maxlen=max_entries)
+    __slow_call_threshold = threshold_ms / 1000
+    __slow_call_profile = profile
+    __instrumented = True
+
+
+def disable_slow_call_log():
+    """Stop keeping slow calls, those kept so far remain available."""
+    global __slow_call_threshold, __slow_call_profile, __instrumented
+    __slow_call_threshold = None
+    __slow_call_profile = False
+    __instrumented = __stats_enabled
+
+
+def slow_calls(clear=False):
+    """The slow calls kept, oldest first
+
+    Arguments:
+        clear (bool): forget the calls after returning them
+
+    Returns:
+        list(dict): one dict per call, with
+            function: the function's name, "parse.extract_datetime"
+            lang: the primary language code
+            args, kwargs: the arguments, as they were if they are strings,
+                numbers, booleans or None, else as their repr()
+            seconds: the duration of the call
+            time: when the call ended, as a Unix timestamp
+            error: repr() of the exception raised, or None
+            profile: if profiling, the functions which took the longest,
+                a list of dicts of function, calls, tottime and cumtime
+    """
+    calls = list(__slow_calls)
+    if clear:
+        __slow_calls.clear()
+    return calls
+
+
+def dump_slow_calls(filename, clear=False):
+    """Append the slow calls kept to a JSON Lines file, one call per line
+
+    Arguments:
+        filename (str): the file to append to
+        clear (bool): forget the calls after writing them
+
+    Returns:
+        int: the number of calls written
+    """
+    calls = slow_calls(clear)
+    with open(filename, "a", encoding="utf8") as f:
+        for call in calls:
+            f.write(json.dumps(call, ensure_ascii=False) + "\n")
+    return len(calls)
+
+
+def _loggable(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def _start_profiler():
+    if getattr(__profiling, "active", False):
+        # profiling the call this one was made from already
+        return None
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler is running
+        return None
+    __profiling.active = True
+    return profiler
+
+
+def _profile_summary(profiler, limit=20):
+    import pstats
+    rows = sorted(pstats.Stats(profiler).stats.items(),
+                  key=lambda row: row[1][3], reverse=True)
+    return [{"function": "{}:{}({})".format(*function),
+             "calls": calls, "tottime": tottime, "cumtime": cumtime}
+            for function, (_, calls, tottime, cumtime, _) in rows[:limit]]
+
+
+def _record_slow_call(name, lang, seconds, args, kwargs, error, profiler):
+    __slow_calls.append({
+        "function": name,
+        "lang": lang,
+        "args": [_loggable(arg) for arg in args],
+        "kwargs": {key: _loggable(value) for key, value in kwargs.items()},
+        "seconds": seconds,
+        "time": time(),
+        "error": None if error is None else repr(error),
+        "profile": None if profiler is None else _profile_summary(profiler)
+    })
+
+
+def _get_call_stats(name, lang):
+    # caller holds __stats_lock
+    try:
+        return __call_stats[name, lang]
+    except KeyError:
+        call_stats = __call_stats[name, lang] = _CallStats()
+        return call_stats
+
+
+def _stats_lang(args, kwargs, lang_param_index):
+    lang = kwargs.get("lang")
+    if lang is None and lang_param_index is not None and \
+            lang_param_index < len(args):
+        lang = args[lang_param_index]
+        if lang not in _SUPPORTED_LANGUAGES and \
+                lang not in _SUPPORTED_FULL_LOCALIZATIONS:
+            lang = None
+    if not lang or not isinstance(lang, str):
+        lang = get_default_lang()
+    return lang.split("-")[0].lower() if lang else None
+
+
+def _record_on_demand_load(name, lang):
+    with __stats_lock:
+        _get_call_stats(name, lang).on_demand_loads += 1
+
+
+def _record_stats(name, lang, seconds, handled, error):
+    with __stats_lock:
+        call_stats = _get_call_stats(name, lang)
+        call_stats.calls += 1
+        call_stats.total_seconds += seconds
+        if seconds > call_stats.max_seconds:
+            call_stats.max_seconds = seconds
+        call_stats.histogram[bisect_left(_STATS_BUCKETS, seconds)] += 1
+        if handled:
+            call_stats.fallbacks += 1
+        if error is not None:
+            call_stats.errors += 1
+        for e in handled + ([error] if error is not None else []):
+            e_name = type(e).__name__
+            call_stats.exceptions[e_name] = \
+                call_stats.exceptions.get(e_name, 0) + 1
+    exporter = __stats_exporter
+    if exporter is not None:
+        try:
+            exporter(name, lang, seconds, error)
+        except Exception as e:
+            warn("lingua_franca stats exporter failed: " + repr(e))
+
+
+def _call_and_record(name, lang_param_index, dispatch, args, kwargs):
+    lang = _stats_lang(args, kwargs, lang_param_index)
+    handled = []
+    error = None
+    profiler = _start_profiler() if __slow_call_profile else None
+    start = perf_counter()
+    try:
+        return dispatch(args, kwargs, handled)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        seconds = perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            __profiling.active = False
+        if __stats_enabled:
+            _record_stats(name, lang, seconds, handled, error)
+        threshold = __slow_call_threshold
+        if threshold is not None and seconds >= threshold:
+            _record_slow_call(name, lang, seconds, args, kwargs, error,
+                              profiler)
+
+
 def get_default_lang():
     """ Return the current default language.
         This returns the active BCP-47 code, such as 'en' or 'es'.
@@ -384,6 +732,88 @@ def __get_full_lang_code_deprecation_warning(lang=''):
         raise UnsupportedLanguageError(lang)
 
 
+def _route_language(text):
+    """ The language lang="auto" picks for text
+
+    The choice is between the loaded languages, or all the supported ones
+    when they are loaded on demand. The default language is picked when
+    the text doesn't tell, see lingua_franca.lang.parse_common.LanguageRouter
+
+    Args:
+        text(str): the text a localized function was called with
+
+    Returns:
+        str: a primary language code
+    """
+    default = get_default_lang()
+    if config.load_langs_on_demand:
+        langs = _SUPPORTED_LANGUAGES
+    else:
+        langs = tuple(get_active_langs())
+    if not isinstance(text, str) or not langs:
+        return default
+    router = __language_routers.get(langs)
+    if router is None:
+        from lingua_franca.lang.parse_common import LanguageRouter
+        router = __language_routers[langs] = LanguageRouter(langs)
+    return router.route(text, default)
+
+
+def _resolve_lang_code(lang_code, run_own_code_on=[type(None)]):
+    """ The language a localized function is run in
+
+    Args:
+        lang_code(str): the lang it was called with, "" for the default
+        run_own_code_on(list(type)): the errors the function handles itself,
+            an unsupported lang_code only raises an UnsupportedLanguageError
+            when it's one of them, it falls back on the default language
+            with a warning otherwise
+
+    Returns:
+        (str, str): the primary and full language codes
+    """
+    # Turns out, we aren't passing a lang code at all
+    lang_code = lang_code or get_default_lang()
+    full_lang_code = None
+    if not lang_code:
+        if config.load_langs_on_demand:
+            raise ModuleNotFoundError("No language module loaded "
+                                      "and none specified.")
+        else:
+            raise ModuleNotFoundError("No language module loaded.")
+
+    if lang_code not in _SUPPORTED_LANGUAGES:
+        try:
+            tmp = lang_code
+            use_tmp = True
+            lang_code = get_primary_lang_code(lang_code)
+        except ValueError:
+            error = \
+                UnsupportedLanguageError(
+                    "\nLanguage '{language}' is not yet supported by Lingua "
+                    "Franca. Supported language codes include the "
+                    "following:\n{supported}".format(
+                        language=lang_code,
+                        supported=_SUPPORTED_FULL_LOCALIZATIONS))
+            if UnsupportedLanguageError in run_own_code_on:
+                raise error
+            else:
+                warn(DeprecationWarning("The following warning will "
+                                        "become an exception in a future "
+                                        "version of Lingua Franca." +
+                                        str(error)))
+                lang_code = get_default_lang()
+                full_lang_code = get_full_lang_code()
+                use_tmp = False
+        if lang_code not in _SUPPORTED_LANGUAGES:
+            _raise_unsupported_language(lang_code)
+        if use_tmp:
+            full_lang_code = tmp
+    else:
+        full_lang_code = get_full_lang_code(lang_code)
+    return lang_code, full_lang_code
+
+
 def localized_function(run_own_code_on=[type(None)]):
     """
     Decorator which finds localized functions, and calls them, from signatures
@@ -456,9 +886,6 @@ def localized_function(run_own_code_on=[type(None)]):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
             unload_language_afterward = False
-            func_signature = signature(func)
-            func_params = list(func_signature.parameters)
-            lang_param_index = func_params.index('lang')
             full_lang_code = None
 
             # Check if we need to add timezone awareness to any datetime object
@@ -480,7 +907,8 @@ def localized_function(run_own_code_on=[type(None)]):
                     lang_code = lang_param
 
             # Check if we're passing a lang as a positional arg
-            elif lang_param_index < len(args):
+            elif lang_param_index is not None and \
+                    lang_param_index < len(args):
                 lang_param = args[lang_param_index]
                 if lang_param is None:
                     warn(NoneLangWarning)
@@ -490,45 +918,8 @@ def localized_function(run_own_code_on=[type(None)]):
                     lang_code = args[lang_param_index]
                 args = args[:lang_param_index] + args[lang_param_index+1:]
 
-            # Turns out, we aren't passing a lang code at all
-            lang_code = lang_code or get_default_lang()
-            if not lang_code:
-                if load_langs_on_demand:
-                    raise ModuleNotFoundError("No language module loaded "
-                                              "and none specified.")
-                else:
-                    raise ModuleNotFoundError("No language module loaded.")
-
-            if lang_code not in _SUPPORTED_LANGUAGES:
-                try:
-                    tmp = lang_code
-                    __use_tmp = True
-                    lang_code = get_primary_lang_code(lang_code)
-                except ValueError:
-                    __error = \
-                        UnsupportedLanguageError("\nLanguage '{language}' is not yet "
-                                                 "supported by Lingua Franca. "
-                                                 "Supported language codes "
-                                                 "include the following:\n{supported}"
-                                                 .format(
-                                                     language=lang_code,
-                                                     supported=_SUPPORTED_FULL_LOCALIZATIONS))
-                    if UnsupportedLanguageError in run_own_code_on:
-                        raise __error
-                    else:
-                        warn(DeprecationWarning("The following warning will "
-                                                "become an exception in a future "
-                                                "version of Lingua Franca." +
-                                                str(__error)))
-                        lang_code = get_default_lang()
-                        full_lang_code = get_full_lang_code()
-                        __use_tmp = False
-                if lang_code not in _SUPPORTED_LANGUAGES:
-                    _raise_unsupported_language(lang_code)
-                if __use_tmp:
-                    full_lang_code = tmp
-            else:
-                full_lang_code = get_full_lang_code(lang_code)
+            lang_code, full_lang_code = \
+                _resolve_lang_code(lang_code, run_own_code_on)
 
             # Here comes the ugly business.
             _module_name = func.__module__.split('.')[-1]
@@ -541,6 +932,8 @@ def localized_function(run_own_code_on=[type(None)]):
                                           _module_name + " not recognized")
             if lang_code not in _localized_functions[_module_name].keys():
                 if load_langs_on_demand:
+                    if __stats_enabled:
+                        _record_on_demand_load(stats_name, lang_code)
                     load_language(lang_code)
                     unload_language_afterward = True
                 else:
@@ -562,7 +955,9 @@ def localized_function(run_own_code_on=[type(None)]):
             # place.
             loc_signature = _localized_functions[_module_name][lang_code][func_name]
             if isinstance(loc_signature, type(NotImplementedError())):
-                raise loc_signature
+                # raise a copy, raising the cached instance itself would
+                # chain every traceback it was ever raised with
+                raise type(loc_signature)(*loc_signature.args)
 
             # Now we have the appropriate localized module. Let's get
             # the localized function.
@@ -594,19 +989,51 @@ def localized_function(run_own_code_on=[type(None)]):
                 unload_language(lang_code)
             return r_val
 
-        # Actual wrapper
-        @wraps(func)
-        def call_localized_function(*args, **kwargs):
+        def _dispatch(args, kwargs, handled=None):
             if run_own_code_on != [type(None)]:
                 try:
                     return _call_localized_function(func, *args, **kwargs)
                 except Exception as e:  # Intercept, check for run_own_code_on
                     if any((isinstance(e, error) for error in run_own_code_on)):
+                        if handled is not None:
+                            handled.append(e)
                         return func(*args, **kwargs)
                     else:
                         raise e
             else:  # don't intercept any exceptions
                 return _call_localized_function(func, *args, **kwargs)
+
+        def _route_auto_lang(args, kwargs):
+            # lang="auto" is replaced with the language picked for the
+            # text, first thing, so the stats see that language
+            if kwargs.get('lang') == "auto":
+                text = args[0] if args else kwargs.get(text_param)
+                kwargs['lang'] = _route_language(text)
+            elif lang_param_index is not None and \
+                    lang_param_index < len(args) and \
+                    args[lang_param_index] == "auto":
+                text = args[0] if lang_param_index else None
+                args = args[:lang_param_index] + \
+                    (_route_language(text),) + args[lang_param_index + 1:]
+            return args, kwargs
+
+        # the wrapped function's signature, once, not on every call
+        stats_name = func.__module__.split('.')[-1] + '.' + func.__name__
+        func_params = list(signature(func).parameters)
+        try:
+            lang_param_index = func_params.index('lang')
+        except ValueError:
+            lang_param_index = None
+        text_param = func_params[0] if func_params else None
+
+        # Actual wrapper
+        @wraps(func)
+        def call_localized_function(*args, **kwargs):
+            args, kwargs = _route_auto_lang(args, kwargs)
+            if __instrumented:
+                return _call_and_record(stats_name, lang_param_index,
+                                        _dispatch, args, kwargs)
+            return _dispatch(args, kwargs)
         return call_localized_function
     try:
         return localized_function_decorator
@@ -706,9 +1133,28 @@ def resolve_resource_file(res_name, data_dir=None):
 
     Args:
         res_name(str): a resource path/name
+    Installed packages keep their resources in a resource pack (see
+    lingua_franca.resource_pack) rather than as files, so only the
+    overrides above are found there, read_resource_file() reads both.
+
     Returns:
         str: path to resource or None if no resource found
     """
+    filename = _resolve_resource_override(res_name, data_dir)
+    if filename:
+        return filename
+
+    # Finally look for it in the source package
+    filename = os.path.join(os.path.dirname(__file__), 'res', res_name)
+    filename = os.path.abspath(os.path.normpath(filename))
+    if os.path.isfile(filename):
+        return filename
+
+    return None  # Resource cannot be resolved
+
+
+def _resolve_resource_override(res_name, data_dir=None):
+    """The resolve_resource_file() lookups which come before the package."""
     # First look for fully qualified file (e.g. a user setting)
     if os.path.isfile(res_name):
         return res_name
@@ -724,13 +1170,83 @@ def resolve_resource_file(res_name, data_dir=None):
     if os.path.isfile(filename):
         return filename
 
-    # Finally look for it in the source package
-    filename = os.path.join(os.path.dirname(__file__), 'res', res_name)
-    filename = os.path.abspath(os.path.normpath(filename))
-    if os.path.isfile(filename):
-        return filename
+    return None
 
-    return None  # Resource cannot be resolved
+
+def _get_resource_pack():
+    global __resource_pack
+    if __resource_pack is None:
+        from lingua_franca.resource_pack import ResourcePack, DEFAULT_PACK
+        try:
+            __resource_pack = ResourcePack(DEFAULT_PACK)
+        except (OSError, ValueError):
+            __resource_pack = False  # not built, read the files
+        # in a source checkout res/ may be edited after building the pack,
+        # installed builds are trusted, their files all come from the build
+        if __resource_pack and _is_source_checkout() and \
+                __resource_pack.is_stale():
+            warn("lingua_franca/res.pack is older than lingua_franca/res/, "
+                 "reading the resource files instead. Run python -m "
+                 "lingua_franca.resource_pack to update it.")
+            __resource_pack = False
+    return __resource_pack
+
+
+def _is_source_checkout():
+    """ Check if the package is run from its source tree """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.isfile(os.path.join(os.path.dirname(package_dir),
+                                       "setup.py"))
+
+
+def read_resource_file(res_name, data_dir=None):
+    """Read a resource as text.
+
+    The resource is looked up like resolve_resource_file() does, except
+    that the package's resources are read from its resource pack when one
+    was built (see lingua_franca.resource_pack).
+
+    Resources are cached once found, so later calls for the same resource
+    don't touch the file system. Overrides added or changed afterwards are
+    ignored until clear_resource_cache() is called.
+
+    Args:
+        res_name(str): a resource path/name
+        data_dir(str): replaces /opt/mycroft/res/ in the lookup
+    Returns:
+        str: the content of the resource or None if no resource found
+    """
+    key = (res_name, data_dir)
+    if key in __resource_cache:
+        return __resource_cache[key]
+
+    content = None
+    filename = _resolve_resource_override(res_name, data_dir)
+    pack = None if filename else _get_resource_pack()
+    packed_name = os.path.normpath(res_name).replace(os.sep, '/')
+    if pack and packed_name in pack:
+        content = pack.read(packed_name)
+    else:
+        filename = filename or resolve_resource_file(res_name, data_dir)
+        if filename:
+            with open(filename, 'rb') as f:
+                content = f.read()
+    if content is not None:
+        content = content.decode('utf8')
+        __resource_cache[key] = content
+    return content
+
+
+def clear_resource_cache():
+    """Forget the resources read so far and the resource pack.
+
+    The next read_resource_file() looks the resource up again, and opens
+    the resource pack again, e.g. after adding an override in ~/.mycroft
+    or rebuilding the pack.
+    """
+    global __resource_pack
+    __resource_cache.clear()
+    __resource_pack = None
 
 
 def lookup_variant(mappings, key="variant"):
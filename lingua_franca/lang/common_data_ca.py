@@ -195,3 +195,11 @@ _HUNDREDS_CA = {
     "cents": 100,
     "centes": 100
 }
+
+# fraction denominators, as recognised by is_fractional_ca
+_FRACTIONS_CA = {"mig": 2, "terç": 3, "quart": 4, "cinquè": 5, "sisè": 6,
+                 "sètè": 7, "vuitè": 8, "huitè": 8, "novè": 9, "desè": 10,
+                 "onzè": 11, "dotzè": 12, "tretzè": 13, "catorzè": 14,
+                 "quinzè": 15, "setzè": 16, "dissetè": 17, "divuitè": 18,
+                 "dihuitè": 18, "dinovè": 19, "vintè": 20, "trentè": 30,
+                 "centè": 100, "milè": 1000}
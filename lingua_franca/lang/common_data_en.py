@@ -295,3 +295,11 @@ _SPOKEN_EXTRA_NUM_EN = {
         }
 _STRING_SHORT_ORDINAL_EN = invert_dict(_SHORT_ORDINAL_EN)
 _STRING_LONG_ORDINAL_EN = invert_dict(_LONG_ORDINAL_EN)
+
+# fraction denominators, as recognised by is_fractional_en
+_SHORT_FRACTIONS_EN = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+_SHORT_FRACTIONS_EN.update({word: num for num, word in
+                            _SHORT_ORDINAL_EN.items() if num > 2})
+_LONG_FRACTIONS_EN = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+_LONG_FRACTIONS_EN.update({word: num for num, word in
+                           _LONG_ORDINAL_EN.items() if num > 2})
@@ -310,3 +310,13 @@ _LONG_ORDINAL_STRING_ES = {
     # TODO > 1e60
 }
 _LONG_ORDINAL_STRING_ES.update(_ORDINAL_STRING_BASE_ES)
+
+# fraction denominators, as recognised by is_fractional_es
+_FRACTIONS_ES = {"medio": 2, "media": 2, "tercio": 3, "cuarto": 4,
+                 "cuarta": 4, "quinto": 5, "quinta": 5, "sexto": 6,
+                 "sexta": 6, "séptimo": 7, "séptima": 7, "octavo": 8,
+                 "octava": 8, "noveno": 9, "novena": 9, "décimo": 10,
+                 "décima": 10, "onceavo": 11, "onceava": 11, "doceavo": 12,
+                 "doceava": 12, "vigésimo": 20, "vigésima": 20,
+                 "trigésimo": 30, "trigésima": 30, "centésimo": 100,
+                 "centésima": 100, "milésimo": 1000, "milésima": 1000}
@@ -256,3 +256,14 @@ _LONG_ORDINAL_STRING_EU = {
     # TODO > 1e60
 }
 _LONG_ORDINAL_STRING_EU.update(_ORDINAL_STRING_BASE_EU)
+
+# fraction denominators, as recognised by is_fractional_eu
+_FRACTIONS_EU = {"erdia": 2, "erdi": 2, "heren": 3, "laurden": 4,
+                 "laurdena": 4, "bosten": 5, "bostena": 5, "seiren": 6,
+                 "seirena": 6, "zazpiren": 7, "zapirena": 7, "zortziren": 8,
+                 "zortzirena": 8, "bederatziren": 9, "bederatzirena": 9,
+                 "hamarren": 10, "hamarrena": 10, "hamaikaren": 11,
+                 "hamaikarena": 11, "hamabiren": 12, "hamabirena": 12,
+                 "hogeiren": 20, "hogeirena": 20, "hogeita hamarren": 30,
+                 "hogeita hamarrena": 30, "ehunen": 100, "ehunena": 100,
+                 "milaren": 1000, "milarena": 1000}
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import re
 from collections import OrderedDict
 from .parse_common import invert_dict
 
@@ -109,7 +110,27 @@ _FORMAL_VARIANT = {
 }
 
 
+def _variant_rewriter(replacements):
+    """ A function replacing the keys of replacements in a text by their
+    values, in a single pass, the longest key wins where several match """
+    pattern = re.compile("|".join(
+        re.escape(key) for key in sorted(replacements, key=len, reverse=True)))
+    return lambda text: pattern.sub(
+        lambda match: replacements[match.group()], text)
+
+
+# formal number words to the conversational ones the parser reads, and back
+_TO_CONVERSATIONAL_FA = _variant_rewriter(_FORMAL_VARIANT)
+_TO_FORMAL_FA = _variant_rewriter(
+    {value: key for key, value in _FORMAL_VARIANT.items()})
+
+
 _FARSI_FRAC = ["", "ده", "صد"]
 _FARSI_FRAC_BIG = ["", "هزار", "میلیونی", "میلیاردی"]
 
-_FARSI_SEPERATOR = ' و '
\ No newline at end of file
+_FARSI_SEPERATOR = ' و '
+
+
+# fraction denominators, as recognised by is_fractional_fa
+_FRACTIONS_FA = {word: num for num, word in _FRACTION_STRING_FA.items()
+                 if num > 2}
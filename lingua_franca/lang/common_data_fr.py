@@ -96,3 +96,12 @@ _FRACTION_STRING_FR = {
     19: 'dix-neuvième',
     20: 'vingtième'
 }
+
+# fraction denominators, as recognised by is_fractional_fr
+_FRACTIONS_FR = {"entier": 1, "demi": 2, "tiers": 3, "quart": 4,
+                 "cinquième": 5, "sixième": 6, "septième": 7, "huitième": 8,
+                 "neuvième": 9, "dixième": 10, "onzième": 11, "douzième": 12,
+                 "treizième": 13, "quatorzième": 14, "quinzième": 15,
+                 "seizième": 16, "dix-septième": 17, "dix-huitième": 18,
+                 "dix-neuvième": 19, "vingtième": 20, "trentième": 30,
+                 "centième": 100, "millième": 1000}
@@ -319,3 +319,11 @@ _SHORT_SCALE_IT = collections.OrderedDict([
     (1e2703, "nongentillion"),
     (1e3003, "millinillion")
 ])
+
+# fraction denominators, as recognised by is_fractional_it
+_SHORT_FRACTIONS_IT = {"intero": 1, "mezza": 2, "mezzo": 2}
+_SHORT_FRACTIONS_IT.update({word: num for num, word in
+                            _SHORT_ORDINAL_STRING_IT.items() if num > 2})
+_LONG_FRACTIONS_IT = {"intero": 1, "mezza": 2, "mezzo": 2}
+_LONG_FRACTIONS_IT.update({word: num for num, word in
+                           _LONG_ORDINAL_STRING_IT.items() if num > 2})
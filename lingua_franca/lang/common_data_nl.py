@@ -321,3 +321,11 @@ _NUM_POWERS_OF_TEN = [
 
 # _EXTRA_SPACE_NL = " "
 _EXTRA_SPACE_NL = ""
+
+# fraction denominators, as recognised by is_fractional_nl
+_SHORT_FRACTIONS_NL = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
+_SHORT_FRACTIONS_NL.update({word: num for num, word in
+                            _SHORT_ORDINAL_STRING_NL.items() if num > 2})
+_LONG_FRACTIONS_NL = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
+_LONG_FRACTIONS_NL.update({word: num for num, word in
+                           _LONG_ORDINAL_STRING_NL.items() if num > 2})
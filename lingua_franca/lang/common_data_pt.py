@@ -133,3 +133,9 @@ _NUM_STRING_PT = {
     80: 'oitenta',
     90: 'noventa'
 }
+
+# fraction denominators, as recognised by is_fractional_pt
+_FRACTIONS_PT = {"meio": 2, "terço": 3, "quarto": 4, "quinto": 5, "sexto": 6,
+                 "setimo": 7, "sétimo": 7, "septimo": 7, "séptimo": 7,
+                 "oitavo": 8, "nono": 9, "décimo": 10, "vigésimo": 20,
+                 "trigésimo": 30, "centésimo": 100, "milésimo": 1000}
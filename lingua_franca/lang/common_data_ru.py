@@ -302,3 +302,8 @@ _TIME_UNITS_CONVERSION = {
     'недели': 'weeks',
     'недель': 'weeks'
 }
+
+# fraction denominators, as recognised by is_fractional_ru
+_FRACTIONS_RU = {"целая": 1}
+_FRACTIONS_RU.update({word: num for num, word in _FRACTION_STRING_RU.items()
+                      if num > 1})
@@ -70,3 +70,9 @@ _FRACTION_STRING_SV = {
 }
 
 _EXTRA_SPACE_SV = " "
+
+# fraction denominators, as recognised by is_fractional_sv
+_FRACTIONS_SV = {"hel": 1, "halv": 2, "tredjedel": 3, "kvart": 4,
+                 "fjärdedel": 4, "femtedel": 5, "sjättedel": 6,
+                 "sjundedel": 7, "åttondel": 8, "niondel": 9, "tiondel": 10,
+                 "elftedel": 11, "tolftedel": 12}
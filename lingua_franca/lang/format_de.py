@@ -288,40 +288,27 @@ def nice_time_de(dt, speech=True, use_24hour=False, use_ampm=False):
 
 
 def nice_response_de(text):
-    # check for months and call _nice_ordinal_de declension of ordinals
+    # declension of ordinals before months, depending on the
+    # articles/prepositions before them,
     # replace "^" with "hoch" (to the power of)
     words = text.split()
+    changed = False
 
     for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_DE:
-            text = _nice_ordinal_de(text)
-
+        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
         if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
             if wordNext.isnumeric():
                 words[idx] = "hoch"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_de(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[-1:] == ".":
-            if word[:-1].isdecimal():
-                if wordNext.lower() in _MONTHS_DE:
-                    word = pronounce_ordinal_de(int(word[:-1]))
-                    if wordPrev.lower() in ["am", "dem", "vom", "zum",
-                                            "(vom", "(am", "zum"]:
-                        word += "n"
-                    elif wordPrev.lower() not in ["der", "die", "das"]:
-                        word += "r"
-                    words[idx] = word
-            normalized_text = " ".join(words)
-    return normalized_text
+                changed = True
+        elif word[-1:] == "." and word[:-1].isdecimal() and \
+                wordNext.lower() in _MONTHS_DE:
+            wordPrev = words[idx - 1].lower() if idx > 0 else ""
+            word = pronounce_ordinal_de(int(word[:-1]))
+            if wordPrev in ["am", "dem", "vom", "zum",
+                            "(vom", "(am", "zum"]:
+                word += "n"
+            elif wordPrev not in ["der", "die", "das"]:
+                word += "r"
+            words[idx] = word
+            changed = True
+    return " ".join(words) if changed else text
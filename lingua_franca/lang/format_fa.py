@@ -18,7 +18,7 @@
 from lingua_franca.lang.format_common import convert_to_mixed_fraction
 from lingua_franca.lang.common_data_fa import \
     _FARSI_ONES, _FARSI_TENS, _FARSI_HUNDREDS, _FARSI_BIG, _FARSI_SEPERATOR, \
-    _FARSI_FRAC, _FARSI_FRAC_BIG, _FRACTION_STRING_FA, _FORMAL_VARIANT
+    _FARSI_FRAC, _FARSI_FRAC_BIG, _FRACTION_STRING_FA, _TO_FORMAL_FA
 import math
 from lingua_franca.internal import lookup_variant
 from enum import IntEnum
@@ -34,12 +34,13 @@ lookup_number = lookup_variant({
     "formal": NumberVariantFA.FORMAL,
 })
 
+
 def _apply_number_variant(text, variant):
     if variant == NumberVariantFA.FORMAL:
-        for key, value in _FORMAL_VARIANT.items():
-            text = text.replace(value, key)
+        text = _TO_FORMAL_FA(text)
     return text
 
+
 def _handle_number_variant(func):
     
     @wraps(func)
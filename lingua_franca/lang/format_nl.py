@@ -302,36 +302,22 @@ def nice_part_of_day_nl(dt, speech=True):
 
 
 def nice_response_nl(text):
-    # check for months and call _nice_ordinal_nl declension of ordinals
+    # numbers before months are spoken, as ordinals after "de",
     # replace "^" with "tot de macht" (to the power of)
     words = text.split()
+    changed = False
 
     for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_NL:
-            text = _nice_ordinal_nl(text)
-
+        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
         if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
             if wordNext.isnumeric():
                 words[idx] = "tot de macht"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_nl(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[:-1].isdecimal():
-            if wordNext.lower() in _MONTHS_NL:
-                if wordPrev == 'de':
-                    word = pronounce_ordinal_nl(int(word))
-                else:
-                    word = pronounce_number_nl(int(word))
-                words[idx] = word
-    normalized_text = " ".join(words)
-    return normalized_text
+                changed = True
+        elif word.isdecimal() and wordNext.lower() in _MONTHS_NL:
+            wordPrev = words[idx - 1] if idx > 0 else ""
+            if wordPrev == 'de':
+                words[idx] = pronounce_ordinal_nl(int(word))
+            else:
+                words[idx] = pronounce_number_nl(int(word))
+            changed = True
+    return " ".join(words) if changed else text
@@ -337,40 +337,27 @@ def nice_time_sv(dt, speech=True, use_24hour=False, use_ampm=False):
 
 
 def nice_response_sv(text):
-    # check for months and call _nice_ordinal_sv declension of ordinals
-    # replace "^" with "hoch" (to the power of)
+    # declension of ordinals before months, depending on the
+    # articles/prepositions before them,
+    # replace "^" with "upphöjt till" (to the power of)
     words = text.split()
+    changed = False
 
     for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_SV:
-            text = _nice_ordinal_sv(text)
-
+        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
         if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
             if wordNext.isnumeric():
                 words[idx] = "upphöjt till"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_sv(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[-1:] == ".":
-            if word[:-1].isdecimal():
-                if wordNext.lower() in _MONTHS_SV:
-                    word = pronounce_ordinal_sv(int(word[:-1]))
-                    if wordPrev.lower() in ["om", "den", "från", "till",
-                                            "(från", "(om", "till"]:
-                        word += "n"
-                    elif wordPrev.lower() not in ["den"]:
-                        word += "r"
-                    words[idx] = word
-            normalized_text = " ".join(words)
-    return normalized_text
+                changed = True
+        elif word[-1:] == "." and word[:-1].isdecimal() and \
+                wordNext.lower() in _MONTHS_SV:
+            wordPrev = words[idx - 1].lower() if idx > 0 else ""
+            word = pronounce_ordinal_sv(int(word[:-1]))
+            if wordPrev in ["om", "den", "från", "till",
+                            "(från", "(om", "till"]:
+                word += "n"
+            elif wordPrev not in ["den"]:
+                word += "r"
+            words[idx] = word
+            changed = True
+    return " ".join(words) if changed else text
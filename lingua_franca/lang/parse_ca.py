@@ -22,16 +22,22 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
+    Prefilter
 from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _FEMALE_DETERMINANTS_CA, _FEMALE_ENDINGS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
-    _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
-from lingua_franca.internal import resolve_resource_file
+    _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA, \
+    _FRACTIONS_CA
+from lingua_franca.internal import read_resource_file
 from lingua_franca.lang.parse_common import Normalizer
 import json
 import re
 
+# is_fractional_ca reads "cinquens" and "cinquena" as "cinquè"
+_PREFILTER_CA = Prefilter((__name__, "lingua_franca.lang.common_data_ca",
+                           "lingua_franca.lang.format_ca"), stem_length=1)
+
 
 def is_fractional_ca(input_str, short_scale=True):
     """
@@ -67,25 +73,9 @@ def is_fractional_ca(input_str, short_scale=True):
     elif input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "quarts -> quart"
 
-
-    aFrac = ["mig", "terç", "quart", "cinquè", "sisè", "sètè", "vuitè", "novè",
-             "desè", "onzè", "dotzè", "tretzè", "catorzè", "quinzè", "setzè",
-             "dissetè", "divuitè", "dinovè"]
-
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 2)
-    if input_str == "vintè":
-        return 1.0 / 20
-    if input_str == "trentè":
-        return 1.0 / 30
-    if input_str == "centè":
-        return 1.0 / 100
-    if input_str == "milè":
-        return 1.0 / 1000
-    if (input_str == "vuitè" or input_str == "huitè"):
-        return 1.0 / 8
-    if (input_str == "divuitè" or input_str == "dihuitè"):
-        return 1.0 / 18
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_CA:
+        return 1.0 / _FRACTIONS_CA[input_str]
 
     return False
 
@@ -100,6 +90,8 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
         (int) or (float): The value of extracted number
 
     """
+    if not _PREFILTER_CA.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -236,8 +228,8 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
 
 
 class CatalanNormalizer(Normalizer):
-    with open(resolve_resource_file("text/ca-es/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = json.loads(
+        read_resource_file("text/ca-es/normalize.json"))
 
     @staticmethod
     def tokenize(utterance):
@@ -249,7 +241,7 @@ class CatalanNormalizer(Normalizer):
         #utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \3",
         #                   utterance)
         tokens = utterance.split()
-        if tokens[-1] == '-':
+        if tokens and tokens[-1] == '-':
             tokens = tokens[:-1]
 
         return tokens
@@ -1053,37 +1045,36 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# words removed by _ca_pruning, and (symbol, replacement),
+# (accented, plain) characters it replaces
+_PRUNED_WORDS_CA = frozenset(["l", "la", "el", "els", "les", "de", "dels",
+                              "ell", "ells", "me", "és", "som", "al", "a",
+                              "dins", "per", "aquest", "aquesta", "això",
+                              "aixina", "en", "aquell", "aquella", "va",
+                              "vam", "vaig", "quin", "quina"])
+_PRUNED_SYMBOLS_CA = ((".", ""), (",", ""), (";", ""), (":", ""), ("!", ""),
+                      ("?", ""), ("¡", ""), ("¿", ""), ("'", " "), ("_", " "))
+_PRUNED_ACCENTS_CA = (("á", "a"), ("à", "a"), ("ã", "a"), ("â", "a"),
+                      ("ê", "e"), ("è", "e"), ("é", "e"),
+                      ("í", "i"), ("ï", "i"),
+                      ("ò", "o"), ("ó", "o"),
+                      ("ú", "u"), ("ü", "u"),
+                      ("ç", "c"),
+                      ("l·l", "ll"),
+                      ("ñ", "n"))
+
+
 def _ca_pruning(text, symbols=True, accents=False, agressive=True):
     # agressive ca word pruning
-    words = ["l", "la", "el", "els", "les", "de", "dels",
-             "ell", "ells", "me", "és", "som", "al", "a", "dins", "per",
-             "aquest", "aquesta", "això", "aixina", "en", "aquell", "aquella",
-             "va", "vam", "vaig", "quin", "quina"]
     if symbols:
-        symbols = [".", ",", ";", ":", "!", "?", "¡", "¿"]
-        for symbol in symbols:
-            text = text.replace(symbol, "")
-        text = text.replace("'", " ").replace("_", " ")
-    # accents=False
+        for symbol, replacement in _PRUNED_SYMBOLS_CA:
+            text = text.replace(symbol, replacement)
     if accents:
-        accents = {"a": ["á", "à", "ã", "â"],
-                   "e": ["ê", "è", "é"],
-                   "i": ["í", "ï"],
-                   "o": ["ò", "ó"],
-                   "u": ["ú", "ü"],
-                   "c": ["ç"],
-                   "ll": ["l·l"],
-                   "n": ["ñ"]}
-        for char in accents:
-            for acc in accents[char]:
-                text = text.replace(acc, char)
+        for accented, plain in _PRUNED_ACCENTS_CA:
+            text = text.replace(accented, plain)
     if agressive:
-        text_words = text.split(" ")
-        for idx, word in enumerate(text_words):
-            if word in words:
-                text_words[idx] = ""
-        text = " ".join(text_words)
-        text = ' '.join(text.split())
+        text = " ".join([word for word in text.split()
+                         if word not in _PRUNED_WORDS_CA])
     return text
 
 
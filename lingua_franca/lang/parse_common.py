@@ -14,8 +14,25 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from functools import wraps
+from importlib import import_module
+from importlib.util import find_spec
+from inspect import getsource
+from itertools import chain
+from sys import version_info
+from types import CodeType, FunctionType
+import ast
+import json
 import re
 
+from lingua_franca import config
+from lingua_franca.internal import get_full_lang_code, read_resource_file
+
+_WORD_REGEX = re.compile(r"[^\W\d_]+")
+# the words of messages are no triggers, see Prefilter
+_MESSAGE_FUNCTIONS = ("warn", "print")
+_MESSAGE_TABLES = ("_FUNCTION_NOT_IMPLEMENTED_WARNING",)
+
 
 class Normalizer:
     """
@@ -125,16 +142,18 @@ class Normalizer:
 
     def remove_articles(self, utterance):
         words = self.tokenize(utterance)
+        articles = set(self.articles)
         for idx, w in enumerate(words):
-            if w in self.articles:
+            if w in articles:
                 words[idx] = ""
         utterance = " ".join(words)
         return utterance
 
     def remove_stopwords(self, utterance):
         words = self.tokenize(utterance)
+        stopwords = set(self.stopwords)
         for idx, w in enumerate(words):
-            if w in self.stopwords:
+            if w in stopwords:
                 words[idx] = ""
         # if words[-1] == '-':
         #    words = words[:-1]
@@ -192,7 +211,8 @@ class Normalizer:
 # Token is intended to be used in the number processing functions in
 # this module. The parsing requires slicing and dividing of the original
 # text. To ensure things parse correctly, we need to know where text came
-# from in the original input, hence this nametuple.
+# from in the original input, hence this nametuple. Being a tuple it has
+# no instance dict, a Token takes no more memory than the pair it holds.
 Token = namedtuple('Token', 'word index')
 
 
@@ -205,10 +225,11 @@ class ReplaceableNumber:
     In other words, it is the text, and the number that can replace it in
     the string.
     """
+    __slots__ = ('value', 'tokens')
 
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'tokens', tokens)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
@@ -226,12 +247,11 @@ class ReplaceableNumber:
         return ' '.join([t.word for t in self.tokens])
 
     def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
+        raise Exception("Immutable!")
+
+    def __reduce__(self):
+        # copy and pickle would set the slots with __setattr__
+        return self.__class__, (self.value, self.tokens)
 
     def __str__(self):
         return "({v}, {t})".format(v=self.value, t=self.tokens)
@@ -255,6 +275,475 @@ def tokenize(text):
             for index, word in enumerate(Normalizer.tokenize(text))]
 
 
+def replace_number_tokens(tokens, number, placeholder):
+    """
+    Replace the tokens of a number found in a list of tokens.
+
+    The replacements keep the index of the token they replace, so the
+    tokens left still know where they came from. The list is modified in
+    place.
+
+    Args:
+        tokens [Token]: the tokens the number was found in
+        number ReplaceableNumber: the number found
+        placeholder str: the word to replace the number's words with
+
+    """
+    start = number.start_index
+    end = number.end_index
+    for idx, token in enumerate(tokens):
+        if start <= token.index <= end:
+            tokens[idx] = Token(placeholder, token.index)
+
+
+class CompoundSegmenter:
+    """
+    Split compound number words into the morphemes they are made of.
+
+    Languages like Italian or German write numbers as a single word,
+    "centottomiladuecentotredici" or "zweihundertdreiundvierzig". Listing
+    every such word would take an enormous dictionary, instead the word is
+    matched against a trie of the morphemes, and a word that can be split
+    in several ways is settled by dynamic programming over its positions,
+    preferring the longest morpheme that still lets the rest of the word
+    be split.
+
+    Args:
+        morphemes dict: morpheme -> whatever the language needs to know
+                        about it, the segments are made of these values
+
+    """
+    __slots__ = ('_trie',)
+
+    def __init__(self, morphemes):
+        self._trie = {}
+        for morpheme, info in morphemes.items():
+            node = self._trie
+            for char in morpheme:
+                node = node.setdefault(char, {})
+            # no character is None, it marks the end of a morpheme
+            node[None] = info
+
+    def _prefixes(self, word, start):
+        """ (end, info) of the morphemes at word[start:], longest first """
+        found = []
+        node = self._trie
+        for end in range(start, len(word)):
+            node = node.get(word[end])
+            if node is None:
+                break
+            if None in node:
+                found.append((end + 1, node[None]))
+        return reversed(found)
+
+    def segment(self, word):
+        """
+        Split a word into morphemes.
+
+        Args:
+            word str: the word to split
+
+        Returns:
+            [info] or None: the info of each morpheme, in order, or None if
+                            the word isn't made of morphemes only
+
+        """
+        if not word:
+            return None
+        # rest[i] is the segmentation of word[i:], None if there is none
+        rest = [None] * len(word) + [[]]
+        for start in range(len(word) - 1, -1, -1):
+            for end, info in self._prefixes(word, start):
+                if rest[end] is not None:
+                    rest[start] = [info] + rest[end]
+                    break
+        return rest[0]
+
+
+def packrat(rule):
+    """
+    Memoize a rule of a WordParser.
+
+    The rule takes the index of the word to parse at and its result is
+    kept for that index, the grammar is tried at every word of a sentence
+    and its rules overlap, without this the same sub-parses are retried
+    over and over.
+
+    Args:
+        rule: a WordParser method taking an index
+
+    Returns:
+        the memoized method
+
+    """
+    @wraps(rule)
+    def memoized(self, i):
+        key = (rule, i)
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = rule(self, i)
+            return result
+    return memoized
+
+
+class WordParser:
+    """
+    Base of the recursive descent parsers of numbers written in words.
+
+    A parser is made for one list of words. Its rules take the index to
+    parse at and return a tuple of the value found and the index of the
+    word after it, or None, those decorated with packrat are parsed once
+    per index whatever the rule asking for them.
+
+    Args:
+        words [str]: the words to parse, they must not change while the
+                     parser is in use
+
+    """
+    __slots__ = ('words', '_memo')
+
+    def __init__(self, words):
+        self.words = words
+        self._memo = {}
+
+    def constant(self, i, s):
+        """ (s, i + 1) if words[i] is s, None otherwise """
+        if i < len(self.words) and s == self.words[i]:
+            return s, i + 1
+        return None
+
+
+class Prefilter:
+    """
+    Quick check for text a parser can't find anything in.
+
+    The trigger words of a language are every word in the tables of the
+    given modules and in the string literals of the functions defined in
+    them, so whatever a parser compares the text against is one. The
+    messages of raise, warn() and print(), docstrings and keyword
+    argument names are left out. Text with no digit and none of these
+    words is rejected without parsing it.
+    Words shorter than prefix_length must be whole words of the text,
+    those shorter than min_length must start a word and longer ones may
+    be anywhere in a word, which lets compounds and suffixes through.
+
+    Parsers which rewrite the end of a word before looking it up, e.g.
+    "pětiny" to "pětina", give the number of letters they may rewrite as
+    stem_length, each word is then cut down to its stem, keeping at least
+    three letters. Those which replace letters of the whole text first
+    give the same replacements as translation.
+
+    context_words are left out of the triggers, they must be words the
+    parser only looks at around another trigger word, e.g. "the" or "at".
+
+    The words are only gathered on the first search, and searches always
+    succeed when lingua_franca.config.prefilter is False.
+
+    Args:
+        module_names [str]: the modules to take the words from
+        context_words [str]: words which are never enough on their own
+        min_length (int): length from which a word matches inside others
+        prefix_length (int): length from which a word matches a longer one
+        stem_length (int): letters at the end of a word the parser rewrites
+        translation (dict): str.translate() table the parser applies first
+
+    """
+    __slots__ = ('module_names', 'context_words', 'min_length',
+                 'prefix_length', 'stem_length', 'translation', '_pattern')
+
+    def __init__(self, module_names, context_words=(), min_length=4,
+                 prefix_length=3, stem_length=0, translation=None):
+        self.module_names = module_names
+        self.context_words = frozenset(context_words)
+        self.min_length = min_length
+        self.prefix_length = prefix_length
+        self.stem_length = stem_length
+        self.translation = translation
+        self._pattern = None
+
+    def words(self):
+        """ The trigger words, lowercase """
+        # float() reads these, so is_numeric does too
+        words = {"inf", "infinity", "nan"}
+        words.update(_module_words(self.module_names))
+        return words - self.context_words
+
+    def _compile(self):
+        words = set()
+        for word in self.words():
+            if self.translation:
+                word = word.translate(self.translation)
+            words.add(word[:max(len(word) - self.stem_length, 3)])
+        long_words = [w for w in words if len(w) >= self.min_length]
+        prefixes = [w for w in words
+                    if self.prefix_length <= len(w) < self.min_length]
+        short_words = [w for w in words if len(w) < self.prefix_length]
+        alternatives = [r"\d"]
+        if long_words:
+            alternatives.append(_trie_pattern(long_words, prefix=True))
+        if prefixes:
+            alternatives.append(r"\b" + _trie_pattern(prefixes, prefix=True))
+        if short_words:
+            alternatives.append(r"\b(?:" + _trie_pattern(short_words) +
+                                r")\b")
+        return re.compile("|".join(alternatives))
+
+    def search(self, text):
+        """
+        Check if the text may contain something to parse.
+
+        Args:
+            text (str): the text a parser was given
+
+        Returns:
+            (bool): False if the parser can't find anything in the text
+
+        """
+        if not config.prefilter:
+            return True
+        if self._pattern is None:
+            self._pattern = self._compile()
+        text = text.lower()
+        if self.translation:
+            text = text.translate(self.translation)
+        return self._pattern.search(text) is not None
+
+
+class LanguageRouter:
+    """
+    Guess the language of a text from the words it uses.
+
+    The lexicon of a language is the words of its parse, format and
+    common_data modules, gathered like Prefilter does, and of its
+    normalize.json. Each word maps to the bitset of the languages whose
+    lexicon has it, and every word of the text scores 1 / (languages in
+    its bitset) for each language in it, so words many languages share
+    count for little. Letters the text uses are scored the same way,
+    once each, which tells the languages with their own letters apart
+    when the words don't.
+
+    The lexicons are only gathered on the first route.
+
+    Args:
+        langs [str]: the primary language codes to choose from
+
+    """
+    __slots__ = ('langs', '_words', '_letters', '_spreads')
+
+    def __init__(self, langs):
+        self.langs = tuple(langs)
+        self._words = None
+
+    def _compile(self):
+        self._words = {}
+        self._letters = {}
+        for index, lang in enumerate(self.langs):
+            module_names = []
+            for prefix in ("parse", "format", "common_data"):
+                name = "lingua_franca.lang.{}_{}".format(prefix, lang)
+                if find_spec(name):
+                    module_names.append(name)
+            words = _module_words(module_names)
+            normalize_config = read_resource_file(
+                "text/{}/normalize.json".format(get_full_lang_code(lang)))
+            if normalize_config:
+                strings = set()
+                _collect_strings(json.loads(normalize_config), strings, set())
+                for string in strings:
+                    words.update(_WORD_REGEX.findall(string.lower()))
+            for word in words:
+                self._words[word] = self._words.get(word, 0) | 1 << index
+                for letter in word:
+                    self._letters[letter] = \
+                        self._letters.get(letter, 0) | 1 << index
+        # the languages of each bitset, and what each of them scores
+        self._spreads = {}
+        for bits in set(self._words.values()) | set(self._letters.values()):
+            indexes = tuple(i for i in range(len(self.langs)) if bits >> i & 1)
+            self._spreads[bits] = indexes, 1 / len(indexes)
+
+    def scores(self, text):
+        """
+        How much the text looks like each language.
+
+        Args:
+            text (str): the text to score
+
+        Returns:
+            [float]: the score of each of langs, in order
+        """
+        if self._words is None:
+            self._compile()
+        text = text.lower()
+        scores = [0.0] * len(self.langs)
+        for bits in chain(map(self._words.get, _WORD_REGEX.findall(text)),
+                          map(self._letters.get, set(text))):
+            if bits:
+                indexes, score = self._spreads[bits]
+                for index in indexes:
+                    scores[index] += score
+        return scores
+
+    def route(self, text, default=None):
+        """
+        The language of the text.
+
+        Args:
+            text (str): the text to route
+            default (str): the language picked when no word or letter of
+                           the text tells, or between languages that score
+                           the same. The first of langs if omitted or not
+                           one of them.
+
+        Returns:
+            (str): one of langs
+        """
+        scores = self.scores(text)
+        best = self.langs.index(default) if default in self.langs else 0
+        for index, score in enumerate(scores):
+            if score > scores[best]:
+                best = index
+        return self.langs[best]
+
+
+def _module_words(module_names):
+    """ The lowercase words of the tables and literals of the modules """
+    strings = set()
+    for name in module_names:
+        module = import_module(name)
+        # without the source, the literals are read from the bytecode,
+        # messages included
+        read_code = not _source_strings(module, strings)
+        seen = set()
+        for key, value in vars(module).items():
+            if key.startswith("__") or key in _MESSAGE_TABLES:
+                continue
+            # functions are only read where they are defined
+            if not isinstance(value, (FunctionType, type)) or \
+                    value.__module__ == name:
+                _collect_strings(value, strings, seen, read_code)
+    words = set()
+    for string in strings:
+        if "\n" not in string:
+            words.update(_WORD_REGEX.findall(string.lower()))
+    return words
+
+
+def _collect_strings(value, strings, seen, read_code=True):
+    """ Add the strings of a table or a function's literals to strings """
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    if isinstance(value, str):
+        strings.add(value)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _collect_strings(key, strings, seen, read_code)
+            _collect_strings(item, strings, seen, read_code)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _collect_strings(item, strings, seen, read_code)
+    elif isinstance(value, FunctionType):
+        if read_code:
+            _collect_strings(value.__code__, strings, seen)
+    elif isinstance(value, type):
+        for item in vars(value).values():
+            _collect_strings(item, strings, seen, read_code)
+    elif isinstance(value, CodeType):
+        consts = value.co_consts
+        # the docstring of a function is its first constant
+        if consts and isinstance(consts[0], str) and \
+                not value.co_name.startswith("<"):
+            consts = consts[1:]
+        for item in consts:
+            _collect_strings(item, strings, seen)
+
+
+def _source_strings(module, strings):
+    """
+    Add the string literals of the functions and classes defined in a
+    module to strings.
+
+    Docstrings and the arguments of raise, warn() and print() are left
+    out, they are messages, not words the code compares text against.
+
+    Returns:
+        (bool): False if the source couldn't be read
+    """
+    try:
+        tree = ast.parse(getsource(module))
+    except (OSError, TypeError):
+        return False
+    definitions = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+    nodes = [node for node in tree.body if isinstance(node, definitions)]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.Raise) or \
+                isinstance(node, ast.Call) and \
+                getattr(node.func, "id", getattr(node.func, "attr", None)) \
+                in _MESSAGE_FUNCTIONS:
+            continue
+        value = _string_literal(node)
+        if value is not None:
+            strings.add(value)
+            continue
+        children = list(ast.iter_child_nodes(node))
+        if isinstance(node, definitions) and \
+                isinstance(node.body[0], ast.Expr) and \
+                _string_literal(node.body[0].value) is not None:
+            children.remove(node.body[0])
+        nodes.extend(children)
+    return True
+
+
+def _string_literal(node):
+    """ The value of a string literal node, None for other nodes """
+    if version_info < (3, 8):
+        return node.s if isinstance(node, ast.Str) else None
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _trie_pattern(words, prefix=False):
+    """
+    A regular expression matching any of the words.
+
+    The words are merged in a trie, so matching doesn't try them one by
+    one. With prefix True the pattern stops at the end of any word, it
+    then matches the shortest word but tells if one matches just as well.
+
+    Args:
+        words [str]: the words to match, not empty
+        prefix (bool): match the shortest word only
+
+    Returns:
+        (str): the pattern
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def pattern(node):
+        if prefix and "" in node:
+            return ""
+        branches = [re.escape(char) + pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return pattern(trie)
+
+
 def partition_list(items, split_on):
     """
     Partition a list of items.
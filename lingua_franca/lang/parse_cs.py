@@ -14,11 +14,13 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from itertools import islice
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, \
+    Normalizer, replace_number_tokens, Prefilter
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
@@ -26,9 +28,13 @@ from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
 
 import re
 import json
-from lingua_franca import resolve_resource_file
+from lingua_franca import read_resource_file
 from lingua_franca.time import now_local
 
+# is_fractional_cs reads "třetiny" as "třetina"
+_PREFILTER_CS = Prefilter((__name__, "lingua_franca.lang.common_data_cs",
+                           "lingua_franca.lang.format_cs"), stem_length=1)
+
 
 def generate_plurals_cs(originals):
     """Return a new set or dict containing the plural form of the original values.
@@ -145,14 +151,11 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
         if not to_replace:
             break
 
+        if not results:
+            # replace on a copy, the caller's tokens are left as they are
+            tokens = list(tokens)
         results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        replace_number_tokens(tokens, to_replace, placeholder)
     results.sort(key=lambda n: n.start_index)
     return results
 
@@ -531,7 +534,7 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
+                for other_token in islice(tokens, idx + 1, None):
                     if other_token.word in multiplies:
                         if string_num_scale[other_token.word] >= current_val:
                             time_to_sum = False
@@ -550,11 +553,15 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     return val, number_words
 
 
+_NUMBER_DATA_CS = {}
+
+
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are generated once and shared, they must not be modified.
 
     Args:
         short_scale boolean:
@@ -564,6 +571,10 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
+    short_scale = bool(short_scale)
+    if short_scale in _NUMBER_DATA_CS:
+        return _NUMBER_DATA_CS[short_scale]
+
     multiplies = _MULTIPLIES_SHORT_SCALE_CS if short_scale \
         else _MULTIPLIES_LONG_SCALE_CS
 
@@ -573,7 +584,9 @@ def _initialize_number_data(short_scale):
     string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
     string_num_scale_cs = invert_dict(string_num_scale_cs)
     string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
-    return multiplies, string_num_ordinal_cs, string_num_scale_cs
+    _NUMBER_DATA_CS[short_scale] = \
+        multiplies, string_num_ordinal_cs, string_num_scale_cs
+    return _NUMBER_DATA_CS[short_scale]
 
 
 def extract_number_cs(text, short_scale=True, ordinals=False):
@@ -592,6 +605,8 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                    was found
 
     """
+    if not _PREFILTER_CS.search(text):
+        return False
     return _extract_number_with_text_cs(tokenize(text.lower()),
                                         short_scale, ordinals).value
 
@@ -625,6 +640,8 @@ def extract_duration_cs(text):
     """
     if not text:
         return None
+    if not _PREFILTER_CS.search(text):
+        return (None, " ".join(text.lower().split()))
 
     # Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
     # For day: den, dny, dnů - short patern not applicable, list all
@@ -760,6 +777,8 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_CS.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -1572,14 +1591,16 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_CS.search(text):
+        return []
     results = _extract_numbers_with_text_cs(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
 
 
 class CzechNormalizer(Normalizer):
-    with open(resolve_resource_file("text/cs-cz/normalize.json"), encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = json.loads(
+        read_resource_file("text/cs-cz/normalize.json"))
 
 
 def normalize_cs(text, remove_articles=True):
@@ -1587,6 +1608,55 @@ def normalize_cs(text, remove_articles=True):
     return CzechNormalizer().normalize(text, remove_articles)
 
 
+def _inflection_tables_cs():
+    """
+    Build the tables of _text_cs_inflection_normalize.
+
+    Returns:
+        {arg: {inflected word: normalized word}}
+
+    """
+    # _extract_whole_number_with_text_cs
+    numbers = {"jeden": "jedna", "jedno": "jedna", "jedny": "jedna",
+               "dvě": "dva"}
+
+    # extract_datetime_cs
+    datetimes = {}
+    # months ending in "en", inflected as "...nu" and "...na"
+    for name in _MONTHS_CZECH:
+        if name.endswith("en"):
+            datetimes[name[:-2] + "nu"] = name
+            datetimes[name[:-2] + "na"] = name
+    datetimes.update({
+        "hodina": "hodin", "hodiny": "hodin", "hodinu": "hodin",
+        "minuta": "minut", "minuty": "minut", "minutu": "minut",
+        "sekunda": "sekund", "sekundy": "sekund", "sekundu": "sekund",
+        "dní": "den", "dnů": "den", "dny": "den",
+        "týdny": "týden", "týdnů": "týden",
+        "měsíců": "měsíc", "měsíce": "měsíc", "měsíci": "měsíc",
+        "roky": "rok", "roků": "rok", "let": "rok",
+        "včerejšku": "včera",
+        "zítřku": "zítra", "zítřejší": "zítra",
+        "ranní": "ráno",
+        "dopolední": "dopoledne",
+        "polední": "poledne",
+        "odpolední": "odpoledne",
+        "večerní": "večer",
+        "noční": "noc",
+        "víkendech": "víkend", "víkendu": "víkend",
+        "všedních": "všední", "všedním": "všední",
+        # Months
+        "únoru": "únor",
+        "červenci": "červenec", "července": "červenec",
+        "listopadu": "listopad",
+        "prosinci": "prosinec"})
+
+    return {1: numbers, 2: datetimes}
+
+
+_INFLECTIONS_CS = _inflection_tables_cs()
+
+
 def _text_cs_inflection_normalize(word, arg):
     """
     Czech Inflection normalizer.
@@ -1602,104 +1672,5 @@ def _text_cs_inflection_normalize(word, arg):
         word [Word]
 
     """
-    if arg == 1:  # _extract_whole_number_with_text_cs
-        # Number one (jedna)
-        if len(word) == 5 and word.startswith("jed"):
-            suffix = 'en', 'no', 'ny'
-            if word.endswith(suffix, 3):
-                word = "jedna"
-
-        # Number two (dva)
-        elif word == "dvě":
-            word = "dva"
-
-    elif arg == 2:  # extract_datetime_cs  TODO: This is ugly
-        if word == "hodina":
-            word = "hodin"
-        if word == "hodiny":
-            word = "hodin"
-        if word == "hodinu":
-            word = "hodin"
-        if word == "minuta":
-            word = "minut"
-        if word == "minuty":
-            word = "minut"
-        if word == "minutu":
-            word = "minut"
-        if word == "minutu":
-            word = "minut"
-        if word == "sekunda":
-            word = "sekund"
-        if word == "sekundy":
-            word = "sekund"
-        if word == "sekundu":
-            word = "sekund"
-        if word == "dní":
-            word = "den"
-        if word == "dnů":
-            word = "den"
-        if word == "dny":
-            word = "den"
-        if word == "týdny":
-            word = "týden"
-        if word == "týdnů":
-            word = "týden"
-        if word == "měsíců":
-            word = "měsíc"
-        if word == "měsíce":
-            word = "měsíc"
-        if word == "měsíci":
-            word = "měsíc"
-        if word == "roky":
-            word = "rok"
-        if word == "roků":
-            word = "rok"
-        if word == "let":
-            word = "rok"
-        if word == "včerejšku":
-            word = "včera"
-        if word == "zítřku":
-            word = "zítra"
-        if word == "zítřejší":
-            word = "zítra"
-        if word == "ranní":
-            word = "ráno"
-        if word == "dopolední":
-            word = "dopoledne"
-        if word == "polední":
-            word = "poledne"
-        if word == "odpolední":
-            word = "odpoledne"
-        if word == "večerní":
-            word = "večer"
-        if word == "noční":
-            word = "noc"
-        if word == "víkendech":
-            word = "víkend"
-        if word == "víkendu":
-            word = "víkend"
-        if word == "všedních":
-            word = "všední"
-        if word == "všedním":
-            word = "všední"
-
-        # Months
-        if word == "únoru":
-            word = "únor"
-        elif word == "červenci":
-            word = "červenec"
-        elif word == "července":
-            word = "červenec"
-        elif word == "listopadu":
-            word = "listopad"
-        elif word == "prosinci":
-            word = "prosinec"
-
-        elif word.endswith("nu") or word.endswith("na"):
-            tmp = word[:-2]
-            tmp += ("en")
-            for name in _MONTHS_CZECH:
-                if name == tmp:
-                    word = name
-
-    return word
+    table = _INFLECTIONS_CS.get(arg)
+    return table.get(word, word) if table else word
@@ -16,11 +16,16 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, Prefilter
 from lingua_franca.lang.common_data_da import _DA_NUMBERS
 from lingua_franca.lang.format_da import pronounce_number_da
 from lingua_franca.time import now_local
 
+# is_ordinal_da and is_fractional_da read "ente" and "tidel" as "en" and "ti"
+_PREFILTER_DA = Prefilter((__name__, "lingua_franca.lang.common_data_da",
+                           "lingua_franca.lang.format_da"),
+                          prefix_length=2)
+
 
 def extract_number_da(text, short_scale=True, ordinals=False):
     """
@@ -36,6 +41,8 @@ def extract_number_da(text, short_scale=True, ordinals=False):
     'ein Pferd' means 'one horse' and 'a horse'
 
     """
+    if not _PREFILTER_DA.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -144,6 +151,8 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_DA.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -854,9 +863,9 @@ def normalize_da(text, remove_articles=True):
     """ German string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
-        if remove_articles and word in ["den", "det"]:
+        if remove_articles and word in ("den", "det"):
             continue
 
         # Convert numbers into digits, e.g. "two" -> "2"
@@ -864,9 +873,9 @@ def normalize_da(text, remove_articles=True):
         if word in _DA_NUMBERS:
             word = str(_DA_NUMBERS[word])
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_da(text, short_scale=True, ordinals=False):
@@ -883,6 +892,8 @@ def extract_numbers_da(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_DA.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_da, extract_number_da,
                                    short_scale=short_scale, ordinals=ordinals)
 
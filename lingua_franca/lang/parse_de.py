@@ -15,13 +15,17 @@
 #
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
-from lingua_franca.lang.common_data_de import _DE_NUMBERS
+    extract_numbers_generic, Normalizer, CompoundSegmenter, Prefilter
+from lingua_franca.lang.common_data_de import _DE_NUMBERS, _NUM_STRING_DE
 from lingua_franca.lang.format_de import pronounce_number_de
 from lingua_franca.time import now_local
 
+_PREFILTER_DE = Prefilter((__name__, "lingua_franca.lang.common_data_de",
+                           "lingua_franca.lang.format_de"))
+
 
 de_numbers = {
     'null': 0,
@@ -86,6 +90,70 @@ de_numbers = {
 # reasons.
 
 
+def _number_morphemes_de():
+    """ morpheme -> (kind, value) of the parts of a german number word
+
+    The kinds are U for 1-9, T for 10-19, Z for the tens, A for "und",
+    H for "hundert" and K for "tausend".
+    """
+    morphemes = {}
+    for value, word in _NUM_STRING_DE.items():
+        if 0 < value < 10:
+            morphemes[word] = ('U', value)
+        elif 10 <= value < 20:
+            morphemes[word] = ('T', value)
+        elif 20 <= value < 100:
+            morphemes[word] = ('Z', value)
+    morphemes['eins'] = ('U', 1)  # hunderteins
+    morphemes['dreissig'] = ('Z', 30)
+    morphemes['und'] = ('A', 0)
+    morphemes['hundert'] = ('H', 100)
+    morphemes['tausend'] = ('K', 1000)
+    return morphemes
+
+
+_NUMBER_SEGMENTER_DE = CompoundSegmenter(_number_morphemes_de())
+# the order numbers below a million are written in, over the kinds above:
+# [[ein]hundert][einundzwanzig] for each group of three digits, with
+# "tausend" after the first one
+_BELOW_THOUSAND_DE = r"(?:U?H)?(?:UAZ|[UTZ])?"
+_COMPOUND_NUMBER_DE = re.compile(
+    r"(?:{0}K)?{0}".format(_BELOW_THOUSAND_DE))
+
+
+@lru_cache(maxsize=1024)
+def _number_word_de(word):
+    """
+    The value of a german number word, like "dreiundzwanzig" or
+    "zweihundertdreiundvierzig".
+
+    Words in _DE_NUMBERS are looked up, other compounds below one million
+    are split into their morphemes.
+
+    Args:
+        word (str): the lowercase word
+    Returns:
+        (int) or None: the value, None if the word isn't a number
+    """
+    if word in _DE_NUMBERS:
+        return _DE_NUMBERS[word]
+    morphemes = _NUMBER_SEGMENTER_DE.segment(word)
+    if not morphemes or not _COMPOUND_NUMBER_DE.fullmatch(
+            "".join([kind for kind, _ in morphemes])):
+        return None
+
+    total = current = 0
+    for kind, value in morphemes:
+        if kind == 'H':
+            current = (current or 1) * value
+        elif kind == 'K':
+            total = (current or 1) * value
+            current = 0
+        else:
+            current += value
+    return total + current
+
+
 def extract_duration_de(text):
     """Convert a German phrase into a number of seconds.
 
@@ -110,6 +178,8 @@ def extract_duration_de(text):
     """
     if not text:
         return None
+    if not _PREFILTER_DE.search(text):
+        return (None, text.lower().strip())
 
     text = text.lower()
     # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
@@ -159,6 +229,8 @@ def extract_number_de(text, short_scale=True, ordinals=False):
     'ein Pferd' means 'one horse' and 'a horse'
 
     """
+    if not _PREFILTER_DE.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -180,8 +252,9 @@ def extract_number_de(text, short_scale=True, ordinals=False):
         elif is_ordinal_de(word):
             val = is_ordinal_de(word)
         else:
-            if word in _DE_NUMBERS:
-                val = _DE_NUMBERS[word]
+            number = _number_word_de(word)
+            if number is not None:
+                val = number
                 if count < (len(aWords) - 1):
                     wordNext = aWords[count + 1]
                 else:
@@ -230,7 +303,8 @@ def extract_number_de(text, short_scale=True, ordinals=False):
     return val or False
 
 
-def extract_datetime_de(text, anchorDate=None, default_time=None):
+def extract_datetime_de(text, anchorDate=None, default_time=None,
+                        context=None):
     def clean_string(s):
         """
             cleans the input string of unneeded punctuation
@@ -266,6 +340,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_DE.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -274,8 +350,16 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     monthOffset = 0
     yearOffset = 0
     dateNow = anchorDate
-    today = dateNow.strftime("%w")
-    currentYear = dateNow.strftime("%Y")
+    if context is not None and context.anchorDate is anchorDate:
+        today = context.weekday
+        currentYear = context.year
+        weekdayOffsets = context.weekday_offsets
+        monthDates = context.month_dates
+    else:
+        today = dateNow.strftime("%w")
+        currentYear = dateNow.strftime("%Y")
+        weekdayOffsets = None
+        monthDates = {}
     fromFlag = False
     datestr = ""
     hasYear = False
@@ -395,10 +479,13 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 # last Tuesday, etc.
         elif word in days and not fromFlag:
             d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            if weekdayOffsets is not None:
+                dayOffset = weekdayOffsets[d]
+            else:
+                dayOffset = (d + 1) - int(today)
+                if dayOffset < 0:
+                    dayOffset += 7
             used = 1
-            if dayOffset < 0:
-                dayOffset += 7
             if wordNext == "morgen":  # morgen means morning if preceded by
                 # the day of the week
                 words[idx + 1] = "früh"
@@ -458,10 +545,13 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 dayOffset += 1
             elif wordNext in days:
                 d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                if weekdayOffsets is not None:
+                    tmpOffset = weekdayOffsets[d]
+                else:
+                    tmpOffset = (d + 1) - int(today)
+                    if tmpOffset < 0:
+                        tmpOffset += 7
                 used = 2
-                if tmpOffset < 0:
-                    tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
                 d = days.index(wordNextNext)
@@ -869,7 +959,13 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
 
     if yearOffset != 0:
         extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
+    if monthOffset in monthDates and datestr == "" and yearOffset == 0:
+        # still on the anchor's day, the month dates are the same sums
+        monthDate = monthDates[monthOffset]
+        extractedDate = extractedDate.replace(year=monthDate.year,
+                                              month=monthDate.month,
+                                              day=monthDate.day)
+    elif monthOffset != 0:
         extractedDate = extractedDate + relativedelta(months=monthOffset)
     if dayOffset != 0:
         extractedDate = extractedDate + relativedelta(days=dayOffset)
@@ -923,8 +1019,9 @@ def is_fractional_de(input_str, short_scale=True):
             input_str = input_str[:len(input_str) - 4]  # e.g. "hundertstel"
         else:
             input_str = input_str[:len(input_str) - 3]  # e.g. "fünftel"
-        if input_str.lower() in _DE_NUMBERS:
-            return 1.0 / (_DE_NUMBERS[input_str.lower()])
+        number = _number_word_de(input_str.lower())
+        if number is not None:
+            return 1.0 / number
 
     return False
 
@@ -941,7 +1038,7 @@ def is_ordinal_de(input_str):
 
     ordinals for 1, 3, 7 and 8 are irregular
 
-    only works for ordinals corresponding to the numbers in _DE_NUMBERS
+    only works for ordinals of numbers below one million
 
     """
 
@@ -958,51 +1055,57 @@ def is_ordinal_de(input_str):
 
     if lowerstr[-3:] == "ste":  # from 20 suffix is -ste*
         lowerstr = lowerstr[:-3]
-        if lowerstr in _DE_NUMBERS:
-            return _DE_NUMBERS[lowerstr]
+        number = _number_word_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-4:] in ["ster", "stes", "sten", "stem"]:
         lowerstr = lowerstr[:-4]
-        if lowerstr in _DE_NUMBERS:
-            return _DE_NUMBERS[lowerstr]
+        number = _number_word_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-2:] == "te":  # below 20 suffix is -te*
         lowerstr = lowerstr[:-2]
-        if lowerstr in _DE_NUMBERS:
-            return _DE_NUMBERS[lowerstr]
+        number = _number_word_de(lowerstr)
+        if number is not None:
+            return number
 
     if lowerstr[-3:] in ["ter", "tes", "ten", "tem"]:
         lowerstr = lowerstr[:-3]
-        if lowerstr in _DE_NUMBERS:
-            return _DE_NUMBERS[lowerstr]
+        number = _number_word_de(lowerstr)
+        if number is not None:
+            return number
 
     return False
 
 
+_ARTICLES_DE = {"der", "die", "das", "des", "den", "dem"}
+
+_CONTRACTIONS_DE = {"net": "nicht", "nett": "nicht"}
+
+
 def normalize_de(text, remove_articles=True):
     """ German string normalization """
     # TODO return GermanNormalizer().normalize(text, remove_articles)
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
-        if remove_articles and word in ["der", "die", "das", "des", "den",
-                                        "dem"]:
+        if remove_articles and word in _ARTICLES_DE:
             continue
 
         # Expand common contractions, e.g. "isn't" -> "is not"
-        contraction = ["net", "nett"]
-        if word in contraction:
-            expansion = ["nicht", "nicht"]
-            word = expansion[contraction.index(word)]
+        word = _CONTRACTIONS_DE.get(word, word)
 
         # Convert numbers into digits, e.g. "two" -> "2"
 
-        if word in _DE_NUMBERS:
-            word = str(_DE_NUMBERS[word])
+        number = _number_word_de(word)
+        if number is not None:
+            word = str(number)
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_de(text, short_scale=True, ordinals=False):
@@ -1019,6 +1122,8 @@ def extract_numbers_de(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_DE.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_de, extract_number_de,
                                    short_scale=short_scale, ordinals=ordinals)
 
@@ -14,22 +14,48 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta, time
+from itertools import islice
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, replace_number_tokens, Prefilter
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
-    _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, \
-    _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
-    _MULTIPLIES_SHORT_SCALE_EN, _FRACTION_MARKER_EN, _DECIMAL_MARKER_EN, \
+    _LONG_SCALE_EN, _SHORT_SCALE_EN, _NEGATIVES_EN, _SUMS_EN, \
+    _MULTIPLIES_LONG_SCALE_EN, _MULTIPLIES_SHORT_SCALE_EN, \
+    _FRACTION_MARKER_EN, _DECIMAL_MARKER_EN, \
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
-    _FRACTION_STRING_EN, _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
+    _FRACTION_STRING_EN, _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN, \
+    _SHORT_FRACTIONS_EN, _LONG_FRACTIONS_EN
 
 import re
 import json
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.internal import read_resource_file
+
+_PREFILTER_EN = Prefilter(
+    (__name__, "lingua_franca.lang.common_data_en",
+     "lingua_franca.lang.format_en"),
+    # function words and the words of contractions, settings, resource
+    # paths and module names
+    context_words=(
+        "a", "after", "ain", "aint", "all", "an", "and", "are", "aren",
+        "around", "at", "b", "be", "before", "by", "can", "could", "couldn",
+        "d", "did", "didn", "do", "does", "doesn", "don", "e", "early", "en",
+        "for", "from", "going", "gonna", "got", "gotta", "h", "had", "hadn",
+        "has", "hasn", "have", "haven", "he", "how", "i", "in", "is", "isn",
+        "it", "late", "ll", "m", "might", "mightn", "must", "mustn",
+        "need", "needn", "not", "of", "on", "ought", "oughtn", "p", "past",
+        "re", "s", "shall", "shan", "she", "should", "shouldn", "somebody",
+        "someone", "t", "that", "the", "there", "they", "times", "to", "us",
+        "ve", "w", "was", "wasn", "we", "were", "weren", "what", "whats",
+        "when", "where", "who", "why", "will", "within", "won", "would",
+        "wouldn", "y", "ya", "you",
+        "accents", "articles", "contractions", "digits", "expand", "franca",
+        "json", "lang", "lingua", "lowercase", "normalize", "number",
+        "numbers", "parse", "placeholder", "power", "remove", "replacements",
+        "stopwords", "symbols", "text", "unit", "value", "word"))
 
 
 def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
@@ -49,7 +75,22 @@ def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
     tokens = tokenize(text)
     numbers_to_replace = \
         _extract_numbers_with_text_en(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
+    return _replace_numbers_en(tokens, numbers_to_replace)
+
+
+def _replace_numbers_en(tokens, numbers_to_replace):
+    """
+    Join tokens back into a string, with numbers subbed in for their words.
+
+    Args:
+        tokens [Token]:
+        numbers_to_replace [ReplaceableNumber]: numbers found in the tokens
+
+    Returns:
+        str
+    """
+    numbers_to_replace = sorted(numbers_to_replace,
+                                key=lambda number: number.start_index)
 
     results = []
     for token in tokens:
@@ -97,14 +138,11 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
         if not to_replace:
             break
 
+        if not results:
+            # replace on a copy, the caller's tokens are left as they are
+            tokens = list(tokens)
         results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        replace_number_tokens(tokens, to_replace, placeholder)
     results.sort(key=lambda n: n.start_index)
     return results
 
@@ -273,8 +311,9 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
         The value parsed, and tokens that it corresponds to.
 
     """
-    multiplies, string_num_ordinal, string_num_scale = \
+    number_data = \
         _initialize_number_data_en(short_scale, speech=ordinals is not None)
+    multiplies, string_num_ordinal, string_num_scale = number_data
 
     number_words = []  # type: [Token]
     val = False
@@ -481,7 +520,11 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
+                for other_token in islice(tokens, idx + 1, None):
+                    # powers of ten in a later number don't count
+                    if _is_number_boundary_en(other_token.word, short_scale,
+                                              ordinals, number_data):
+                        break
                     if other_token.word.lower() in multiplies:
                         if string_num_scale[other_token.word.lower()] >= current_val:
                             time_to_sum = False
@@ -500,11 +543,68 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     return val, number_words
 
 
+def _is_number_word_en(word, short_scale, ordinals, number_data):
+    """
+    Check if a lowercased word can be part of a whole number.
+
+    Same test as in _extract_whole_number_with_text_en, explicit ordinal
+    suffixes (1st, 2nd...) must already be stripped.
+
+    Args:
+        word (str): the word to check
+        short_scale (bool):
+        ordinals (bool):
+        number_data (tuple): as returned by _initialize_number_data_en
+
+    Returns:
+        bool
+    """
+    multiplies, string_num_ordinal, string_num_scale = number_data
+    return word in string_num_scale or \
+        word in _STRING_NUM_EN or \
+        word in _SUMS_EN or \
+        word in multiplies or \
+        bool(ordinals and word in string_num_ordinal) or \
+        is_numeric(word) or \
+        is_fractional_en(word, short_scale=short_scale) or \
+        look_for_fractions(word.split('/'))
+
+
+def _is_number_boundary_en(word, short_scale, ordinals, number_data):
+    """
+    Check if a word can never be part of a whole number.
+
+    _extract_whole_number_with_text_en stops (or restarts) at such words,
+    so the numbers on either side of one are extracted independently.
+
+    Args:
+        word (str): the word to check
+        short_scale (bool):
+        ordinals (bool):
+        number_data (tuple): as returned by _initialize_number_data_en
+
+    Returns:
+        bool
+    """
+    word = word.lower()
+    if word in _ARTICLES_EN or word in _NEGATIVES_EN:
+        return False
+    if is_numeric(word[:-2]) and \
+            (word.endswith("st") or word.endswith("nd") or
+             word.endswith("rd") or word.endswith("th")):
+        word = word[:-2]
+    return not _is_number_word_en(word, short_scale, ordinals, number_data)
+
+
+_NUMBER_DATA_EN = {}
+
+
 def _initialize_number_data_en(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are generated once and shared, they must not be modified.
 
     Args:
         short_scale (bool):
@@ -515,6 +615,10 @@ def _initialize_number_data_en(short_scale, speech=True):
         multiplies, string_num_ordinal, string_num_scale
 
     """
+    key = (bool(short_scale), bool(speech))
+    if key in _NUMBER_DATA_EN:
+        return _NUMBER_DATA_EN[key]
+
     multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
         else _MULTIPLIES_LONG_SCALE_EN
 
@@ -527,10 +631,12 @@ def _initialize_number_data_en(short_scale, speech=True):
 
     if speech:
         string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    _NUMBER_DATA_EN[key] = \
+        multiplies, string_num_ordinal_en, string_num_scale_en
+    return _NUMBER_DATA_EN[key]
 
 
-def extract_number_en(text, short_scale=True, ordinals=False):
+def extract_number_en(text, short_scale=True, ordinals=False, analysis=None):
     """
     This function extracts a number from a text string,
     handles pronunciations in long scale and short scale
@@ -541,16 +647,21 @@ def extract_number_en(text, short_scale=True, ordinals=False):
         text (str): the string to normalize
         short_scale (bool): use short scale if True, long scale if False
         ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+        analysis (TextAnalysisEN): precomputed values for text
     Returns:
         (int) or (float) or False: The extracted number or False if no number
                                    was found
 
     """
+    if analysis is not None and analysis.covers(text, short_scale, ordinals):
+        return analysis.extract_number()
+    if not _PREFILTER_EN.search(text):
+        return False
     return _extract_number_with_text_en(tokenize(text.lower()),
                                         short_scale, ordinals).value
 
 
-def extract_duration_en(text):
+def extract_duration_en(text, analysis=None):
     """
     Convert an english phrase into a number of seconds
 
@@ -568,6 +679,7 @@ def extract_duration_en(text):
 
     Args:
         text (str): string containing a duration
+        analysis (TextAnalysisEN): precomputed values for text
 
     Returns:
         (timedelta, str):
@@ -576,9 +688,25 @@ def extract_duration_en(text):
                     be None if no duration is found. The text returned
                     will have whitespace stripped from the ends.
     """
+    if analysis is not None and analysis.covers(text):
+        return analysis.extract_duration()
     if not text:
         return None
+    if not _PREFILTER_EN.search(text):
+        return (None, " ".join(text.split()))
+    return _extract_duration_with_digits_en(_convert_words_to_numbers_en(text))
+
+
+def _extract_duration_with_digits_en(text):
+    """
+    Helper for extract_duration_en, numbers in text are already digits.
+
+    Args:
+        text (str): string containing a duration
 
+    Returns:
+        (timedelta, str): see extract_duration_en
+    """
     time_units = {
         'microseconds': 0,
         'milliseconds': 0,
@@ -590,7 +718,6 @@ def extract_duration_en(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = _convert_words_to_numbers_en(text)
 
     for unit_en in time_units:
         unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
@@ -606,7 +733,8 @@ def extract_duration_en(text):
     return (duration, text)
 
 
-def extract_datetime_en(text, anchorDate=None, default_time=None):
+def extract_datetime_en(text, anchorDate=None, default_time=None,
+                        context=None, analysis=None):
     """ Convert a human date reference into an exact datetime
 
     Convert things like
@@ -630,6 +758,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         text (str): string containing date words
         anchorDate (datetime): A reference date/time for "tommorrow", etc
         default_time (time): Time to set if no time was found in the string
+        context (DateParseContext): precomputed values for anchorDate
+        analysis (TextAnalysisEN): precomputed values for text
 
     Returns:
         [datetime, str]: An array containing the datetime and the remaining
@@ -639,7 +769,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
     def clean_string(s):
         # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
+        if analysis is not None and analysis.text is s:
+            s = analysis.spoken_text()
+        else:
+            s = _convert_words_to_numbers_en(s, ordinals=None)
         # clean unneeded punctuation and capitalization among other things.
         s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
             .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
@@ -678,14 +811,24 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_EN.search(text):
+        return None
     default_time = default_time or time(0, 0, 0)
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
+    if context is not None and context.anchorDate is anchorDate:
+        today = context.weekday
+        currentYear = context.year
+        weekdayOffsets = context.weekday_offsets
+        monthDates = context.month_dates
+    else:
+        today = int(anchorDate.strftime("%w"))
+        currentYear = int(anchorDate.strftime("%Y"))
+        weekdayOffsets = None
+        monthDates = {}
     fromFlag = False
     datestr = ""
     hasYear = False
@@ -745,7 +888,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNext == "millennium":
                 yearOffset = multiplier * 1000
         elif word in year_markers and is_numeric(wordNext) and len(wordNext) == 4:
-            yearOffset = int(wordNext) - int(currentYear)
+            yearOffset = int(wordNext) - currentYear
             used += 2
             hasYear = True
         # couple of
@@ -848,10 +991,13 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         # last Tuesday, etc.
         elif word in days and not fromFlag:
             d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+            if weekdayOffsets is not None:
+                dayOffset = weekdayOffsets[d]
+            else:
+                dayOffset = (d + 1) - today
+                if dayOffset < 0:
+                    dayOffset += 7
             used = 1
-            if dayOffset < 0:
-                dayOffset += 7
             if wordPrev == "next":
                 if dayOffset <= 2:
                     dayOffset += 7
@@ -921,14 +1067,17 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 1
             elif wordNext in days:
                 d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+                if weekdayOffsets is not None:
+                    tmpOffset = weekdayOffsets[d]
+                else:
+                    tmpOffset = (d + 1) - today
+                    if tmpOffset < 0:
+                        tmpOffset += 7
                 used = 2
-                if tmpOffset < 0:
-                    tmpOffset += 7
                 dayOffset += tmpOffset
             elif wordNextNext and wordNextNext in days:
                 d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+                tmpOffset = (d + 1) - today
                 used = 3
                 if wordNext == "next":
                     if dayOffset <= 2:
@@ -1371,13 +1520,13 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                                 tzinfo=extractedDate.tzinfo)
             if extractedDate < temp:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear),
+                    year=currentYear,
                     month=int(temp.strftime("%m")),
                     day=int(temp.strftime("%d")),
                     tzinfo=extractedDate.tzinfo)
             else:
                 extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
+                    year=currentYear + 1,
                     month=int(temp.strftime("%m")),
                     day=int(temp.strftime("%d")),
                     tzinfo=extractedDate.tzinfo)
@@ -1396,7 +1545,13 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
     if yearOffset != 0:
         extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
+    if monthOffset in monthDates and datestr == "" and yearOffset == 0:
+        # still on the anchor's day, the month dates are the same sums
+        monthDate = monthDates[monthOffset]
+        extractedDate = extractedDate.replace(year=monthDate.year,
+                                              month=monthDate.month,
+                                              day=monthDate.day)
+    elif monthOffset != 0:
         extractedDate = extractedDate + relativedelta(months=monthOffset)
     if dayOffset != 0:
         extractedDate = extractedDate + relativedelta(days=dayOffset)
@@ -1449,22 +1604,15 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
-    if input_str.lower() in fracts and spoken:
-        return 1.0 / fracts[input_str.lower()]
+    fracts = _SHORT_FRACTIONS_EN if short_scale else _LONG_FRACTIONS_EN
+    input_str = input_str.lower()
+    if input_str in fracts and spoken:
+        return 1.0 / fracts[input_str]
     return False
 
 
-def extract_numbers_en(text, short_scale=True, ordinals=False):
+def extract_numbers_en(text, short_scale=True, ordinals=False,
+                       analysis=None):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1475,22 +1623,285 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        analysis (TextAnalysisEN): precomputed values for text
     Returns:
         list: list of extracted numbers as floats
     """
+    if analysis is not None and analysis.covers(text, short_scale, ordinals):
+        return analysis.extract_numbers()
+    if not _PREFILTER_EN.search(text):
+        return []
     results = _extract_numbers_with_text_en(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
 
 
+class IncrementalNumbersEN:
+    """
+    Keep the numbers found in a growing english utterance up to date.
+
+    Whole numbers never span a word that can't be part of one (see
+    _is_number_boundary_en), so the numbers between two such words only
+    depend on the words in between. Those are kept while the words don't
+    change, and only the tail of the utterance is parsed again.
+
+    Fractions and decimals ("two and a half", "three point five") are only
+    looked for when their marker appears exactly once in the utterance, in
+    that case all of it is parsed again.
+
+    Args:
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    """
+
+    def __init__(self, short_scale=True, ordinals=False):
+        self.short_scale = short_scale
+        self.ordinals = ordinals
+        self._number_data = \
+            _initialize_number_data_en(short_scale,
+                                       speech=ordinals is not None)
+        self._boundaries = []  # type: [bool]
+        self._markers = []  # type: [Token]
+        # (start, end, [ReplaceableNumber], [str]), tokens[end] is a
+        # boundary and the words are the tokens as left by the extraction
+        self._segments = []
+        self._open = 0  # first token after the last known boundary
+        self._tail = ([], [])
+        self._fallback = None
+
+    def update(self, tokens, stable=0):
+        """
+        Extract the numbers of an utterance.
+
+        Args:
+            tokens [Token]: all tokens of the utterance
+            stable (int): number of leading tokens that didn't change since
+                          the previous update
+
+        Returns:
+            [ReplaceableNumber]: same as _extract_numbers_with_text_en
+        """
+        stable = min(stable, len(self._boundaries))
+        del self._boundaries[stable:]
+        while self._markers and self._markers[-1].index >= stable:
+            self._markers.pop()
+        if self._open > stable:
+            while self._segments and self._segments[-1][1] >= stable:
+                self._segments.pop()
+            self._open = self._segments[-1][1] + 1 if self._segments else 0
+
+        for token in tokens[stable:]:
+            self._boundaries.append(
+                _is_number_boundary_en(token.word, self.short_scale,
+                                       self.ordinals, self._number_data))
+            word = token.word.lower()
+            if word in _FRACTION_MARKER_EN or word in _DECIMAL_MARKER_EN:
+                self._markers.append(token)
+
+        if self._has_single_marker():
+            self._fallback = self._extract(tokens)
+            return self._fallback[0]
+        self._fallback = None
+
+        start = self._open
+        for idx in range(start, len(tokens)):
+            if self._boundaries[idx]:
+                if idx > start:
+                    self._segments.append(
+                        (start, idx) + self._extract(tokens[start:idx]))
+                start = idx + 1
+        self._open = start
+        self._tail = self._extract(tokens[start:])
+
+        return [number for segment in self._segments
+                for number in segment[2]] + self._tail[0]
+
+    def _extract(self, tokens):
+        # whole number extraction may blank words in the list it gets
+        tokens = list(tokens)
+        numbers = _extract_numbers_with_text_en(tokens, self.short_scale,
+                                                self.ordinals)
+        return numbers, [token.word for token in tokens]
+
+    def _has_single_marker(self, lowercase=False):
+        markers = [token.word.lower() if lowercase else token.word
+                   for token in self._markers]
+        return any(markers.count(marker) == 1 for marker in markers
+                   if marker in _FRACTION_MARKER_EN or
+                   marker in _DECIMAL_MARKER_EN)
+
+    def _first_segment(self, tokens):
+        """Start, end and words of the first segment with numbers."""
+        for start, end, numbers, words in self._segments:
+            if numbers:
+                return start, end, words
+        return self._open, len(tokens), self._tail[1]
+
+    def extract_number(self, tokens):
+        """
+        Same as extract_number_en, for the tokens of the last update.
+
+        Args:
+            tokens [Token]: all tokens of the utterance
+
+        Returns:
+            (int) or (float) or False
+        """
+        if not self._has_single_marker() and \
+                not self._has_single_marker(True):
+            start, end, _ = self._first_segment(tokens)
+            tokens = tokens[start:end]
+        tokens = [Token(token.word.lower(), token.index) for token in tokens]
+        return _extract_number_with_text_en(tokens, self.short_scale,
+                                            self.ordinals).value
+
+    def extract_duration(self, tokens, numbers):
+        """
+        Same as extract_duration_en, for the tokens of the last update.
+
+        The numbers must have been extracted with the default arguments,
+        like extract_duration_en does.
+
+        Args:
+            tokens [Token]: all tokens of the utterance, must not be empty
+            numbers [ReplaceableNumber]: as returned by update
+
+        Returns:
+            (timedelta, str)
+        """
+        if self._fallback:
+            words = self._fallback[1]
+        else:
+            # only the first extraction leaves its blanks in the caller's
+            # tokens, and that is the one finding the first number
+            words = [token.word for token in tokens]
+            start, end, segment_words = self._first_segment(tokens)
+            words[start:end] = segment_words
+        tokens = [Token(word, token.index)
+                  for word, token in zip(words, tokens)]
+        return _extract_duration_with_digits_en(
+            _replace_numbers_en(tokens, numbers))
+
+
 class EnglishNormalizer(Normalizer):
-    with open(resolve_resource_file("text/en-us/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = json.loads(
+        read_resource_file("text/en-us/normalize.json"))
 
     def numbers_to_digits(self, utterance):
         return _convert_words_to_numbers_en(utterance, ordinals=None)
 
 
-def normalize_en(text, remove_articles=True):
+def normalize_en(text, remove_articles=True, analysis=None):
     """ English string normalization """
+    if analysis is not None and analysis.covers(text):
+        return analysis.normalize(remove_articles)
     return EnglishNormalizer().normalize(text, remove_articles)
+
+
+class _SharedNormalizerEN(EnglishNormalizer):
+    """ EnglishNormalizer reusing the numbers a TextAnalysisEN found """
+
+    def __init__(self, analysis):
+        super().__init__()
+        self.analysis = analysis
+
+    def numbers_to_digits(self, utterance):
+        # expanding contractions only changed the spaces
+        if self.tokenize(utterance) == self.analysis.words():
+            return self.analysis.spoken_text()
+        return super().numbers_to_digits(utterance)
+
+
+class TextAnalysisEN:
+    """
+    Share the work of the english parsers on one text.
+
+    The text is tokenized once, and its numbers are found once as
+    extract_numbers and extract_duration read them and once as
+    extract_datetime and normalize read them (ordinals=None), instead of
+    once per function. Every method returns the same as the function it is
+    named after.
+
+    Args:
+        text (str): the text to parse
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    """
+
+    def __init__(self, text, short_scale=True, ordinals=False):
+        self.text = text
+        self.short_scale = short_scale
+        self.ordinals = ordinals
+        self._triggered = _PREFILTER_EN.search(text)
+        self._tokens = None
+        self._numbers = None
+        self._spoken_text = None
+
+    def covers(self, text, short_scale=None, ordinals=None):
+        """ Check if the analysis is of text, with these options if given """
+        return text is self.text and \
+            short_scale in (None, self.short_scale) and \
+            ordinals in (None, self.ordinals)
+
+    def tokens(self):
+        """ tokenize(text) """
+        if self._tokens is None:
+            self._tokens = tokenize(self.text)
+        return self._tokens
+
+    def words(self):
+        """ The words of the tokens """
+        return [token.word for token in self.tokens()]
+
+    def numbers_with_text(self):
+        """ The numbers found, as ReplaceableNumbers """
+        if self._numbers is None:
+            self._numbers = _extract_numbers_with_text_en(
+                self.tokens(), self.short_scale, self.ordinals)
+        return self._numbers
+
+    def spoken_text(self):
+        """ _convert_words_to_numbers_en(text, ordinals=None) """
+        if self._spoken_text is None:
+            tokens = self.tokens()
+            self._spoken_text = _replace_numbers_en(
+                tokens, _extract_numbers_with_text_en(tokens, ordinals=None))
+        return self._spoken_text
+
+    def extract_number(self):
+        """ See extract_number_en """
+        if not self._triggered:
+            return False
+        tokens = self.tokens()
+        if self.text != self.text.lower():
+            tokens = tokenize(self.text.lower())
+        return _extract_number_with_text_en(tokens, self.short_scale,
+                                            self.ordinals).value
+
+    def extract_numbers(self):
+        """ See extract_numbers_en """
+        if not self._triggered:
+            return []
+        return [float(result.value) for result in self.numbers_with_text()]
+
+    def extract_duration(self):
+        """ See extract_duration_en """
+        if not self.text or not self._triggered:
+            return extract_duration_en(self.text)
+        if self.short_scale and not self.ordinals:
+            text = _replace_numbers_en(self.tokens(),
+                                       self.numbers_with_text())
+        else:
+            text = _convert_words_to_numbers_en(self.text)
+        return _extract_duration_with_digits_en(text)
+
+    def extract_datetime(self, anchorDate=None, default_time=None,
+                         context=None):
+        """ See extract_datetime_en """
+        return extract_datetime_en(self.text, anchorDate, default_time,
+                                   context, analysis=self)
+
+    def normalize(self, remove_articles=True):
+        """ See normalize_en """
+        return _SharedNormalizerEN(self).normalize(self.text,
+                                                   remove_articles)
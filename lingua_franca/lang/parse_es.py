@@ -19,7 +19,13 @@ from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 from lingua_franca.lang.format_es import pronounce_number_es
 from lingua_franca.lang.parse_common import *
-from lingua_franca.lang.common_data_es import _ARTICLES_ES, _STRING_NUM_ES
+from lingua_franca.lang.common_data_es import _ARTICLES_ES, _STRING_NUM_ES, \
+    _FRACTIONS_ES
+
+# extract_datetime_es drops the accents of á, é and ó
+_PREFILTER_ES = Prefilter((__name__, "lingua_franca.lang.common_data_es",
+                           "lingua_franca.lang.format_es"),
+                          translation=str.maketrans("áéó", "aeo"))
 
 
 def is_fractional_es(input_str, short_scale=True):
@@ -37,22 +43,9 @@ def is_fractional_es(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = {"medio": 2, "media": 2, "tercio": 3, "cuarto": 4,
-             "cuarta": 4, "quinto": 5, "quinta": 5, "sexto": 6, "sexta": 6,
-             "séptimo": 7, "séptima": 7, "octavo": 8, "octava": 8,
-             "noveno": 9, "novena": 9, "décimo": 10, "décima": 10,
-             "onceavo": 11, "onceava": 11, "doceavo": 12, "doceava": 12}
-
-    if input_str.lower() in aFrac:
-        return 1.0 / aFrac[input_str]
-    if (input_str == "vigésimo" or input_str == "vigésima"):
-        return 1.0 / 20
-    if (input_str == "trigésimo" or input_str == "trigésima"):
-        return 1.0 / 30
-    if (input_str == "centésimo" or input_str == "centésima"):
-        return 1.0 / 100
-    if (input_str == "milésimo" or input_str == "milésima"):
-        return 1.0 / 1000
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_ES:
+        return 1.0 / _FRACTIONS_ES[input_str]
     return False
 
 
@@ -66,6 +59,8 @@ def extract_number_es(text, short_scale=True, ordinals=False):
         (int) or (float): The value of extracted number
 
     """
+    if not _PREFILTER_ES.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -190,45 +185,49 @@ def extract_number_es(text, short_scale=True, ordinals=False):
     return result or False
 
 
-def _es_number_parse(words, i):
-    # TODO Not parsing 'cero'
+class _NumberParserES(WordParser):
+    """ The grammar of spanish numbers written in words, up to 999,999
 
-    def es_cte(i, s):
-        if i < len(words) and s == words[i]:
-            return s, i + 1
-        return None
+    Each rule takes the index in words where to look for the number, and
+    returns a tuple with the number and the index of the next word after
+    it, or None if no number was found.
+    """
+    # TODO Not parsing 'cero'
+    __slots__ = ()
 
-    def es_number_word(i, mi, ma):
-        if i < len(words):
-            v = _STRING_NUM_ES.get(words[i])
+    def number_word(self, i, mi, ma):
+        if i < len(self.words):
+            v = _STRING_NUM_ES.get(self.words[i])
             if v and v >= mi and v <= ma:
                 return v, i + 1
         return None
 
-    def es_number_1_99(i):
-        r1 = es_number_word(i, 1, 29)
+    @packrat
+    def number_1_99(self, i):
+        r1 = self.number_word(i, 1, 29)
         if r1:
             return r1
 
-        r1 = es_number_word(i, 30, 90)
+        r1 = self.number_word(i, 30, 90)
         if r1:
             v1, i1 = r1
-            r2 = es_cte(i1, "y")
+            r2 = self.constant(i1, "y")
             if r2:
                 i2 = r2[1]
-                r3 = es_number_word(i2, 1, 9)
+                r3 = self.number_word(i2, 1, 9)
                 if r3:
                     v3, i3 = r3
                     return v1 + v3, i3
             return r1
         return None
 
-    def es_number_1_999(i):
+    @packrat
+    def number_1_999(self, i):
         # [2-9]cientos [1-99]?
-        r1 = es_number_word(i, 100, 900)
+        r1 = self.number_word(i, 100, 900)
         if r1:
             v1, i1 = r1
-            r2 = es_number_1_99(i1)
+            r2 = self.number_1_99(i1)
             if r2:
                 v2, i2 = r2
                 return v1 + v2, i2
@@ -236,26 +235,27 @@ def _es_number_parse(words, i):
                 return r1
 
         # [1-99]
-        r1 = es_number_1_99(i)
+        r1 = self.number_1_99(i)
         if r1:
             return r1
 
         return None
 
-    def es_number(i):
+    @packrat
+    def number(self, i):
         # check for cero
-        r1 = es_number_word(i, 0, 0)
+        r1 = self.number_word(i, 0, 0)
         if r1:
             return r1
 
         # check for [1-999] (mil [0-999])?
-        r1 = es_number_1_999(i)
+        r1 = self.number_1_999(i)
         if r1:
             v1, i1 = r1
-            r2 = es_cte(i1, "mil")
+            r2 = self.constant(i1, "mil")
             if r2:
                 i2 = r2[1]
-                r3 = es_number_1_999(i2)
+                r3 = self.number_1_999(i2)
                 if r3:
                     v3, i3 = r3
                     return v1 * 1000 + v3, i3
@@ -265,7 +265,9 @@ def _es_number_parse(words, i):
                 return r1
         return None
 
-    return es_number(i)
+
+def _es_number_parse(words, i):
+    return _NumberParserES(words).number(i)
 
 
 def extract_numbers_es(text, short_scale=True, ordinals=False):
@@ -282,6 +284,8 @@ def extract_numbers_es(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_ES.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_es,
                                    extract_number_es, short_scale=short_scale,
                                    ordinals=ordinals)
@@ -292,7 +296,8 @@ def normalize_es(text, remove_articles=True):
     # TODO return SpanishNormalizer().normalize(text, remove_articles)
     words = text.split()  # this also removed extra spaces
 
-    normalized = ""
+    parser = _NumberParserES(words)
+    normalized = []
     i = 0
     while i < len(words):
         word = words[i]
@@ -302,16 +307,16 @@ def normalize_es(text, remove_articles=True):
             continue
 
         # Convert numbers into digits
-        r = _es_number_parse(words, i)
+        r = parser.number(i)
         if r:
             v, i = r
-            normalized += " " + str(v)
+            normalized.append(str(v))
             continue
 
-        normalized += " " + word
+        normalized.append(word)
         i += 1
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 # TODO MycroftAI/mycroft-core#2348
@@ -367,6 +372,8 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_ES.search(text):
+        return None
     if anchorDate is None:
         anchorDate = now_local()
 
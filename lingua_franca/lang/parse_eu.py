@@ -22,7 +22,10 @@ from dateutil.relativedelta import relativedelta
 from dateutil.tz import gettz
 from lingua_franca.lang.format_eu import pronounce_number_eu
 from lingua_franca.lang.parse_common import *
-from lingua_franca.lang.common_data_eu import _NUM_STRING_EU
+from lingua_franca.lang.common_data_eu import _NUM_STRING_EU, _FRACTIONS_EU
+
+_PREFILTER_EU = Prefilter((__name__, "lingua_franca.lang.common_data_eu",
+                           "lingua_franca.lang.format_eu"))
 
 
 def is_fractional_eu(input_str):
@@ -38,22 +41,9 @@ def is_fractional_eu(input_str):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = {"erdia": 2, "erdi": 2, "heren": 3, "laurden": 4,
-             "laurdena": 4, "bosten": 5, "bostena": 5, "seiren": 6, "seirena": 6,
-             "zazpiren": 7, "zapirena": 7, "zortziren": 8, "zortzirena": 8,
-             "bederatziren": 9, "bederatzirena": 9, "hamarren": 10, "hamarrena": 10,
-             "hamaikaren": 11, "hamaikarena": 11, "hamabiren": 12, "hamabirena": 12}
-
-    if input_str.lower() in aFrac:
-        return 1.0 / aFrac[input_str]
-    if (input_str == "hogeiren" or input_str == "hogeirena"):
-        return 1.0 / 20
-    if (input_str == "hogeita hamarren" or input_str == "hogeita hamarrena"):
-        return 1.0 / 30
-    if (input_str == "ehunen" or input_str == "ehunena"):
-        return 1.0 / 100
-    if (input_str == "milaren" or input_str == "milarena"):
-        return 1.0 / 1000
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_EU:
+        return 1.0 / _FRACTIONS_EU[input_str]
     return False
 
 
@@ -72,6 +62,8 @@ def extract_number_eu(text, short_scale=True, ordinals=False):
         (int) or (float): The value of extracted number
 
     """
+    if not _PREFILTER_EU.search(text):
+        return False
     aWords = text.lower().split()
     count = 0
     result = None
@@ -196,54 +188,59 @@ def extract_number_eu(text, short_scale=True, ordinals=False):
     return result or False
 
 
-# TODO Not parsing 'cero'
-def eu_number_parse(words, i):
-    def eu_cte(i, s):
-        if i < len(words) and s == words[i]:
-            return s, i + 1
-        return None
+class _NumberParserEU(WordParser):
+    """ The grammar of basque numbers written in words, up to 999,999
+
+    Each rule takes the index in words where to look for the number, and
+    returns a tuple with the number and the index of the next word after
+    it, or None if no number was found.
+    """
+    # TODO Not parsing 'cero'
+    __slots__ = ()
 
-    def eu_number_word(i, mi, ma):
-        if i < len(words):
-            v = _NUM_STRING_EU.get(words[i])
+    def number_word(self, i, mi, ma, word=None):
+        if i < len(self.words):
+            v = _NUM_STRING_EU.get(word or self.words[i])
             if v and v >= mi and v <= ma:
                 return v, i + 1
         return None
 
-    def eu_number_1_99(i):
-        if i >= len(words):
+    @packrat
+    def number_1_99(self, i):
+        if i >= len(self.words):
             return None
-        r1 = eu_number_word(i, 1, 29)
+        r1 = self.number_word(i, 1, 29)
         if r1:
             return r1
 
-        composed = False
-        if  words[i] != "eta" and words[i][-2:] == "ta":
-            composed = True
-            words[i] = words[i][:-2]
+        # hogeita bat: the tens are followed by "ta"
+        word = self.words[i]
+        composed = word != "eta" and word[-2:] == "ta"
+        if composed:
+            word = word[:-2]
 
-        r1 = eu_number_word(i, 20, 90)
+        r1 = self.number_word(i, 20, 90, word)
 
         if r1:
             v1, i1 = r1
 
             if composed:
-                # i2 = r2[1]
-                r3 = eu_number_word(i1, 1, 19)
+                r3 = self.number_word(i1, 1, 19)
                 if r3:
                     v3, i3 = r3
                     return v1 + v3, i3
             return r1
         return None
 
-    def eu_number_1_999(i):
-        r1 = eu_number_word(i, 100, 900)
+    @packrat
+    def number_1_999(self, i):
+        r1 = self.number_word(i, 100, 900)
         if r1:
             v1, i1 = r1
-            r2 = eu_cte(i1, "eta")
+            r2 = self.constant(i1, "eta")
             if r2:
                 i2 = r2[1]
-                r3 = eu_number_1_99(i2)
+                r3 = self.number_1_99(i2)
                 if r3:
                     v3, i3 = r3
                     return v1 + v3, i3
@@ -251,26 +248,27 @@ def eu_number_parse(words, i):
                 return r1
 
         # [1-99]
-        r1 = eu_number_1_99(i)
+        r1 = self.number_1_99(i)
         if r1:
             return r1
 
         return None
 
-    def eu_number(i):
+    @packrat
+    def number(self, i):
         # check for cero
-        r1 = eu_number_word(i, 0, 0)
+        r1 = self.number_word(i, 0, 0)
         if r1:
             return r1
 
         # check for [1-999] (mil [0-999])?
-        r1 = eu_number_1_999(i)
+        r1 = self.number_1_999(i)
         if r1:
             v1, i1 = r1
-            r2 = eu_cte(i1, "mila")
+            r2 = self.constant(i1, "mila")
             if r2:
                 i2 = r2[1]
-                r3 = eu_number_1_999(i2)
+                r3 = self.number_1_999(i2)
                 if r3:
                     v3, i3 = r3
                     return v1 * 1000 + v3, i3
@@ -280,7 +278,9 @@ def eu_number_parse(words, i):
                 return r1
         return None
 
-    return eu_number(i)
+
+def eu_number_parse(words, i):
+    return _NumberParserEU(words).number(i)
 
 
 def extract_numbers_eu(text, short_scale=True, ordinals=False):
@@ -297,6 +297,8 @@ def extract_numbers_eu(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_EU.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_eu, extract_number_eu,
                                    short_scale=short_scale, ordinals=ordinals)
 
@@ -305,22 +307,22 @@ def normalize_eu(text, remove_articles=True):
     """ Basque string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    parser = _NumberParserEU(words)
+    normalized = []
     i = 0
     while i < len(words):
         word = words[i]
         # Convert numbers into digits
-        r = eu_number_parse(words, i)
+        r = parser.number(i)
         if r:
             v, i = r
-            normalized += " " + str(v)
+            normalized.append(str(v))
             continue
 
-        normalized += " " + word
+        normalized.append(word)
         i += 1
 
-    return normalized[1:]  # strip the initial space
-    return text
+    return " ".join(normalized)
 
 
 # TODO MycroftAI/mycroft-core#2348
@@ -374,6 +376,8 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
 
     if input_str == "":
         return None
+    if not _PREFILTER_EU.search(input_str):
+        return None
     if anchorDate is None:
         anchorDate = datetime.now()
 
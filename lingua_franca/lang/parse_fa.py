@@ -16,13 +16,16 @@
 import json
 from datetime import timedelta
 
-from lingua_franca.internal import resolve_resource_file
 from lingua_franca.lang.common_data_fa import (_FARSI_BIG, _FARSI_HUNDREDS,
                                                _FARSI_ONES, _FARSI_TENS,
-                                               _FORMAL_VARIANT)
-from lingua_franca.lang.parse_common import Normalizer
+                                               _FRACTIONS_FA,
+                                               _TO_CONVERSATIONAL_FA)
+from lingua_franca.lang.parse_common import Normalizer, Prefilter
 from lingua_franca.time import now_local
 
+_PREFILTER_FA = Prefilter((__name__, "lingua_franca.lang.common_data_fa",
+                           "lingua_franca.lang.format_fa"))
+
 
 def _is_number(s):
     try:
@@ -31,9 +34,9 @@ def _is_number(s):
     except ValueError:
         return False
 
+
 def _parse_sentence(text):
-    for key, value in _FORMAL_VARIANT.items():
-        text = text.replace(key, value)
+    text = _TO_CONVERSATIONAL_FA(text)
     ar = text.split()
     result = []
     current_number = 0
@@ -322,18 +325,9 @@ def is_fractional_fa(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_FA:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_FA[num]] = num
-    else:
-        for num in _LONG_ORDINAL_FA:
-            if num > 2:
-                fracts[_LONG_ORDINAL_FA[num]] = num
-
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_FA:
+        return 1.0 / _FRACTIONS_FA[input_str]
     return False
 
 
@@ -351,6 +345,8 @@ def extract_numbers_fa(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_FA.search(text):
+        return []
 
     ar = _parse_sentence(text)
     result = []
@@ -18,12 +18,15 @@ from dateutil.tz import gettz
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, WordParser, packrat, Prefilter
 from lingua_franca.lang.format_fr import pronounce_number_fr
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
-    _ORDINAL_ENDINGS_FR
+    _ORDINAL_ENDINGS_FR, _FRACTIONS_FR
 from lingua_franca.time import now_local
 
+_PREFILTER_FR = Prefilter((__name__, "lingua_franca.lang.common_data_fr",
+                           "lingua_franca.lang.format_fr"))
+
 
 def extract_duration_fr(text):
     """Convert a French phrase into a number of seconds.
@@ -81,114 +84,105 @@ def extract_duration_fr(text):
 
     return (duration, text)
 
-def _number_parse_fr(words, i):
-    """ Parses a list of words to find a number
-    Takes in a list of words (strings without whitespace) and
-    extracts a number that starts at the given index.
-    Args:
-        words (array): the list to extract a number from
-        i (int): the index in words where to look for the number
-    Returns:
-        tuple with number, index of next word after the number.
 
-        Returns None if no number was found.
-    """
+class _NumberParserFR(WordParser):
+    """ The grammar of french numbers written in words, from 0 to 999,999
 
-    def cte_fr(i, s):
-        # Check if string s is equal to words[i].
-        # If it is return tuple with s, index of next word.
-        # If it is not return None.
-        if i < len(words) and s == words[i]:
-            return s, i + 1
+    Each rule takes the index in words where to look for the number, and
+    returns a tuple with the number, index of next word after the number,
+    or None if no number was found.
+    """
+    __slots__ = ()
+
+    @packrat
+    def word_value(self, i):
+        # The number words[i] is, None if it isn't one.
+        if i >= len(self.words):
+            return None
+        val = _NUMBERS_FR.get(self.words[i])
+        # Numbers [1-16,20,30,40,50,60,70,80,90,100,1000]
+        if val is not None:
+            return val
+        # The number may be hyphenated (numbers [17-999])
+        splitWord = self.words[i].split('-')
+        if len(splitWord) > 1:
+            val1 = _NUMBERS_FR.get(splitWord[0])
+            if val1:
+                i1 = 0
+                val2 = 0
+                val3 = 0
+                if val1 < 10 and splitWord[1] == "cents":
+                    val1 = val1 * 100
+                    i1 = 2
+
+                # For [81-99], e.g. "quatre-vingt-deux"
+                if len(splitWord) > i1 and splitWord[0] == "quatre" and \
+                        splitWord[1] == "vingt":
+                    val1 = 80
+                    i1 += 2
+
+                # We still found a number
+                if i1 == 0:
+                    i1 = 1
+
+                if len(splitWord) > i1:
+                    # For [21,31,41,51,61,71]
+                    if len(splitWord) > i1 + 1 and splitWord[i1] == "et":
+                        val2 = _NUMBERS_FR.get(splitWord[i1 + 1])
+                        if val2 is not None:
+                            i1 += 2
+                    # For [77-79],[97-99] e.g. "soixante-dix-sept"
+                    elif splitWord[i1] == "dix" and \
+                            len(splitWord) > i1 + 1:
+                        val2 = _NUMBERS_FR.get(splitWord[i1 + 1])
+                        if val2 is not None:
+                            val2 += 10
+                            i1 += 2
+                    else:
+                        val2 = _NUMBERS_FR.get(splitWord[i1])
+                        if val2 is not None:
+                            i1 += 1
+                            if len(splitWord) > i1:
+                                val3 = _NUMBERS_FR.get(splitWord[i1])
+                                if val3 is not None:
+                                    i1 += 1
+
+                    if val2:
+                        if val3:
+                            val = val1 + val2 + val3
+                        else:
+                            val = val1 + val2
+                    else:
+                        return None
+                if i1 == len(splitWord) and val:
+                    return val
         return None
 
-    def number_word_fr(i, mi, ma):
+    def number_word(self, i, mi, ma):
         # Check if words[i] is a number in _NUMBERS_FR between mi and ma.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
-        if i < len(words):
-            val = _NUMBERS_FR.get(words[i])
-            # Numbers [1-16,20,30,40,50,60,70,80,90,100,1000]
-            if val is not None:
-                if val >= mi and val <= ma:
-                    return val, i + 1
-                else:
-                    return None
-            # The number may be hyphenated (numbers [17-999])
-            splitWord = words[i].split('-')
-            if len(splitWord) > 1:
-                val1 = _NUMBERS_FR.get(splitWord[0])
-                if val1:
-                    i1 = 0
-                    val2 = 0
-                    val3 = 0
-                    if val1 < 10 and splitWord[1] == "cents":
-                        val1 = val1 * 100
-                        i1 = 2
-
-                    # For [81-99], e.g. "quatre-vingt-deux"
-                    if len(splitWord) > i1 and splitWord[0] == "quatre" and \
-                            splitWord[1] == "vingt":
-                        val1 = 80
-                        i1 += 2
-
-                    # We still found a number
-                    if i1 == 0:
-                        i1 = 1
-
-                    if len(splitWord) > i1:
-                        # For [21,31,41,51,61,71]
-                        if len(splitWord) > i1 + 1 and splitWord[i1] == "et":
-                            val2 = _NUMBERS_FR.get(splitWord[i1 + 1])
-                            if val2 is not None:
-                                i1 += 2
-                        # For [77-79],[97-99] e.g. "soixante-dix-sept"
-                        elif splitWord[i1] == "dix" and \
-                                len(splitWord) > i1 + 1:
-                            val2 = _NUMBERS_FR.get(splitWord[i1 + 1])
-                            if val2 is not None:
-                                val2 += 10
-                                i1 += 2
-                        else:
-                            val2 = _NUMBERS_FR.get(splitWord[i1])
-                            if val2 is not None:
-                                i1 += 1
-                                if len(splitWord) > i1:
-                                    val3 = _NUMBERS_FR.get(splitWord[i1])
-                                    if val3 is not None:
-                                        i1 += 1
-
-                        if val2:
-                            if val3:
-                                val = val1 + val2 + val3
-                            else:
-                                val = val1 + val2
-                        else:
-                            return None
-                    if i1 == len(splitWord) and val and ma >= val >= mi:
-                        return val, i + 1
-
+        val = self.word_value(i)
+        if val is not None and mi <= val <= ma:
+            return val, i + 1
         return None
 
-    def number_1_99_fr(i):
+    @packrat
+    def number_1_99(self, i):
         # Check if words[i] is a number between 1 and 99.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
 
         # Is it a number between 1 and 16?
-        result1 = number_word_fr(i, 1, 16)
+        result1 = self.number_word(i, 1, 16)
         if result1:
             return result1
 
         # Is it a number between 10 and 99?
-        result1 = number_word_fr(i, 10, 99)
+        result1 = self.number_word(i, 10, 99)
         if result1:
             val1, i1 = result1
-            result2 = cte_fr(i1, "et")
+            result2 = self.constant(i1, "et")
             # If the number is not hyphenated [21,31,41,51,61,71]
             if result2:
                 i2 = result2[1]
-                result3 = number_word_fr(i2, 1, 11)
+                result3 = self.number_word(i2, 1, 11)
                 if result3:
                     val3, i3 = result3
                     return val1 + val3, i3
@@ -197,27 +191,26 @@ def _number_parse_fr(words, i):
         # It is not a number
         return None
 
-    def number_1_999_fr(i):
+    @packrat
+    def number_1_999(self, i):
         # Check if words[i] is a number between 1 and 999.
-        # If it is return tuple with number, index of next word.
-        # If it is not return None.
 
         # Is it 100 ?
-        result = number_word_fr(i, 100, 100)
+        result = self.number_word(i, 100, 100)
 
         # Is it [200,300,400,500,600,700,800,900]?
         if not result:
-            resultH1 = number_word_fr(i, 2, 9)
+            resultH1 = self.number_word(i, 2, 9)
             if resultH1:
                 valH1, iH1 = resultH1
-                resultH2 = number_word_fr(iH1, 100, 100)
+                resultH2 = self.number_word(iH1, 100, 100)
                 if resultH2:
                     iH2 = resultH2[1]
                     result = valH1 * 100, iH2
 
         if result:
             val1, i1 = result
-            result2 = number_1_99_fr(i1)
+            result2 = self.number_1_99(i1)
             if result2:
                 val2, i2 = result2
                 return val1 + val2, i2
@@ -225,48 +218,40 @@ def _number_parse_fr(words, i):
                 return result
 
         # Is it hyphenated? [101-999]
-        result = number_word_fr(i, 101, 999)
+        result = self.number_word(i, 101, 999)
         if result:
             return result
 
         # [1-99]
-        result = number_1_99_fr(i)
+        result = self.number_1_99(i)
         if result:
             return result
 
         return None
 
-    def number_1_999999_fr(i):
-        """ Find a number in a list of words
-        Checks if words[i] is a number between 1 and 999,999.
-
-        Args:
-            i (int): the index in words where to look for the number
-        Returns:
-            tuple with number, index of next word after the number.
-
-            Returns None if no number was found.
-        """
+    @packrat
+    def number(self, i):
+        # Check if words[i] is a number between 0 and 999,999.
 
         # check for zero
-        result1 = number_word_fr(i, 0, 0)
+        result1 = self.number_word(i, 0, 0)
         if result1:
             return result1
 
         # check for [1-999]
-        result1 = number_1_999_fr(i)
+        result1 = self.number_1_999(i)
         if result1:
             val1, i1 = result1
         else:
             val1 = 1
             i1 = i
         # check for 1000
-        result2 = number_word_fr(i1, 1000, 1000)
+        result2 = self.number_word(i1, 1000, 1000)
         if result2:
             # it's [1000-999000]
             i2 = result2[1]
             # check again for [1-999]
-            result3 = number_1_999_fr(i2)
+            result3 = self.number_1_999(i2)
             if result3:
                 val3, i3 = result3
                 return val1 * 1000 + val3, i3
@@ -276,7 +261,23 @@ def _number_parse_fr(words, i):
             return result1
         return None
 
-    return number_1_999999_fr(i)
+
+def _number_parse_fr(words, i):
+    """ Parses a list of words to find a number
+    Takes in a list of words (strings without whitespace) and
+    extracts a number that starts at the given index.
+
+    To look for numbers at several indexes of the same words, use a
+    _NumberParserFR, it doesn't parse twice what the indexes share.
+    Args:
+        words (array): the list to extract a number from
+        i (int): the index in words where to look for the number
+    Returns:
+        tuple with number, index of next word after the number.
+
+        Returns None if no number was found.
+    """
+    return _NumberParserFR(words).number(i)
 
 
 def _get_ordinal_fr(word):
@@ -300,12 +301,13 @@ def _get_ordinal_fr(word):
     return None
 
 
-def _number_ordinal_fr(words, i):
+def _number_ordinal_fr(parser, i):
     """ Find an ordinal number in a list of words
     Takes in a list of words (strings without whitespace) and
     extracts an ordinal number that starts at the given index.
     Args:
-        words (array): the list to extract a number from
+        parser (_NumberParserFR): the parser of the list to extract a
+                                  number from
         i (int): the index in words where to look for the ordinal number
     Returns:
         tuple with ordinal number (str),
@@ -313,6 +315,7 @@ def _number_ordinal_fr(words, i):
 
         Returns None if no ordinal number was found.
     """
+    words = parser.words
     val1 = None
     strOrd = ""
     # it's already a digit, normalize to "1er" or "5e"
@@ -325,7 +328,7 @@ def _number_ordinal_fr(words, i):
         return strOrd, i + 1
 
     # if it's a big number the beginning should be detected as a number
-    result = _number_parse_fr(words, i)
+    result = parser.number(i)
     if result:
         val1, i = result
     else:
@@ -365,7 +368,7 @@ def _number_ordinal_fr(words, i):
                     word = word + "e"
                     result = _number_parse_fr([word], 0)
                 if result:
-                    val2, i = result
+                    val2 = result[0]
                 if val2 is not None:
                     strOrd = str(val1 + val2) + "e"
         if strOrd:
@@ -381,6 +384,8 @@ def extract_number_fr(text, short_scale=True, ordinals=False):
     Returns:
         (str): The number extracted or the original text.
     """
+    if not _PREFILTER_FR.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -501,6 +506,8 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_FR.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -1017,21 +1024,11 @@ def is_fractional_fr(input_str, short_scale=True):
     if input_str != "tiers" and input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "quarts"
 
-    aFrac = ["entier", "demi", "tiers", "quart", "cinquième", "sixième",
-             "septième", "huitième", "neuvième", "dixième", "onzième",
-             "douzième", "treizième", "quatorzième", "quinzième", "seizième",
-             "dix-septième", "dix-huitième", "dix-neuvième", "vingtième"]
-
-    if input_str in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if _get_ordinal_fr(input_str):
-        return 1.0 / _get_ordinal_fr(input_str)
-    if input_str == "trentième":
-        return 1.0 / 30
-    if input_str == "centième":
-        return 1.0 / 100
-    if input_str == "millième":
-        return 1.0 / 1000
+    if input_str in _FRACTIONS_FR:
+        return 1.0 / _FRACTIONS_FR[input_str]
+    ordinal = _get_ordinal_fr(input_str)
+    if ordinal:
+        return 1.0 / ordinal
 
     return False
 
@@ -1040,37 +1037,40 @@ def normalize_fr(text, remove_articles=True):
     """ French string normalization """
     text = text.lower()
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    parser = _NumberParserFR(words)
+    normalized = []
     i = 0
     while i < len(words):
         # remove articles
         if remove_articles and words[i] in _ARTICLES_FR:
             i += 1
             continue
-        if remove_articles and words[i][:2] in ["l'", "d'"]:
+        if remove_articles and words[i][:2] in ("l'", "d'"):
             words[i] = words[i][2:]
+            # a number before it was parsed with the article still there
+            parser = _NumberParserFR(words)
         # remove useless punctuation signs
-        if words[i] in ["?", "!", ";", "…"]:
+        if words[i] in ("?", "!", ";", "…"):
             i += 1
             continue
         # Normalize ordinal numbers
         if i > 0 and words[i - 1] in _ARTICLES_FR:
-            result = _number_ordinal_fr(words, i)
+            result = _number_ordinal_fr(parser, i)
             if result is not None:
                 val, i = result
-                normalized += " " + str(val)
+                normalized.append(str(val))
                 continue
         # Convert numbers into digits
-        result = _number_parse_fr(words, i)
+        result = parser.number(i)
         if result is not None:
             val, i = result
-            normalized += " " + str(val)
+            normalized.append(str(val))
             continue
 
-        normalized += " " + words[i]
+        normalized.append(words[i])
         i += 1
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 def extract_numbers_fr(text, short_scale=True, ordinals=False):
@@ -1087,6 +1087,8 @@ def extract_numbers_fr(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_FR.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_fr, extract_number_fr,
                                    short_scale=short_scale, ordinals=ordinals)
 
@@ -18,16 +18,21 @@
 
 """
 
-import collections
 from datetime import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, CompoundSegmenter, Prefilter
 from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT, \
     pronounce_number_it
 from lingua_franca.lang.common_data_it import _SHORT_ORDINAL_STRING_IT, \
-    _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT
+    _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT, \
+    _SHORT_FRACTIONS_IT, _LONG_FRACTIONS_IT
+
+# is_fractional_it reads plurals as singulars, "noni" as "nono"
+_PREFILTER_IT = Prefilter((__name__, "lingua_franca.lang.common_data_it",
+                           "lingua_franca.lang.format_it"), stem_length=1)
 
 
 def is_fractional_it(input_str, short_scale=False):
@@ -46,22 +51,79 @@ def is_fractional_it(input_str, short_scale=False):
     if input_str.endswith('i', -1) and len(input_str) > 2:
         input_str = input_str[:-1] + "o"  # normalizza plurali
 
-    fracts_it = {"intero": 1, "mezza": 2, "mezzo": 2}
-
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[_SHORT_ORDINAL_STRING_IT[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_IT:
-            if num > 2:
-                fracts_it[_LONG_ORDINAL_STRING_IT[num]] = num
-
+    fracts_it = _SHORT_FRACTIONS_IT if short_scale else _LONG_FRACTIONS_IT
     if input_str in fracts_it:
         return 1.0 / fracts_it[input_str]
     return False
 
 
+_UNITS_IT = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'tré': 3,
+             'quattro': 4, 'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8,
+             'nove': 9}
+
+_TENS_IT = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
+            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
+            'novanta': 90,
+            # elisi davanti a uno e otto: ventuno, trentotto
+            'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
+            'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90,
+            'undici': 11, 'dodici': 12, 'tredici': 13, 'quattordici': 14,
+            'quindici': 15, 'sedici': 16, 'diciassette': 17,
+            'diciotto': 18, 'diciannove': 19}
+
+_MULTIPLIERS_IT = [
+    # (1e63, 'deciliardi'),
+    # (1e60, 'decilioni'),
+    # (1e57, 'noviliardi'),
+    # (1e54, 'novilioni'),
+    # (1e51, 'ottiliardi'),
+    # (1e48, 'ottilioni'),
+    # (1e45, 'settiliardi'),
+    # (1e42, 'settilioni'),
+    # (1e39, 'sestiliardi'),
+    # (1e36, 'sestilioni'),
+    # (1e33, 'quintiliardi'),
+    # (1e30, 'quintilioni'),
+    # (1e27, 'quadriliardi'),
+    # (1e24, 'quadrilioni'),    # yotta
+    (10 ** 21, 'triliardi'),  # zetta
+    (10 ** 18, 'trilioni'),  # exa
+    (10 ** 15, 'biliardi'),  # peta
+    (10 ** 12, 'bilioni'),  # tera
+    (10 ** 9, 'miliardi'),  # giga
+    (10 ** 6, 'milioni')  # mega
+]
+
+# normalizza ordinali singoli o plurali -esimo -esimi
+_ORDINAL_ENDINGS3_IT = {'tre': '', 'ttr': 'o', 'sei': '', 'ott': 'o'}
+_ORDINAL_ENDINGS2_IT = {'un': 'o', 'du': 'e', 'qu': 'e', 'tt': 'e',
+                        'ov': 'e'}
+
+
+def _number_morphemes_it():
+    """ morpheme -> (kind, value) of the parts of a long italian number """
+    morphemes = {}
+    for word, value in _UNITS_IT.items():
+        morphemes[word] = ('+', value)
+    for word, value in _TENS_IT.items():
+        morphemes[word] = ('+', value)
+    morphemes['cento'] = morphemes['cent'] = ('cento', 100)
+    morphemes['mille'] = ('mille', 1000)  # unmilionemille
+    morphemes['mila'] = ('mila', 1000)  # unmilioneduemila
+    for value, plural in _MULTIPLIERS_IT:
+        morphemes[plural] = ('*', value)
+        # singolari: unmilione, unmiliardo
+        if plural[-5:-1] == 'iard':
+            morphemes['un' + plural[:-1] + 'o'] = ('*', value)
+        else:
+            morphemes['un' + plural[:-1] + 'e'] = ('*', value)
+    return morphemes
+
+
+_NUMBER_SEGMENTER_IT = CompoundSegmenter(_number_morphemes_it())
+
+
+@lru_cache(maxsize=1024)
 def _extract_number_long_it(word):
     """
      This function converts a long textual number like
@@ -78,150 +140,39 @@ def _extract_number_long_it(word):
          (bool) or (int): The extracted number or False if no number
                                    was found
     """
+    # "cinque milioni, grazie"
+    word = word.rstrip('.,;:!?')
+    if word.isdecimal():
+        return int(word)
 
-    units = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
-             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
-
-    tens = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
-            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
-            'novanta': 90}
-
-    tens_short = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
-                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
-
-    nums_long = {'undici': 11, 'dodici': 12, 'tredici': 13, 'quattordici': 14,
-                 'quindici': 15, 'sedici': 16, 'diciassette': 17,
-                 'diciotto': 18, 'diciannove': 19}
-
-    multipli_it = collections.OrderedDict([
-        # (1e63, 'deciliardi'),
-        # (1e60, 'decilioni'),
-        # (1e57, 'noviliardi'),
-        # (1e54, 'novilioni'),
-        # (1e51, 'ottiliardi'),
-        # (1e48, 'ottilioni'),
-        # (1e45, 'settiliardi'),
-        # (1e42, 'settilioni'),
-        # (1e39, 'sestiliardi'),
-        # (1e36, 'sestilioni'),
-        # (1e33, 'quintiliardi'),
-        # (1e30, 'quintilioni'),
-        # (1e27, 'quadriliardi'),
-        # (1e24, 'quadrilioni'),    # yotta
-        (1e21, 'triliardi'),  # zetta
-        (1e18, 'trilioni'),  # exa
-        (1e15, 'biliardi'),  # peta
-        (1e12, 'bilioni'),  # tera
-        (1e9, 'miliardi'),  # giga
-        (1e6, 'milioni')  # mega
-    ])
-
-    multiplier = {}
-    un_multiplier = {}
-
-    for num in multipli_it:
-        if num > 1000 and num <= 1e21:
-            # plurali
-            multiplier[multipli_it[num]] = int(num)
-            # singolari - modificare per eccezioni *liardo
-            if multipli_it[num][-5:-1] == 'iard':
-                un_multiplier['un' + multipli_it[num][:-1] + 'o'] = int(num)
-            else:
-                un_multiplier['un' + multipli_it[num][:-1] + 'e'] = int(num)
-
-    value = False
-
-    # normalizza ordinali singoli o plurali -esimo -esimi
     if word[-5:-1] == 'esim':
         base = word[:-5]
-        normalize_ita3 = {'tre': '', 'ttr': 'o', 'sei': '', 'ott': 'o'}
-        normalize_ita2 = {'un': 'o', 'du': 'e', 'qu': 'e', 'tt': 'e',
-                          'ov': 'e'}
-
-        if base[-3:] in normalize_ita3:
-            base += normalize_ita3[base[-3:]]
-        elif base[-2:] in normalize_ita2:
-            base += normalize_ita2[base[-2:]]
-
+        if base[-3:] in _ORDINAL_ENDINGS3_IT:
+            base += _ORDINAL_ENDINGS3_IT[base[-3:]]
+        elif base[-2:] in _ORDINAL_ENDINGS2_IT:
+            base += _ORDINAL_ENDINGS2_IT[base[-2:]]
         word = base
 
-    for item in un_multiplier:
-        components = word.split(item, 1)
-        if len(components) == 2:
-            if not components[0]:  # inizia con un1^x
-                if not components[1]:  # unmilione
-                    word = str(int(un_multiplier[item]))
-                else:  # unmilione + x
-                    word = str(int(un_multiplier[item]) +
-                               _extract_number_long_it(components[1]))
-
-    for item in multiplier:
-        components = word.split(item, 1)
-        if len(components) == 2:
-            if not components[0]:  # inizia con un1^x
-                word = str(int(multiplier[item]) +
-                           _extract_number_long_it(components[1]))
-            else:
-                if not components[1]:
-                    word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item]))
-                else:
-                    word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item])) + '+' \
-                        + str(_extract_number_long_it(components[1]))
-
-    for item in tens:
-        word = word.replace(item, '+' + str(tens[item]))
-
-    for item in tens_short:
-        word = word.replace(item, '+' + str(tens_short[item]))
-
-    for item in nums_long:
-        word = word.replace(item, '+' + str(nums_long[item]))
-
-    word = word.replace('cento', '+1xx')
-    word = word.replace('cent', '+1xx')
-    word = word.replace('mille', '+1000')  # unmilionemille
-    word = word.replace('mila', '*1000')  # unmilioneduemila
-
-    for item in units:
-        word = word.replace(item, '+' + str(units[item]))
-
-    # normalizzo i cento
-    occorrenze = word.count('+1xx')
-    for _ in range(0, occorrenze):
-        components = word.rsplit('+1xx', 1)
-        if len(components[0]) > 1 and components[0].endswith('0'):
-            word = components[0] + '+100' + components[1]
-        else:
-            word = components[0] + '*100' + components[1]
-
-    components = word.rsplit('*1000', 1)
-    if len(components) == 2:
-        if components[0].startswith('*'):  # centomila
-            components[0] = components[0][1:]
-        word = str(_extract_number_long_it(components[0])) + \
-            '*1000' + str(components[1])
-
-    # gestione eccezioni
-    if word.startswith('*') or word.startswith('+'):
-        word = word[1:]
-
-    addends = word.split('+')
-    for c, _ in enumerate(addends):
-        if '*' in addends[c]:
-            factors = addends[c].split('*')
-            result = int(factors[0]) * int(factors[1])
-            if len(factors) == 3:
-                result *= int(factors[2])
-            addends[c] = str(result)
-
-    # check if all token are numbers
-    if all([s.isdecimal() for s in addends]):
-        value = sum([int(s) for s in addends])
-    else:
-        value = False
-    return value
+    morphemes = _NUMBER_SEGMENTER_IT.segment(word)
+    if not morphemes:
+        return False
+
+    # total: milioni e oltre, thousands: migliaia, current: sotto mille
+    total = thousands = current = 0
+    for kind, value in morphemes:
+        if kind == '+':
+            current += value
+        elif kind == 'cento':  # duecento, centotre
+            current = current * value if current else value
+        elif kind == 'mille':
+            thousands += value
+        elif kind == 'mila':  # duemila, centomila
+            thousands += (current or 1) * value
+            current = 0
+        else:  # duemilioni, unmiliardo, millemiliardi
+            total += (thousands + current or 1) * value
+            thousands = current = 0
+    return total + thousands + current
 
 
 def extract_number_it(text, short_scale=False, ordinals=False):
@@ -240,6 +191,8 @@ def extract_number_it(text, short_scale=False, ordinals=False):
                                    was found
 
     """
+    if not _PREFILTER_IT.search(text):
+        return False
 
     text = text.lower()
     string_num_ordinal_it = {}
@@ -414,7 +367,9 @@ def normalize_it(text, remove_articles=True):
     words = text.split()  # this also removed extra spaces
     # Contractions are not common in IT
     # Convert numbers into digits, e.g. 'quarantadue' -> '42'
-    normalized = ''
+    normalized = []
+    # words repeat a lot in long texts, convert each of them only once
+    converted = {}
     i = 0
 
     while i < len(words):
@@ -425,19 +380,22 @@ def normalize_it(text, remove_articles=True):
             i += 1
             continue
 
-        if word in _STRING_NUM_IT:
-            word = str(_STRING_NUM_IT[word])
+        if word not in converted:
+            new_word = word
+            if new_word in _STRING_NUM_IT:
+                new_word = str(_STRING_NUM_IT[new_word])
 
-        val = int(extract_number_it(word))  # era extractnumber_long_it
+            val = int(extract_number_it(new_word))  # era extractnumber_long_it
 
-        if val:
-            word = str(val)
+            if val:
+                new_word = str(val)
+            converted[word] = new_word
 
-        normalized += ' ' + word
+        normalized.append(converted[word])
         i += 1
     # indefinite articles in it-it can not be removed
 
-    return normalized[1:]
+    return " ".join(normalized)
 
 
 def extract_datetime_it(text, anchorDate=None, default_time=None):
@@ -1162,6 +1120,8 @@ def extract_numbers_it(text, short_scale=False, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_IT.search(text):
+        return []
     return extract_numbers_generic(text, pronounce_number_it,
                                    extract_number_it,
                                    short_scale=short_scale, ordinals=ordinals)
@@ -17,16 +17,21 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
-from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
-    _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
+from .parse_common import is_numeric, look_for_fractions, \
+    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict, \
+    replace_number_tokens, Prefilter
+from .common_data_nl import _ARTICLES_NL, \
+    _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, \
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
     _NEGATIVES_NL, _SHORT_SCALE_NL, _STRING_LONG_ORDINAL_NL, _STRING_NUM_NL, \
-    _STRING_SHORT_ORDINAL_NL, _SUMS_NL
+    _STRING_SHORT_ORDINAL_NL, _SUMS_NL, _SHORT_FRACTIONS_NL, \
+    _LONG_FRACTIONS_NL
 from lingua_franca.time import now_local
 import re
 
+_PREFILTER_NL = Prefilter((__name__, "lingua_franca.lang.common_data_nl",
+                           "lingua_franca.lang.format_nl"))
+
 
 def _convert_words_to_numbers_nl(text, short_scale=True, ordinals=False):
     """Convert words in a string into their equivalent numbers.
@@ -89,14 +94,11 @@ def _extract_numbers_with_text_nl(tokens, short_scale=True,
         if not to_replace:
             break
 
+        if not results:
+            # replace on a copy, the caller's tokens are left as they are
+            tokens = list(tokens)
         results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        replace_number_tokens(tokens, to_replace, placeholder)
     results.sort(key=lambda n: n.start_index)
     return results
 
@@ -390,10 +392,14 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+_NUMBER_DATA_NL = {}
+
+
 def _initialize_number_data_nl(short_scale):
     """Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are generated once and shared, they must not be modified.
 
     Args:
         short_scale boolean:
@@ -402,6 +408,10 @@ def _initialize_number_data_nl(short_scale):
         (set(str), dict(str, number), dict(str, number))
         multiplies, string_num_ordinal, string_num_scale
     """
+    short_scale = bool(short_scale)
+    if short_scale in _NUMBER_DATA_NL:
+        return _NUMBER_DATA_NL[short_scale]
+
     multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
         else _MULTIPLIES_LONG_SCALE_NL
 
@@ -411,7 +421,9 @@ def _initialize_number_data_nl(short_scale):
     string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
     string_num_scale_nl = invert_dict(string_num_scale_nl)
 
-    return multiplies, string_num_ordinal_nl, string_num_scale_nl
+    _NUMBER_DATA_NL[short_scale] = \
+        multiplies, string_num_ordinal_nl, string_num_scale_nl
+    return _NUMBER_DATA_NL[short_scale]
 
 
 def extract_number_nl(text, short_scale=True, ordinals=False):
@@ -429,6 +441,8 @@ def extract_number_nl(text, short_scale=True, ordinals=False):
         (int) or (float) or False: The extracted number or False if no number
                                    was found
     """
+    if not _PREFILTER_NL.search(text):
+        return False
     return _extract_number_with_text_nl(tokenize(text.lower()),
                                         short_scale, ordinals).value
 
@@ -462,6 +476,8 @@ def extract_duration_nl(text):
     """
     if not text:
         return None
+    if not _PREFILTER_NL.search(text):
+        return (None, " ".join(text.lower().split()))
 
     time_units = {
         'microseconds': 0,
@@ -565,6 +581,8 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_NL.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -1281,18 +1299,10 @@ def is_fractional_nl(input_str, short_scale=True):
     Returns:
         (bool) or (float): False if not a fraction, otherwise the fraction
     """
-    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_STRING_NL[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_LONG_ORDINAL_STRING_NL[num]] = num
-
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
+    fracts = _SHORT_FRACTIONS_NL if short_scale else _LONG_FRACTIONS_NL
+    input_str = input_str.lower()
+    if input_str in fracts:
+        return 1.0 / fracts[input_str]
     return False
 
 
@@ -1309,32 +1319,34 @@ def extract_numbers_nl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_NL.search(text):
+        return []
     results = _extract_numbers_with_text_nl(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
 
 
+_TEXT_NUMBERS_NL = {word: str(num) for num, word in enumerate(
+    ["nul", "een", "twee", "drie", "vier", "vijf", "zes", "zeven", "acht",
+     "negen", "tien", "elf", "twaalf", "dertien", "veertien", "vijftien",
+     "zestien", "zeventien", "achttien", "negentien", "twintig"])}
+
+
 def normalize_nl(text, remove_articles=True):
     """Dutch string normalization."""
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
         if remove_articles and word in _ARTICLES_NL:
             continue
 
         # Convert numbers into digits, e.g. "two" -> "2"
-        textNumbers = ["nul", "een", "twee", "drie", "vier", "vijf", "zes",
-                       "zeven", "acht", "negen", "tien", "elf", "twaalf",
-                       "dertien", "veertien", "vijftien", "zestien",
-                       "zeventien", "achttien", "negentien", "twintig"]
-
-        if word in textNumbers:
-            word = str(textNumbers.index(word))
+        word = _TEXT_NUMBERS_NL.get(word, word)
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
 
 
 class DutchNormalizer(Normalizer):
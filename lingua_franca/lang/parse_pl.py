@@ -14,11 +14,13 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from itertools import islice
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, ReplaceableNumber, partition_list, tokenize, \
+    replace_number_tokens, Prefilter
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
@@ -26,6 +28,9 @@ from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
 from lingua_franca.time import now_local
 import re
 
+_PREFILTER_PL = Prefilter((__name__, "lingua_franca.lang.common_data_pl",
+                           "lingua_franca.lang.format_pl"))
+
 
 def generate_plurals_pl(originals):
     """
@@ -108,6 +113,47 @@ _STRING_SHORT_ORDINAL_PL = invert_dict(_SHORT_ORDINAL_PL)
 
 _REV_FRACTITONS = generate_fractions_pl(invert_dict(_FRACTION_STRING_PL))
 
+_SHORT_SCALE_STRINGS_PL = set(_SHORT_SCALE_PL.values())
+
+
+def _invert_dict_first_pl(original):
+    """
+    Like invert_dict, but keeps the first key of repeated values,
+    as a lookup with list(original.values()).index() would.
+    """
+    inverted = {}
+    for key, value in original.items():
+        inverted.setdefault(value, key)
+    return inverted
+
+
+# word -> number string lookups used by normalize_pl
+_NORMALIZE_ORDINAL_BASE_PL = {word: str(num) for word, num in
+                              _invert_dict_first_pl(_ORDINAL_BASE_PL).items()}
+_NORMALIZE_NUM_STRING_PL = {word: str(num) for word, num in
+                            _invert_dict_first_pl(_NUM_STRING_PL).items()}
+_NORMALIZE_ALT_ORDINALS_PL = {word: str(num) for word, num in
+                              _invert_dict_first_pl(_ALT_ORDINALS_PL).items()}
+
+_NORMALIZE_WORDS_PL = {
+    'następną': 'następny',
+    'następna': 'następny',
+    'następnym': 'następny',
+    'następnej': 'następny',
+    'ostatnią': 'poprzedni',
+    'ostatnia': 'poprzedni',
+    'ostatnim': 'poprzedni',
+    'ostatniej': 'poprzedni',
+    'poprzednią': 'poprzedni',
+    'poprzednia': 'poprzedni',
+    'poprzednim': 'poprzedni',
+    'poprzedniej': 'poprzedni',
+    'jutra': 'jutro',
+    'jutrze': 'jutro',
+    'wieczorem': 'wieczór',
+    'poranne': 'rano',
+}
+
 
 def _convert_words_to_numbers_pl(text, short_scale=True, ordinals=False):
     """
@@ -175,14 +221,11 @@ def _extract_numbers_with_text_pl(tokens, short_scale=True,
         if not to_replace:
             break
 
+        if not results:
+            # replace on a copy, the caller's tokens are left as they are
+            tokens = list(tokens)
         results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        replace_number_tokens(tokens, to_replace, placeholder)
     results.sort(key=lambda n: n.start_index)
     return results
 
@@ -390,7 +433,7 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
                 continue
         elif word not in multiplies \
                 and prev_word not in multiplies \
-                and prev_word not in _SHORT_SCALE_PL.values() \
+                and prev_word not in _SHORT_SCALE_STRINGS_PL \
                 and prev_word not in _SUMS \
                 and not (ordinals and prev_word in string_num_ordinal) \
                 and prev_word not in _NEGATIVES:
@@ -536,7 +579,7 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
+                for other_token in islice(tokens, idx + 1, None):
                     if other_token.word in multiplies:
                         if string_num_scale[other_token.word] >= current_val:
                             time_to_sum = False
@@ -555,11 +598,15 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+_NUMBER_DATA_PL = {}
+
+
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are generated once and shared, they must not be modified.
 
     Args:
         short_scale boolean:
@@ -569,11 +616,17 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
+    short_scale = bool(short_scale)
+    if short_scale in _NUMBER_DATA_PL:
+        return _NUMBER_DATA_PL[short_scale]
+
     multiplies = _MULTIPLIES_SHORT_SCALE_PL
 
     string_num_scale = invert_dict(_SHORT_SCALE_PL)
     string_num_scale.update(generate_plurals_pl(string_num_scale))
-    return multiplies, _STRING_SHORT_ORDINAL_PL, string_num_scale
+    _NUMBER_DATA_PL[short_scale] = \
+        multiplies, _STRING_SHORT_ORDINAL_PL, string_num_scale
+    return _NUMBER_DATA_PL[short_scale]
 
 
 def extract_number_pl(text, short_scale=True, ordinals=False):
@@ -592,6 +645,8 @@ def extract_number_pl(text, short_scale=True, ordinals=False):
                                    was found
 
     """
+    if not _PREFILTER_PL.search(text):
+        return False
     return _extract_number_with_text_pl(tokenize(text.lower()),
                                         True, ordinals).value
 
@@ -625,6 +680,8 @@ def extract_duration_pl(text):
     """
     if not text:
         return None
+    if not _PREFILTER_PL.search(text):
+        return (None, " ".join(text.lower().split()))
 
     time_units = {
         'microseconds': None,
@@ -713,6 +770,8 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
 
     if string == "":
         return None
+    if not _PREFILTER_PL.search(string):
+        return None
 
     dateNow = dateNow or now_local()
     found = False
@@ -1348,6 +1407,8 @@ def extract_numbers_pl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_PL.search(text):
+        return []
     results = _extract_numbers_with_text_pl(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
@@ -1368,9 +1429,9 @@ def normalize_pl(text, remove_articles=True):
     """ Polish string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ""
+    normalized = []
     for word in words:
-        if remove_articles and word in ["i"]:
+        if remove_articles and word == "i":
             continue
 
         if word in _TIME_UNITS_NORMALIZATION:
@@ -1379,27 +1440,11 @@ def normalize_pl(text, remove_articles=True):
         if word in _REV_FRACTITONS:
             word = str(_REV_FRACTITONS[word])
 
-        if word in _ORDINAL_BASE_PL.values():
-            word = str(list(_ORDINAL_BASE_PL.keys())[list(_ORDINAL_BASE_PL.values()).index(word)])
-
-        if word in _NUM_STRING_PL.values():
-            word = str(list(_NUM_STRING_PL.keys())[list(_NUM_STRING_PL.values()).index(word)])
-
-        if word in _ALT_ORDINALS_PL.values():
-            word = str(list(_ALT_ORDINALS_PL.keys())[list(_ALT_ORDINALS_PL.values()).index(word)])
-
-        if word == 'następną' or word == 'następna' or word == 'następnym' or word == 'następnej':
-            word = 'następny'
-        elif word == 'ostatnią' or word == 'ostatnia' or word == 'ostatnim' or word == 'ostatniej' or \
-            word == 'poprzednią' or word == 'poprzednia' or word == 'poprzednim' or word == 'poprzedniej':
-            word = 'poprzedni'
-        elif word == 'jutra' or word == 'jutrze':
-            word = 'jutro'
-        elif word == 'wieczorem':
-            word = 'wieczór'
-        elif word == 'poranne':
-            word = 'rano'
+        word = _NORMALIZE_ORDINAL_BASE_PL.get(word, word)
+        word = _NORMALIZE_NUM_STRING_PL.get(word, word)
+        word = _NORMALIZE_ALT_ORDINALS_PL.get(word, word)
+        word = _NORMALIZE_WORDS_PL.get(word, word)
 
-        normalized += " " + word
+        normalized.append(word)
 
-    return normalized[1:]  # strip the initial space
+    return " ".join(normalized)
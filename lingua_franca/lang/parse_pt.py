@@ -22,16 +22,20 @@
 
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
+    Prefilter
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
-    _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
-from lingua_franca.internal import resolve_resource_file
+    _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT, _FRACTIONS_PT
+from lingua_franca.internal import read_resource_file
 from lingua_franca.lang.parse_common import Normalizer
 from lingua_franca.time import now_local
 import json
 import re
 
+_PREFILTER_PT = Prefilter((__name__, "lingua_franca.lang.common_data_pt",
+                           "lingua_franca.lang.format_pt"))
+
 
 def is_fractional_pt(input_str, short_scale=True):
     """
@@ -47,22 +51,9 @@ def is_fractional_pt(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = ["meio", "terço", "quarto", "quinto", "sexto",
-             "setimo", "oitavo", "nono", "décimo"]
-
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 2)
-    if input_str == "vigésimo":
-        return 1.0 / 20
-    if input_str == "trigésimo":
-        return 1.0 / 30
-    if input_str == "centésimo":
-        return 1.0 / 100
-    if input_str == "milésimo":
-        return 1.0 / 1000
-    if (input_str == "sétimo" or input_str == "septimo" or
-            input_str == "séptimo"):
-        return 1.0 / 7
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_PT:
+        return 1.0 / _FRACTIONS_PT[input_str]
 
     return False
 
@@ -77,6 +68,8 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
         (int) or (float): The value of extracted number
 
     """
+    if not _PREFILTER_PT.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API compatibility
     # reasons.
@@ -200,8 +193,8 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
 
 
 class PortugueseNormalizer(Normalizer):
-    with open(resolve_resource_file("text/pt-pt/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = json.loads(
+        read_resource_file("text/pt-pt/normalize.json"))
 
     @staticmethod
     def tokenize(utterance):
@@ -213,7 +206,7 @@ class PortugueseNormalizer(Normalizer):
         utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \2 \3",
                            utterance)
         tokens = utterance.split()
-        if tokens[-1] == '-':
+        if tokens and tokens[-1] == '-':
             tokens = tokens[:-1]
 
         return tokens
@@ -1012,35 +1005,34 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# words removed by _pt_pruning, and (symbol, replacement),
+# (accented, plain) characters it replaces
+_PRUNED_WORDS_PT = frozenset(["a", "o", "os", "as", "de", "dos", "das",
+                              "lhe", "lhes", "me", "e", "no", "nas", "na",
+                              "nos", "em", "para", "este", "esta", "deste",
+                              "desta", "neste", "nesta", "nesse", "nessa",
+                              "foi", "que"])
+_PRUNED_SYMBOLS_PT = ((".", ""), (",", ""), (";", ""), (":", ""), ("!", ""),
+                      ("?", ""), ("º", ""), ("ª", ""), ("-", " "), ("_", " "))
+_PRUNED_ACCENTS_PT = (("á", "a"), ("à", "a"), ("ã", "a"), ("â", "a"),
+                      ("ê", "e"), ("è", "e"), ("é", "e"),
+                      ("í", "i"), ("ì", "i"),
+                      ("ò", "o"), ("ó", "o"),
+                      ("ú", "u"), ("ù", "u"),
+                      ("ç", "c"))
+
+
 def _pt_pruning(text, symbols=True, accents=True, agressive=True):
     # agressive pt word pruning
-    words = ["a", "o", "os", "as", "de", "dos", "das",
-             "lhe", "lhes", "me", "e", "no", "nas", "na", "nos", "em", "para",
-             "este",
-             "esta", "deste", "desta", "neste", "nesta", "nesse",
-             "nessa", "foi", "que"]
     if symbols:
-        symbols = [".", ",", ";", ":", "!", "?", "º", "ª"]
-        for symbol in symbols:
-            text = text.replace(symbol, "")
-        text = text.replace("-", " ").replace("_", " ")
+        for symbol, replacement in _PRUNED_SYMBOLS_PT:
+            text = text.replace(symbol, replacement)
     if accents:
-        accents = {"a": ["á", "à", "ã", "â"],
-                   "e": ["ê", "è", "é"],
-                   "i": ["í", "ì"],
-                   "o": ["ò", "ó"],
-                   "u": ["ú", "ù"],
-                   "c": ["ç"]}
-        for char in accents:
-            for acc in accents[char]:
-                text = text.replace(acc, char)
+        for accented, plain in _PRUNED_ACCENTS_PT:
+            text = text.replace(accented, plain)
     if agressive:
-        text_words = text.split(" ")
-        for idx, word in enumerate(text_words):
-            if word in words:
-                text_words[idx] = ""
-        text = " ".join(text_words)
-        text = ' '.join(text.split())
+        text = " ".join([word for word in text.split()
+                         if word not in _PRUNED_WORDS_PT])
     return text
 
 
@@ -14,21 +14,27 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from itertools import islice
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, \
+    Normalizer, replace_number_tokens, Prefilter
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _LONG_ORDINAL_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, \
-    _FRACTION_STRING_RU, _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
-    _ORDINAL_BASE_RU
+    _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
+    _ORDINAL_BASE_RU, _FRACTIONS_RU
 
 import re
 import json
-from lingua_franca import resolve_resource_file
+from lingua_franca import read_resource_file
 from lingua_franca.time import now_local
 
+# extract_datetime_ru reads day ordinals as "пятого" for "пятый"
+_PREFILTER_RU = Prefilter((__name__, "lingua_franca.lang.common_data_ru",
+                           "lingua_franca.lang.format_ru"), stem_length=2)
+
 
 def generate_plurals_ru(originals):
     """
@@ -194,14 +200,11 @@ def _extract_numbers_with_text_ru(tokens, short_scale=True,
         if not to_replace:
             break
 
+        if not results:
+            # replace on a copy, the caller's tokens are left as they are
+            tokens = list(tokens)
         results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
+        replace_number_tokens(tokens, to_replace, placeholder)
     results.sort(key=lambda n: n.start_index)
     return results
 
@@ -565,7 +568,7 @@ def _extract_whole_number_with_text_ru(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx + 1:]:
+                for other_token in islice(tokens, idx + 1, None):
                     if other_token.word in multiplies:
                         if string_num_scale[other_token.word] >= current_val:
                             time_to_sum = False
@@ -584,11 +587,15 @@ def _extract_whole_number_with_text_ru(tokens, short_scale, ordinals):
     return val, number_words
 
 
+_NUMBER_DATA_RU = {}
+
+
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are generated once and shared, they must not be modified.
 
     Args:
         short_scale boolean:
@@ -598,6 +605,10 @@ def _initialize_number_data(short_scale):
         multiplies, string_num_ordinal, string_num_scale
 
     """
+    short_scale = bool(short_scale)
+    if short_scale in _NUMBER_DATA_RU:
+        return _NUMBER_DATA_RU[short_scale]
+
     multiplies = _MULTIPLIES_SHORT_SCALE_RU if short_scale \
         else _MULTIPLIES_LONG_SCALE_RU
 
@@ -607,7 +618,9 @@ def _initialize_number_data(short_scale):
     string_num_scale_ru = _SHORT_SCALE_RU if short_scale else _LONG_SCALE_RU
     string_num_scale_ru = invert_dict(string_num_scale_ru)
     string_num_scale_ru.update(generate_plurals_ru(string_num_scale_ru))
-    return multiplies, string_num_ordinal_ru, string_num_scale_ru
+    _NUMBER_DATA_RU[short_scale] = \
+        multiplies, string_num_ordinal_ru, string_num_scale_ru
+    return _NUMBER_DATA_RU[short_scale]
 
 
 def extract_number_ru(text, short_scale=True, ordinals=False):
@@ -626,6 +639,8 @@ def extract_number_ru(text, short_scale=True, ordinals=False):
                                    was found
 
     """
+    if not _PREFILTER_RU.search(text):
+        return False
     return _extract_number_with_text_ru(tokenize(text.lower()),
                                         short_scale, ordinals).value
 
@@ -658,6 +673,8 @@ def extract_duration_ru(text):
     """
     if not text:
         return None
+    if not _PREFILTER_RU.search(text):
+        return (None, " ".join(text.lower().split()))
 
     # Russian inflection for time: минута, минуты, минут - safe to use минута as pattern
     # For day: день, дня, дней - short pattern not applicable, list all
@@ -787,6 +804,8 @@ def extract_datetime_ru(text, anchor_date=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_RU.search(text):
+        return None
 
     anchor_date = anchor_date or now_local()
     found = False
@@ -1566,14 +1585,9 @@ def is_fractional_ru(input_str, short_scale=True):
     """
     if input_str[-3:] in ["тые", "тых"]:  # leading number is bigger than one (две четвёртые, три пятых)
         input_str = input_str[-3:] + "тая"
-    fractions = {"целая": 1}  # first four numbers have little different format
-
-    for num in _FRACTION_STRING_RU:  # Numbers from 2 to 1 hundred, more is not usually used in common speech
-        if num > 1:
-            fractions[_FRACTION_STRING_RU[num]] = num
-
-    if input_str.lower() in fractions:
-        return 1.0 / fractions[input_str.lower()]
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_RU:
+        return 1.0 / _FRACTIONS_RU[input_str]
     return False
 
 
@@ -1591,14 +1605,16 @@ def extract_numbers_ru(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
+    if not _PREFILTER_RU.search(text):
+        return []
     results = _extract_numbers_with_text_ru(tokenize(text),
                                             short_scale, ordinals)
     return [float(result.value) for result in results]
 
 
 class RussianNormalizer(Normalizer):
-    with open(resolve_resource_file("text/ru-ru/normalize.json"), encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = json.loads(
+        read_resource_file("text/ru-ru/normalize.json"))
 
 
 def normalize_ru(text, remove_articles=True):
@@ -1606,6 +1622,65 @@ def normalize_ru(text, remove_articles=True):
     return RussianNormalizer().normalize(text, remove_articles)
 
 
+def _inflection_tables_ru():
+    """
+    Build the tables of _text_ru_inflection_normalize.
+
+    Returns:
+        {arg: {inflected word: normalized word}}, and the table of
+        the other args
+
+    """
+    common = {"тысяч": "тысяча", "тысячи": "тысяча"}
+
+    numbers = dict(common)  # _extract_whole_number_with_text_ru
+    for words, normalized in ((["одна", "одним", "одно", "одной"], "один"),
+                              (["две"], "два"),
+                              (["пару"], "пара")):
+        for word in words:
+            numbers.setdefault(word, normalized)
+
+    datetimes = dict(common)  # extract_datetime_ru
+    for words, normalized in (
+            (["часа", "часам", "часами", "часов", "часу"], "час"),
+            (["минут", "минутам", "минутами", "минуту", "минуты"], "минута"),
+            (["секунд", "секундам", "секундами", "секунду", "секунды"],
+             "секунда"),
+            (["дней", "дни"], "день"),
+            (["неделе", "недели", "недель"], "неделя"),
+            (["месяца", "месяцев"], "месяц"),
+            (["года", "лет"], "год"),
+            (_WORDS_MORNING_RU, "утром"),
+            (["полудне", "полудня"], "полдень"),
+            (_WORDS_EVENING_RU, "вечером"),
+            (_WORDS_NIGHT_RU, "ночь"),
+            (["викенд", "выходным", "выходных"], "выходные"),
+            (["столетие", "столетий", "столетия"], "век"),
+            # Week days
+            (["среду", "среды"], "среда"),
+            (["пятницу", "пятницы"], "пятница"),
+            (["субботу", "субботы"], "суббота"),
+            # Months
+            (["марта", "марте"], "март"),
+            (["мае", "мая"], "май"),
+            (["августа", "августе"], "август")):
+        for word in words:
+            datetimes.setdefault(word, normalized)
+    # months ending in "ь", inflected as "...ле", "...ля", "...не", "...ня",
+    # "...ре" and "...ря"
+    for name in _MONTHS_RU:
+        if name.endswith("ь"):
+            for ending in "ея":
+                word = name[:-1] + ending
+                if word[-2:] in ["ле", "ля", "не", "ня", "ре", "ря"]:
+                    datetimes.setdefault(word, name)
+
+    return {1: numbers, 2: datetimes}, common
+
+
+_INFLECTIONS_RU, _INFLECTIONS_OTHER_RU = _inflection_tables_ru()
+
+
 def _text_ru_inflection_normalize(word, arg):
     """
     Russian Inflection normalizer.
@@ -1621,65 +1696,4 @@ def _text_ru_inflection_normalize(word, arg):
         word [Word]
 
     """
-    if word in ["тысяч", "тысячи"]:
-        return "тысяча"
-
-    if arg == 1:  # _extract_whole_number_with_text_ru
-        if word in ["одна", "одним", "одно", "одной"]:
-            return "один"
-        if word == "две":
-            return "два"
-        if word == "пару":
-            return "пара"
-
-    elif arg == 2:  # extract_datetime_ru
-        if word in ["часа", "часам", "часами", "часов", "часу"]:
-            return "час"
-        if word in ["минут", "минутам", "минутами", "минуту", "минуты"]:
-            return "минута"
-        if word in ["секунд", "секундам", "секундами", "секунду", "секунды"]:
-            return "секунда"
-        if word in ["дней", "дни"]:
-            return "день"
-        if word in ["неделе", "недели", "недель"]:
-            return "неделя"
-        if word in ["месяца", "месяцев"]:
-            return "месяц"
-        if word in ["года", "лет"]:
-            return "год"
-        if word in _WORDS_MORNING_RU:
-            return "утром"
-        if word in ["полудне", "полудня"]:
-            return "полдень"
-        if word in _WORDS_EVENING_RU:
-            return "вечером"
-        if word in _WORDS_NIGHT_RU:
-            return "ночь"
-        if word in ["викенд", "выходным", "выходных"]:
-            return "выходные"
-        if word in ["столетие", "столетий", "столетия"]:
-            return "век"
-
-        # Week days
-        if word in ["среду", "среды"]:
-            return "среда"
-        if word in ["пятницу", "пятницы"]:
-            return "пятница"
-        if word in ["субботу", "субботы"]:
-            return "суббота"
-
-        # Months
-        if word in ["марта", "марте"]:
-            return "март"
-        if word in ["мае", "мая"]:
-            return "май"
-        if word in ["августа", "августе"]:
-            return "август"
-
-        if word[-2:] in ["ле", "ля", "не", "ня", "ре", "ря"]:
-            tmp = word[:-1] + "ь"
-            for name in _MONTHS_RU:
-                if name == tmp:
-                    return name
-
-    return word
+    return _INFLECTIONS_RU.get(arg, _INFLECTIONS_OTHER_RU).get(word, word)
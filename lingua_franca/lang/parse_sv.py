@@ -19,7 +19,11 @@ from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 
 from .parse_common import (is_numeric, look_for_fractions, Normalizer,
-                           tokenize, Token)
+                           tokenize, Token, Prefilter)
+from .common_data_sv import _FRACTIONS_SV
+
+_PREFILTER_SV = Prefilter((__name__, "lingua_franca.lang.common_data_sv",
+                           "lingua_franca.lang.format_sv"))
 
 
 def _find_numbers_in_text(tokens):
@@ -40,20 +44,46 @@ def _find_numbers_in_text(tokens):
     """
     parts = []
     for tok in tokens:
-        res = extract_number_sv(tok.word)
+        res = _duration_number_sv(tok.word)
         if res:
-            parts.insert(0, (res, tok))
+            parts.append((res, tok))
             # Special case for quarter of an hour
             if tok.word == 'kvart':
-                parts.insert(0, (None, Token('timmar', index=-1)))
-        elif tok.word in ['halvtimme', 'halvtimma']:
-            parts.insert(0, (30, tok))
-            parts.insert(0, (None, Token('minuter', index=-1)))
+                parts.append((None, Token('timmar', index=-1)))
+        elif tok.word in ('halvtimme', 'halvtimma'):
+            parts.append((30, tok))
+            parts.append((None, Token('minuter', index=-1)))
         else:
-            parts.insert(0, (None, tok))
+            parts.append((None, tok))
+    parts.reverse()
     return parts
 
 
+def _duration_number_sv(word):
+    """The number a single word is, as extract_number_sv would find it.
+
+    Args:
+        word (str): a token of the text
+
+    Returns:
+        (int) or (float) or (bool): the number, False if the word isn't one
+    """
+    word = word.lower()
+    val = _DURATION_NUMBERS_SV.get(word)
+    if val is not None:
+        return val
+    if is_numeric(word):
+        return float(word)
+    val = is_fractional_sv(word)
+    if val:
+        return val
+    # look for fractions like "2/3"
+    pieces = word.split('/')
+    if look_for_fractions(pieces):
+        return float(pieces[0]) / float(pieces[1])
+    return False
+
+
 def _combine_adjacent_numbers(number_map):
     """Combine adjacent numbers through multiplication.
 
@@ -110,6 +140,8 @@ def extract_duration_sv(text):
                     be None if no duration is found. The text returned
                     will have whitespace stripped from the ends.
     """
+    if not _PREFILTER_SV.search(text):
+        return None
     tokens = tokenize(text)
     number_tok_map = _find_numbers_in_text(tokens)
     # Combine adjacent numbers
@@ -152,6 +184,7 @@ def extract_duration_sv(text):
                     state = None
 
     td = timedelta(**states)
+    consumed = set(consumed)
     remainder = ' '.join([t.word for t in tokens if t not in consumed])
     return (td, remainder) if valid else None
 
@@ -165,6 +198,8 @@ def extract_number_sv(text, short_scale=True, ordinals=False):
     Returns:
         (int) or (float): The value of extracted number
     """
+    if not _PREFILTER_SV.search(text):
+        return False
     # TODO: short_scale and ordinals don't do anything here.
     # The parameters are present in the function signature for API
     # compatibility reasons.
@@ -295,6 +330,8 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
 
     if text == "":
         return None
+    if not _PREFILTER_SV.search(text):
+        return None
 
     anchorDate = anchorDate or now_local()
     found = False
@@ -884,38 +921,40 @@ def is_fractional_sv(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "halva"
 
-    aFrac = ["hel", "halv", "tredjedel", "fjärdedel", "femtedel", "sjättedel",
-             "sjundedel", "åttondel", "niondel", "tiondel", "elftedel",
-             "tolftedel"]
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if input_str == "kvart":
-        return 1.0 / 4
+    input_str = input_str.lower()
+    if input_str in _FRACTIONS_SV:
+        return 1.0 / _FRACTIONS_SV[input_str]
     if input_str == "trekvart":
         return 3.0 / 4
 
     return False
 
 
+# The words extract_number_sv knows by name, with the number each one is
+# on its own, so the duration parser needn't run it on every token.
+_DURATION_NUMBERS_SV = {word: extract_number_sv(word) for word in (
+    "första", "andra", "tredje", "fjärde", "femte", "sjätte",
+    "en", "ett", "två", "tre", "fyra", "fem", "sex", "sju", "åtta", "nio",
+    "tio")}
+
+
+_TEXT_NUMBERS_SV = {word: str(num) for num, word in enumerate(
+    ["noll", "ett", "två", "tre", "fyra", "fem", "sex", "sju", "åtta", "nio",
+     "tio", "elva", "tolv", "tretton", "fjorton", "femton", "sexton",
+     "sjutton", "arton", "nitton", "tjugo"])}
+_TEXT_NUMBERS_SV["en"] = _TEXT_NUMBERS_SV["ett"]
+
+
 def normalize_sv(text, remove_articles=True):
     """ English string normalization """
 
     words = text.split()  # this also removed extra spaces
-    normalized = ''
+    normalized = []
     for word in words:
         # Convert numbers into digits, e.g. "two" -> "2"
-        if word == 'en':
-            word = 'ett'
-        textNumbers = ["noll", "ett", "två", "tre", "fyra", "fem", "sex",
-                       "sju", "åtta", "nio", "tio", "elva", "tolv",
-                       "tretton", "fjorton", "femton", "sexton",
-                       "sjutton", "arton", "nitton", "tjugo"]
-        if word in textNumbers:
-            word = str(textNumbers.index(word))
-
-        normalized += " " + word
-
-    return normalized[1:]  # strip the initial space
+        normalized.append(_TEXT_NUMBERS_SV.get(word, word))
+
+    return " ".join(normalized)
 
 
 class SwedishNormalizer(Normalizer):
@@ -14,12 +14,19 @@
 # limitations under the License.
 #
 
+import heapq
+from collections import Counter
 from difflib import SequenceMatcher
+from importlib import import_module
 from warnings import warn
-from lingua_franca.time import now_local
+from dateutil.relativedelta import relativedelta
+from lingua_franca import config
+from lingua_franca.time import now_local, to_local
+from lingua_franca.lang.parse_common import Normalizer, Token
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, get_full_lang_code, get_primary_lang_code, \
-    get_default_lang, localized_function, _raise_unsupported_language
+    get_default_lang, localized_function, _raise_unsupported_language, \
+    _resolve_lang_code, _route_language
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
@@ -73,8 +80,265 @@ def match_one(query, choices):
         return best
 
 
+def _rank_choices(queries, choices, k, offset=0):
+    """
+        Score every query against every choice, keeping the k best per query
+
+        A single SequenceMatcher is reused for all comparisons: choices are
+        set as its second sequence (which difflib preprocesses and caches)
+        once each, and the cheap upper bounds real_quick_ratio() and
+        quick_ratio() skip the full ratio() for choices that cannot make
+        the top k.
+
+        Args:
+            queries (list): strings to test
+            choices (list): strings to match against
+            k (int): number of matches to keep per query
+            offset (int): added to the returned choice indexes
+
+        Returns:
+            list: for each query, a list of (score, choice index) tuples,
+                  best match first, ties in choice order
+    """
+    heaps = [[] for _ in queries]
+    if k <= 0:
+        return heaps
+    matcher = SequenceMatcher(None)
+    for idx, choice in enumerate(choices, offset):
+        matcher.set_seq2(choice)
+        for query, heap in zip(queries, heaps):
+            matcher.set_seq1(query)
+            # an equal score never displaces an earlier choice
+            if len(heap) == k:
+                if matcher.real_quick_ratio() <= heap[0][0] or \
+                        matcher.quick_ratio() <= heap[0][0]:
+                    continue
+            score = matcher.ratio()
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -idx))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, -idx))
+    return [[(score, -idx) for score, idx in sorted(heap, reverse=True)]
+            for heap in heaps]
+
+
+def _rank_choices_parallel(queries, choices, k, processes):
+    # imported here, multiprocessing takes longer to import than the rest
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = -(-len(choices) // processes)
+    ranked = [[] for _ in queries]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_rank_choices, queries,
+                                   choices[start:start + chunk_size],
+                                   k, start)
+                   for start in range(0, len(choices), chunk_size)]
+        for future in futures:
+            for merged, result in zip(ranked, future.result()):
+                merged.extend(result)
+    return [sorted(r, key=lambda x: (-x[0], x[1]))[:k] for r in ranked]
+
+
+def match_many(queries, choices, k=1, processes=None):
+    """
+        Find the best matches for several queries from a list or dictionary
+
+        Gives the same scores as fuzzy_match, but shares the preprocessing
+        of each choice across all queries and skips comparisons which cannot
+        improve on the matches found so far.
+
+        Args:
+            queries (list): strings to test
+            choices (list): list or dictionary of choices
+            k (int): number of matches to return per query, no matches
+                     when it is 0 or less
+            processes (int, optional): split the choices across a pool of
+                                       this many processes
+
+        Returns:
+            list: for each query, a list of (match, score) tuples,
+                  best match first
+    """
+    if isinstance(choices, dict):
+        _choices = list(choices.keys())
+    elif isinstance(choices, list):
+        _choices = choices
+    else:
+        raise ValueError('a list or dict of choices must be provided')
+
+    queries = list(queries)
+    if processes and processes > 1 and k > 0 and \
+            len(_choices) > processes:
+        ranked = _rank_choices_parallel(queries, _choices, k, processes)
+    else:
+        ranked = _rank_choices(queries, _choices, k)
+
+    if isinstance(choices, dict):
+        return [[(choices[_choices[idx]], score) for score, idx in r]
+                for r in ranked]
+    else:
+        return [[(_choices[idx], score) for score, idx in r] for r in ranked]
+
+
+def rank(query, choices, k=1, processes=None):
+    """
+        Find the k best matches from a list or dictionary given an input
+
+        Args:
+            query (str): string to test
+            choices (list): list or dictionary of choices
+            k (int): number of matches to return
+            processes (int, optional): split the choices across a pool of
+                                       this many processes
+
+        Returns:
+            list: (match, score) tuples, best match first
+    """
+    return match_many([query], choices, k, processes)[0]
+
+
+# FuzzyIndex.add() without a value, None is a valid one
+_NO_VALUE = object()
+
+
+class FuzzyIndex:
+    """
+        Preprocessed collection of choices for repeated fuzzy matching
+
+        Choices are indexed by their character n-grams once, so a query only
+        needs to be scored (with fuzzy_match) against the choices sharing the
+        most n-grams with it, rather than against every choice as match_one
+        does. Indexes with no more than `exact_threshold` choices are always
+        scored exhaustively, giving the same results as match_one.
+
+        Args:
+            choices (list): list or dictionary of choices
+            ngram_size (int): length of the indexed character n-grams
+            shortlist_size (int): number of candidates scored per query
+            exact_threshold (int): size up to which every choice is scored
+    """
+
+    def __init__(self, choices=None, ngram_size=3, shortlist_size=64,
+                 exact_threshold=128):
+        self.ngram_size = ngram_size
+        self.shortlist_size = shortlist_size
+        self.exact_threshold = exact_threshold
+        self._values = {}
+        self._ngrams = {}
+        self._order = {}
+        self._index = {}
+        self._added = 0
+        if choices is not None:
+            self.update(choices)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, choice):
+        return choice in self._values
+
+    def _get_ngrams(self, text):
+        text = " " + text.lower() + " "
+        if len(text) <= self.ngram_size:
+            return {text}
+        return {text[i:i + self.ngram_size]
+                for i in range(len(text) - self.ngram_size + 1)}
+
+    def add(self, choice, value=_NO_VALUE):
+        """
+            Add a choice to the index
+
+            Args:
+                choice (str): string to match queries against
+                value (any): returned in place of choice when matched,
+                             defaults to the choice itself
+        """
+        if choice in self._values:
+            self.remove(choice)
+        self._values[choice] = choice if value is _NO_VALUE else value
+        self._order[choice] = self._added
+        self._added += 1
+        ngrams = self._get_ngrams(choice)
+        self._ngrams[choice] = ngrams
+        for ngram in ngrams:
+            self._index.setdefault(ngram, set()).add(choice)
+
+    def update(self, choices):
+        """
+            Add several choices to the index
+
+            Args:
+                choices (list): list or dictionary of choices
+        """
+        if isinstance(choices, dict):
+            for choice, value in choices.items():
+                self.add(choice, value)
+        elif isinstance(choices, list):
+            for choice in choices:
+                self.add(choice)
+        else:
+            raise ValueError('a list or dict of choices must be provided')
+
+    def remove(self, choice):
+        """
+            Remove a choice from the index
+
+            Args:
+                choice (str): a previously added choice
+        """
+        del self._values[choice]
+        del self._order[choice]
+        for ngram in self._ngrams.pop(choice):
+            matches = self._index[ngram]
+            matches.discard(choice)
+            if not matches:
+                del self._index[ngram]
+
+    def _candidates(self, query):
+        if len(self._values) <= self.exact_threshold:
+            return list(self._values)
+        overlap = Counter()
+        for ngram in self._get_ngrams(query):
+            overlap.update(self._index.get(ngram, ()))
+        if not overlap:
+            return list(self._values)
+        return [c for c, _ in overlap.most_common(self.shortlist_size)]
+
+    def match(self, query, k=1):
+        """
+            Find the best matches for a query
+
+            Args:
+                query (str): string to test
+                k (int): maximum number of matches to return
+
+            Returns:
+                list: (match, score) tuples, best match first
+        """
+        # ties are kept in insertion order, as match_one does
+        candidates = sorted(self._candidates(query),
+                            key=self._order.__getitem__)
+        return [(self._values[candidates[idx]], score)
+                for score, idx in _rank_choices([query], candidates, k)[0]]
+
+    def match_one(self, query):
+        """
+            Find the best match for a query
+
+            Args:
+                query (str): string to test
+
+            Returns:
+                tuple: (best match, score)
+        """
+        if not self._values:
+            raise ValueError('the index does not contain any choices')
+        return self.match(query, 1)[0]
+
+
 @localized_function()
-def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
+def extract_numbers(text, short_scale=True, ordinals=False, lang='',
+                    analysis=None):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -86,14 +350,19 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
         lang (str, optional): an optional BCP-47 language code, if omitted
-                              the default language will be used.
+                              the default language will be used,
+                              "auto" picks it from the text.
+        analysis (optional): the analysis attribute of a TextAnalysis,
+            used when it is of this text with the same options. Ignored
+            otherwise, see TextAnalysis.
     Returns:
         list: list of extracted numbers as floats, or empty list if none found
     """
 
 
 @localized_function()
-def extract_number(text, short_scale=True, ordinals=False, lang=''):
+def extract_number(text, short_scale=True, ordinals=False, lang='',
+                   analysis=None):
     """Takes in a string and extracts a number.
 
     Args:
@@ -104,7 +373,11 @@ def extract_number(text, short_scale=True, ordinals=False, lang=''):
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
         lang (str, optional): an optional BCP-47 language code, if omitted
-                              the default language will be used.
+                              the default language will be used,
+                              "auto" picks it from the text.
+        analysis (optional): the analysis attribute of a TextAnalysis,
+            used when it is of this text with the same options. Ignored
+            otherwise, see TextAnalysis.
     Returns:
         (int, float or False): The number extracted or False if the input
                                text contains no numbers
@@ -112,7 +385,7 @@ def extract_number(text, short_scale=True, ordinals=False, lang=''):
 
 
 @localized_function()
-def extract_duration(text, lang=''):
+def extract_duration(text, lang='', analysis=None):
     """Convert an english phrase into a number of seconds.
 
     The function handles durations from seconds up to days.
@@ -134,7 +407,11 @@ def extract_duration(text, lang=''):
     Args:
         text (str): string containing a duration
         lang (str, optional): an optional BCP-47 language code, if omitted
-                              the default language will be used.
+                              the default language will be used,
+                              "auto" picks it from the text.
+        analysis (optional): the analysis attribute of a TextAnalysis,
+            used when it is of this text with the same options. Ignored
+            otherwise, see TextAnalysis.
 
     Returns:
         (timedelta, str):
@@ -146,7 +423,8 @@ def extract_duration(text, lang=''):
 
 
 @localized_function()
-def extract_datetime(text, anchorDate=None, lang='', default_time=None):
+def extract_datetime(text, anchorDate=None, lang='', default_time=None,
+                     context=None, analysis=None):
     """
     Extracts date and time information from a sentence.  Parses many of the
     common ways that humans express dates and times, including relative dates
@@ -164,9 +442,17 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
         anchorDate (:obj:`datetime`, optional): the date to be used for
             relative dating (for example, what does "tomorrow" mean?).
             Defaults to the current local date/time.
-        lang (str): the BCP-47 code for the language to use, None uses default
+        lang (str): the BCP-47 code for the language to use, None uses
+            default, "auto" picks it from the text.
         default_time (datetime.time): time to use if none was found in
             the input string.
+        context (DateParseContext, optional): values precomputed for
+            anchorDate, used when anchorDate is the context's anchor date
+            and the language's parser supports it. Ignored otherwise, see
+            DateParseContext.
+        analysis (optional): the analysis attribute of a TextAnalysis,
+            used when it is of this text with the same options. Ignored
+            otherwise, see TextAnalysis.
 
     Returns:
         [:obj:`datetime`, :obj:`str`]: 'datetime' is the extracted date
@@ -199,8 +485,363 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+class DateParseContext:
+    """
+        Anchor-relative state for parsing many texts against one anchor date
+
+        The anchor date is resolved (and made timezone aware) once, along
+        with the values the parsers derive from it on every call: the
+        weekday and year of the anchor, the day offsets to each weekday and
+        the dates one month after and before it. Calls still go through
+        extract_datetime(), the parsers that take a context (currently
+        english and german) use the precomputed values, the others ignore
+        it. Results are identical to calling extract_datetime with the same
+        arguments.
+
+        Example:
+            >>> context = DateParseContext(datetime(2017, 6, 27), lang="en")
+            >>> [context.extract_datetime(line) for line in lines]
+
+        Args:
+            anchorDate (:obj:`datetime`, optional): the date to be used for
+                relative dating. Defaults to the current local date/time,
+                taken once, when the context is created.
+            lang (str): the BCP-47 code for the language to use,
+                        None uses default
+            default_time (datetime.time): time to use if none was found in
+                the input string.
+    """
+
+    def __init__(self, anchorDate=None, lang='', default_time=None):
+        self.lang = _resolve_lang_code(lang)[1]
+        if anchorDate is None:
+            anchorDate = now_local()
+        elif anchorDate.tzinfo is None and config.inject_timezones:
+            anchorDate = to_local(anchorDate)
+        self.anchorDate = anchorDate
+        self.default_time = default_time
+        # derived from the anchor by the parsers on every call
+        self.weekday = int(anchorDate.strftime("%w"))
+        self.year = anchorDate.year
+        # days from the anchor to the coming monday..sunday, 0 for today
+        self.weekday_offsets = tuple(
+            (d + 1) - self.weekday + (7 if (d + 1) < self.weekday else 0)
+            for d in range(7))
+        # "next month" and "last month", clamped to the end of the month
+        self.month_dates = {
+            offset: (anchorDate + relativedelta(months=offset)).date()
+            for offset in (1, -1)}
+
+    def extract_datetime(self, text):
+        """
+            Extract date and time information from a sentence, relative to
+            this context's anchor date. See extract_datetime().
+
+            Args:
+                text (str): the text to be interpreted
+
+            Returns:
+                [:obj:`datetime`, :obj:`str`]: the extracted date and the
+                    leftover string, or None if no date or time was found.
+        """
+        return extract_datetime(text, self.anchorDate, self.lang,
+                                self.default_time, context=self)
+
+
+class IncrementalParser:
+    """
+        Parse the partial hypotheses of an utterance as they come in
+
+        Speech recognizers emit a growing, sometimes revised, transcript
+        while the user is still speaking. feed() takes the latest full
+        hypothesis and only tokenizes the words that changed since the
+        previous one. For languages that support it (currently english) the
+        numbers found in the unchanged words are kept as well, and only the
+        tail of the hypothesis is parsed again; other languages parse the
+        whole hypothesis. Results are the same as calling extract_numbers(),
+        extract_number(), extract_duration() or extract_datetime() on it.
+
+        Example:
+            >>> parser = IncrementalParser(lang="en")
+            >>> parser.feed("set a timer for twenty")
+            [20.0]
+            >>> parser.feed("set a timer for twenty five minutes")
+            [25.0]
+            >>> parser.extract_duration()
+            (datetime.timedelta(seconds=1500), 'set a timer for')
+
+        Args:
+            lang (str): the BCP-47 code for the language to use,
+                        None uses default
+            short_scale (bool): use short scale if True, long scale if False
+    """
+
+    def __init__(self, lang='', short_scale=True):
+        self.lang = get_primary_lang_code(lang)
+        self.short_scale = short_scale
+        self.text = ""
+        self.tokens = []
+        self._words = []
+        self._word_ends = []  # number of tokens up to and including a word
+        self._numbers = []
+        self._number = None
+        self._duration = None
+
+        module = import_module(".lang.parse_" + self.lang, "lingua_franca")
+        tracker = getattr(module, "IncrementalNumbers" + self.lang.upper(),
+                          None)
+        self._tracker = tracker(short_scale) if tracker else None
+
+    def feed(self, text):
+        """
+            Parse the latest hypothesis of the utterance
+
+            Args:
+                text (str): the full hypothesis, not just the new words
+
+            Returns:
+                list: the numbers found, same as extract_numbers()
+        """
+        words = text.split()
+        common = 0
+        for old, new in zip(self._words, words):
+            if old != new:
+                break
+            common += 1
+        stable = self._word_ends[common - 1] if common else 0
+
+        del self.tokens[stable:]
+        del self._word_ends[common:]
+        for word in words[common:]:
+            for part in Normalizer.tokenize(word):
+                self.tokens.append(Token(part, len(self.tokens)))
+            self._word_ends.append(len(self.tokens))
+        self._words = words
+        self.text = text
+        self._number = None
+        self._duration = None
+
+        if self._tracker:
+            self._numbers = self._tracker.update(self.tokens, stable)
+            return [float(number.value) for number in self._numbers]
+        self._numbers = extract_numbers(text, self.short_scale,
+                                        lang=self.lang)
+        return self._numbers
+
+    def extract_number(self):
+        """
+            The first number in the last hypothesis, see extract_number()
+
+            Returns:
+                (int, float or False): The number extracted or False if the
+                                       input text contains no numbers
+        """
+        if self._number is None:
+            if self._tracker:
+                self._number = self._tracker.extract_number(self.tokens)
+            else:
+                self._number = extract_number(self.text, self.short_scale,
+                                              lang=self.lang)
+        return self._number
+
+    def extract_duration(self):
+        """
+            The duration in the last hypothesis, see extract_duration()
+
+            Returns:
+                (timedelta, str): the duration found, or None, and the
+                                  remaining text
+        """
+        if not self.text:
+            return None
+        if self._duration is None:
+            if self._tracker and self.short_scale:
+                self._duration = self._tracker.extract_duration(
+                    self.tokens, self._numbers)
+            else:
+                self._duration = extract_duration(self.text, lang=self.lang)
+        return self._duration
+
+    def extract_datetime(self, anchorDate=None, default_time=None):
+        """
+            The date and time in the last hypothesis, see extract_datetime()
+
+            Dates are parsed from the whole hypothesis on every call.
+
+            Args:
+                anchorDate (:obj:`datetime`, optional): the date to be used
+                    for relative dating
+                default_time (datetime.time): time to use if none was found
+                    in the input string.
+
+            Returns:
+                [:obj:`datetime`, :obj:`str`]: the extracted date and the
+                    leftover string, or None if no date or time was found.
+        """
+        return extract_datetime(self.text, anchorDate, self.lang,
+                                default_time)
+
+
+class TextAnalysis:
+    """
+        The results of the parsers for one text, computed when first read
+
+        Intent handlers often call several parsers on the same utterance.
+        For languages that support it (currently english) the parsers then
+        share their work: the text is tokenized and its numbers are found
+        once, instead of once per parser. Other languages call the parse
+        functions. Either way every result is the same as calling the
+        function it is named after, and is only computed once.
+
+        The shared work is the analysis attribute, which the parse
+        functions take as their analysis argument. It is None for the
+        languages which don't share their work.
+
+        Use analyze() to create one.
+
+        Example:
+            >>> analysis = analyze("wake me up in twenty minutes", lang="en")
+            >>> analysis.duration
+            (datetime.timedelta(seconds=1200), 'wake me up in')
+            >>> analysis.numbers
+            [20.0]
+
+        Args:
+            text (str): the text to parse
+            lang (str): the BCP-47 code for the language to use,
+                        None uses default, "auto" picks it from the text
+            anchorDate (:obj:`datetime`, optional): the date to be used for
+                relative dating. Defaults to the current local date/time,
+                taken once, when the analysis is created.
+            default_time (datetime.time): time to use if no time was found
+            short_scale (bool): use short scale if True, long scale if False
+            ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+            remove_articles (bool): whether normalized removes articles
+    """
+
+    def __init__(self, text, lang='', anchorDate=None, default_time=None,
+                 short_scale=True, ordinals=False, remove_articles=True):
+        self.text = text
+        # the language the parse functions will run in
+        if lang == "auto":
+            lang = _route_language(text)
+        self.lang = _resolve_lang_code(lang)[0]
+        if anchorDate is None:
+            anchorDate = now_local()
+        elif anchorDate.tzinfo is None and config.inject_timezones:
+            anchorDate = to_local(anchorDate)
+        self.anchorDate = anchorDate
+        self.default_time = default_time
+        self.short_scale = short_scale
+        self.ordinals = ordinals
+        self.remove_articles = remove_articles
+        self._results = {}
+
+        # the parse functions are still called through their localized
+        # wrappers, the languages which share their work take the analysis
+        # as their analysis argument
+        module = import_module(".lang.parse_" + self.lang, "lingua_franca")
+        analysis = getattr(module, "TextAnalysis" + self.lang.upper(), None)
+        self.analysis = \
+            analysis(text, short_scale, ordinals) if analysis else None
+
+    @property
+    def number(self):
+        """ The first number in the text, see extract_number() """
+        if "number" not in self._results:
+            self._results["number"] = extract_number(
+                self.text, self.short_scale, self.ordinals, lang=self.lang,
+                analysis=self.analysis)
+        return self._results["number"]
+
+    @property
+    def numbers(self):
+        """ The numbers in the text, see extract_numbers() """
+        if "numbers" not in self._results:
+            self._results["numbers"] = extract_numbers(
+                self.text, self.short_scale, self.ordinals, lang=self.lang,
+                analysis=self.analysis)
+        return self._results["numbers"]
+
+    @property
+    def duration(self):
+        """ The duration in the text, see extract_duration() """
+        if "duration" not in self._results:
+            self._results["duration"] = extract_duration(
+                self.text, lang=self.lang, analysis=self.analysis)
+        return self._results["duration"]
+
+    @property
+    def datetime(self):
+        """ The date and time in the text, see extract_datetime() """
+        if "datetime" not in self._results:
+            self._results["datetime"] = extract_datetime(
+                self.text, self.anchorDate, lang=self.lang,
+                default_time=self.default_time, analysis=self.analysis)
+        return self._results["datetime"]
+
+    @property
+    def normalized(self):
+        """ The normalized text, see normalize() """
+        if "normalized" not in self._results:
+            self._results["normalized"] = normalize(
+                self.text, lang=self.lang,
+                remove_articles=self.remove_articles,
+                analysis=self.analysis)
+        return self._results["normalized"]
+
+
+def analyze(text, lang='', anchorDate=None, default_time=None,
+            short_scale=True, ordinals=False, remove_articles=True):
+    """
+        Parse a text once for all the parsers, see TextAnalysis
+
+        Args:
+            text (str): the text to parse
+            lang (str): the BCP-47 code for the language to use,
+                        None uses default, "auto" picks it from the text
+            anchorDate (:obj:`datetime`, optional): the date to be used for
+                relative dating. Defaults to the current local date/time.
+            default_time (datetime.time): time to use if no time was found
+            short_scale (bool): use short scale if True, long scale if False
+            ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+            remove_articles (bool): whether normalized removes articles
+
+        Returns:
+            TextAnalysis: with the number, numbers, duration, datetime and
+                          normalized text found in the text
+    """
+    return TextAnalysis(text, lang, anchorDate, default_time, short_scale,
+                        ordinals, remove_articles)
+
+
+def _warmup(lang):
+    """ Run the parsers once, see lingua_franca.warmup()
+
+    Args:
+        lang (str): the BCP-47 code for the language to warm up
+    """
+    now = now_local()
+    for function, args in ((extract_numbers, ("one two 3 and a half",)),
+                           (extract_number, ("twenty one point five",)),
+                           (extract_duration, ("one hour 5 minutes",)),
+                           (extract_datetime, ("tomorrow at 5 pm", now)),
+                           (normalize, ("it's the second of march",)),
+                           (get_gender, ("cat",)),
+                           (is_fractional, ("half",)),
+                           (is_ordinal, ("third",))):
+        try:
+            function(*args, lang=lang)
+        except NotImplementedError:
+            # not localized
+            pass
+        except Exception as e:
+            warn("warmup: {}() failed for '{}': {!r}".format(
+                function.__name__, lang, e))
+
+
 @localized_function()
-def normalize(text, lang='', remove_articles=True):
+def normalize(text, lang='', remove_articles=True, analysis=None):
     """Prepare a string for parsing
 
     This function prepares the given text for parsing by making
@@ -209,9 +850,13 @@ def normalize(text, lang='', remove_articles=True):
     Args:
         text (str): the string to normalize
         lang (str, optional): an optional BCP-47 language code, if omitted
-                              the default language will be used.
+                              the default language will be used,
+                              "auto" picks it from the text.
         remove_articles (bool): whether to remove articles (like 'a', or
                                 'the'). True by default.
+        analysis (optional): the analysis attribute of a TextAnalysis,
+            used when it is of this text with the same options. Ignored
+            otherwise, see TextAnalysis.
 
     Returns:
         (str): The normalized string.
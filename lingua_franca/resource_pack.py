@@ -0,0 +1,165 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Single file archive of the resource files
+
+A resource pack holds every file of a resource folder, plus an index to
+find them by their name relative to that folder ("text/en-us/day.word").
+It is memory mapped when opened, so reading a resource afterwards doesn't
+need any system call.
+
+The pack is built when the package is built (see setup.py), to build it
+for a source checkout run:
+
+    python -m lingua_franca.resource_pack
+
+The pack remembers the size and modification time of every file it was
+built from, so a checkout can tell when res/ was edited afterwards (see
+ResourcePack.is_stale()).
+
+This module only uses the standard library, so setup.py can load it
+without the package's dependencies.
+"""
+import json
+import mmap
+import os
+import struct
+
+_MAGIC = b"LFRES"
+_VERSION = 2
+# magic, version, length of the index
+_HEADER = struct.Struct("<5sHI")
+
+DEFAULT_RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "res")
+DEFAULT_PACK = DEFAULT_RES_DIR + ".pack"
+
+
+def build_resource_pack(res_dir=DEFAULT_RES_DIR, filename=DEFAULT_PACK):
+    """ Pack all files in a resource folder into a single file
+
+    Args:
+        res_dir (str): the resource folder
+        filename (str): the pack to write, replaced if it exists
+    """
+    index = {}
+    contents = []
+    offset = 0
+    for path, directories, filenames in os.walk(res_dir):
+        directories.sort()
+        for name in sorted(filenames):
+            full_name = os.path.join(path, name)
+            with open(full_name, "rb") as f:
+                content = f.read()
+            res_name = os.path.relpath(full_name, res_dir)
+            index[res_name.replace(os.sep, "/")] = \
+                (offset, len(content), os.stat(full_name).st_mtime_ns)
+            contents.append(content)
+            offset += len(content)
+
+    index = json.dumps(index, separators=(",", ":")).encode("utf8")
+    temporary = filename + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(index)))
+        f.write(index)
+        for content in contents:
+            f.write(content)
+    os.replace(temporary, filename)
+
+
+class ResourcePack:
+    """ A memory mapped resource pack
+
+    Args:
+        filename (str): the pack, as written by build_resource_pack()
+
+    Raises:
+        ValueError: if the file isn't a pack, or of another version
+    """
+
+    def __init__(self, filename=DEFAULT_PACK):
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_size = _HEADER.unpack_from(self._map)
+        except struct.error:
+            magic = version = None
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            raise ValueError("{} is not a version {} resource "
+                             "pack".format(filename, _VERSION))
+        start = _HEADER.size
+        self._index = json.loads(self._map[start:start + index_size])
+        self._data_start = start + index_size
+
+    def __contains__(self, res_name):
+        return res_name in self._index
+
+    def names(self):
+        """ The names of the packed resources
+
+        Returns:
+            list(str)
+        """
+        return list(self._index)
+
+    def read(self, res_name):
+        """ Read a packed resource
+
+        Args:
+            res_name (str): name relative to the resource folder, with "/"
+                            as separator
+
+        Returns:
+            bytes: the resource's content
+
+        Raises:
+            KeyError: if the resource isn't in the pack
+        """
+        offset, size, _ = self._index[res_name]
+        offset += self._data_start
+        return self._map[offset:offset + size]
+
+    def is_stale(self, res_dir=DEFAULT_RES_DIR):
+        """ Check if the resource folder changed since the pack was built
+
+        Only the names, sizes and modification times of the files are
+        compared, their contents aren't read.
+
+        Args:
+            res_dir (str): the resource folder the pack was built from
+
+        Returns:
+            bool: True if a file was added, removed or modified
+        """
+        names = set()
+        for path, directories, filenames in os.walk(res_dir):
+            for name in filenames:
+                full_name = os.path.join(path, name)
+                res_name = os.path.relpath(full_name, res_dir)
+                res_name = res_name.replace(os.sep, "/")
+                if res_name not in self._index:
+                    return True
+                _, size, mtime = self._index[res_name]
+                stat = os.stat(full_name)
+                if stat.st_size != size or stat.st_mtime_ns != mtime:
+                    return True
+                names.add(res_name)
+        return len(names) != len(self._index)
+
+
+if __name__ == "__main__":
+    build_resource_pack()
+    print("wrote " + DEFAULT_PACK)
@@ -18,12 +18,44 @@ from dateutil.tz import gettz, tzlocal
 
 
 __default_tz = None
+__local_tz = None
+__tz_cache = {}
+
+_UTC = gettz("UTC")
+
+
+def get_timezone(name):
+    """ Look up a timezone by name, caching the result
+
+    Args:
+        name (str): a timezone name understood by dateutil,
+                    e.g. "Europe/Lisbon"
+
+    Returns:
+        (datetime.tzinfo): the timezone, or None if it is unknown
+    """
+    try:
+        return __tz_cache[name]
+    except KeyError:
+        tz = __tz_cache[name] = gettz(name)
+        return tz
 
 
 def set_default_tz(tz):
-    global __default_tz
+    """ Set the default timezone
+
+    Also invalidates the cached timezones, including the system timezone,
+    so passing None picks up changes to the system settings.
+
+    Args:
+        tz (str or datetime.tzinfo): timezone or timezone name,
+                                     None to use the system timezone
+    """
+    global __default_tz, __local_tz
+    __tz_cache.clear()
+    __local_tz = None
     if isinstance(tz, str):
-        tz = gettz(tz)
+        tz = get_timezone(tz)
     __default_tz = tz
 
 
@@ -37,7 +69,12 @@ def default_timezone():
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    return __default_tz or tzlocal()
+    global __local_tz
+    if __default_tz:
+        return __default_tz
+    if __local_tz is None:
+        __local_tz = tzlocal()
+    return __local_tz
 
 
 def now_utc():
@@ -71,11 +108,10 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
-    tzUTC = gettz("UTC")
     if dt.tzinfo:
-        return dt.astimezone(tzUTC)
+        return dt.astimezone(_UTC)
     else:
-        return dt.replace(tzinfo=gettz("UTC")).astimezone(tzUTC)
+        return dt.replace(tzinfo=_UTC)
 
 
 def to_local(dt):
@@ -90,5 +126,5 @@ def to_local(dt):
     if dt.tzinfo:
         return dt.astimezone(tz)
     else:
-        return dt.replace(tzinfo=gettz("UTC")).astimezone(tz)
+        return dt.replace(tzinfo=_UTC).astimezone(tz)
 
@@ -1,6 +1,8 @@
 import os
+from importlib.util import module_from_spec, spec_from_file_location
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 
 def package_files(directory):
@@ -20,6 +22,30 @@ def required(requirements_file):
                 if pkg.strip() and not pkg.startswith("#")]
 
 
+class BuildPyWithResourcePack(build_py):
+    """ Pack the resource files, see lingua_franca/resource_pack.py
+
+    The package reads its resources from the pack, the files in res/ are
+    only packed and aren't installed themselves.
+    """
+    def run(self):
+        self.data_files = [
+            (package, src_dir, build_dir,
+             [name for name in filenames
+              if os.path.normpath(name).split(os.sep)[0] != 'res'])
+            for package, src_dir, build_dir, filenames in self.data_files]
+        super().run()
+        # loaded by path, the package's requirements may not be installed
+        spec = spec_from_file_location(
+            "resource_pack", os.path.join("lingua_franca", "resource_pack.py"))
+        resource_pack = module_from_spec(spec)
+        spec.loader.exec_module(resource_pack)
+        if not self.dry_run:
+            resource_pack.build_resource_pack(
+                os.path.join("lingua_franca", "res"),
+                os.path.join(self.build_lib, "lingua_franca", "res.pack"))
+
+
 extra_files = package_files('lingua_franca')
 
 with open("readme.md", "r") as fh:
@@ -34,6 +60,7 @@ setup(
     package_data={'': extra_files},
     include_package_data=True,
     install_requires=required('requirements.txt'),
+    cmdclass={'build_py': BuildPyWithResourcePack},
     author='Mycroft AI',
     author_email='dev@mycroft.ai',
     description='Mycroft\'s multilingual text parsing and formatting library',
@@ -0,0 +1,138 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from lingua_franca import load_language, unload_language, aio, config
+from lingua_franca.format import nice_number
+from lingua_franca.parse import extract_datetime, extract_numbers
+from lingua_franca.time import set_default_tz
+
+
+def setUpModule():
+    load_language("en")
+
+
+def tearDownModule():
+    unload_language("en")
+
+
+class TestAsyncio(unittest.TestCase):
+    def setUp(self):
+        self.executor = None
+
+    def tearDown(self):
+        aio.configure()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def test_same_results(self):
+        date = datetime(2017, 6, 27, 13, 4)
+
+        async def run():
+            return await asyncio.gather(
+                aio.extract_datetime("tomorrow at 5 pm", date, lang="en"),
+                aio.extract_numbers("two and three", lang="en"),
+                aio.nice_number(5.5, lang="en"))
+
+        self.assertEqual(asyncio.run(run()),
+                         [extract_datetime("tomorrow at 5 pm", date,
+                                           lang="en"),
+                          extract_numbers("two and three", lang="en"),
+                          nice_number(5.5, lang="en")])
+
+    def test_coalesce(self):
+        calls = []
+
+        def slow(text, times=1):
+            calls.append(text)
+            time.sleep(0.05)
+            return text * times
+
+        async def run():
+            return await asyncio.gather(aio.run(slow, "a"),
+                                        aio.run(slow, "a"),
+                                        aio.run(slow, "a", times=2),
+                                        aio.run(slow, ["a"]),
+                                        aio.run(slow, ["a"]))
+
+        self.assertEqual(asyncio.run(run()),
+                         ["a", "a", "aa", ["a"], ["a"]])
+        # the unhashable list arguments can't be coalesced
+        self.assertEqual(len(calls), 4)
+
+    def test_coalesce_config(self):
+        calls = []
+
+        def slow(text):
+            calls.append(text)
+            time.sleep(0.05)
+            return text
+
+        async def call_and_change(change):
+            first = asyncio.ensure_future(aio.run(slow, "a"))
+            await asyncio.sleep(0)
+            change()
+            return await asyncio.gather(first, aio.run(slow, "a"))
+
+        def inject_timezones():
+            config.inject_timezones = False
+
+        def default_tz():
+            set_default_tz("Europe/Lisbon")
+
+        try:
+            for change in (inject_timezones, default_tz):
+                calls.clear()
+                asyncio.run(call_and_change(change))
+                # a call made with other settings runs on its own
+                self.assertEqual(len(calls), 2)
+        finally:
+            config.inject_timezones = True
+            set_default_tz(None)
+
+    def test_max_concurrency(self):
+        lock = threading.Lock()
+        running = [0]
+        most = [0]
+
+        def work(number):
+            with lock:
+                running[0] += 1
+                most[0] = max(most[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return number
+
+        async def run():
+            return await asyncio.gather(*[aio.run(work, n)
+                                          for n in range(12)])
+
+        self.executor = ThreadPoolExecutor(8)
+        aio.configure(self.executor, max_concurrency=2)
+        self.assertEqual(asyncio.run(run()), list(range(12)))
+        self.assertEqual(most[0], 2)
+        with self.assertRaises(ValueError):
+            aio.configure(max_concurrency=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
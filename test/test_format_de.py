@@ -79,6 +79,10 @@ class TestNiceResponse(unittest.TestCase):
                          "der einunddreißigste mai")
         self.assertEqual(nice_response_de("10 ^ 2"),
                          "10 hoch 2")
+        self.assertEqual(nice_response_de("am 3. mai sind es 10 ^ 2 grad"),
+                         "am dritten mai sind es 10 hoch 2 grad")
+        self.assertEqual(nice_response_de("kein datum\n\nhier"),
+                         "kein datum\n\nhier")
 
 
 class TestNiceNumberFormat(unittest.TestCase):
@@ -77,6 +77,8 @@ class TestNiceResponse(unittest.TestCase):
                          "éénendertig mei")
         self.assertEqual(nice_response_nl("10 ^ 2"),
                          "10 tot de macht 2")
+        self.assertEqual(nice_response_nl("op 5 mei of de 12 juni"),
+                         "op vijf mei of de twaalfde juni")
 
 
 class TestNiceNumberFormat(unittest.TestCase):
@@ -1,6 +1,11 @@
+import gc
+import json
+import os
 import unittest
 
 from sys import version
+from tempfile import TemporaryDirectory
+from warnings import catch_warnings, simplefilter
 
 import lingua_franca
 import lingua_franca.parse
@@ -182,6 +187,26 @@ class TestLanguageLoading(unittest.TestCase):
         with self.assertRaises(TypeError):
             lingua_franca._set_active_langs(157.75)
 
+    def test_warmup(self):
+        unload_all_languages()
+        with catch_warnings(record=True) as caught:
+            simplefilter("always")
+            lingua_franca.warmup(['en', 'hu', 'ca', 'it'], freeze=False)
+        # functions that aren't localized are skipped quietly
+        self.assertEqual([str(w.message) for w in caught
+                          if "warmup" in str(w.message)], [])
+        self.assertEqual(lingua_franca.get_active_langs(),
+                         ['en', 'hu', 'ca', 'it'])
+        self.assertEqual(lingua_franca.get_default_lang(), 'en')
+        self.assertIn('hu-hu',
+                      lingua_franca.format.date_time_format.lang_config)
+        lingua_franca.warmup('es')
+        self.assertGreater(gc.get_freeze_count(), 0)
+        gc.unfreeze()
+        self.assertEqual(lingua_franca.parse.extract_number('dos',
+                                                            lang='es'), 2)
+        unload_all_languages()
+
 
 class TestLocalizerEdgeCases(unittest.TestCase):
     def test_pass_lang_code_positionally(self):
@@ -200,6 +225,152 @@ class TestLocalizerEdgeCases(unittest.TestCase):
         unload_all_languages()
 
 
+class TestStats(unittest.TestCase):
+    def tearDown(self):
+        lingua_franca.disable_stats()
+        lingua_franca.stats(reset=True)
+        lingua_franca.config.load_langs_on_demand = False
+        unload_all_languages()
+
+    def test_disabled_by_default(self):
+        lingua_franca.load_language('en')
+        lingua_franca.parse.extract_number('one')
+        self.assertEqual(lingua_franca.stats(), {})
+
+    def test_stats(self):
+        exported = []
+        lingua_franca.load_language('en')
+        lingua_franca.enable_stats(
+            exporter=lambda *call: exported.append(call))
+        lingua_franca.parse.extract_number('one')
+        lingua_franca.parse.extract_number('two', lang='en-us')
+        lingua_franca.format.nice_duration(90)
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal('twelve')
+        lingua_franca.config.load_langs_on_demand = True
+        lingua_franca.parse.extract_number('uno', lang='es')
+
+        stats = lingua_franca.stats(reset=True)
+        extract_number = stats['parse.extract_number']['en']
+        self.assertEqual(extract_number['calls'], 2)
+        self.assertEqual(extract_number['errors'], 0)
+        self.assertEqual(sum(n for _, n in extract_number['histogram']), 2)
+        self.assertEqual(extract_number['histogram'][-1][0], float('inf'))
+        self.assertGreater(extract_number['total_seconds'], 0)
+        self.assertEqual(
+            stats['parse.extract_number']['es']['on_demand_loads'], 1)
+        # nice_duration isn't localized in English, the generic one is
+        # used, and it pronounces the numbers in English
+        nice_duration = stats['format.nice_duration']['en']
+        self.assertEqual(nice_duration['fallbacks'], 1)
+        self.assertEqual(nice_duration['exceptions'],
+                         {'FunctionNotLocalizedError': 1})
+        self.assertIn('en', stats['format.pronounce_number'])
+        is_ordinal = stats['parse.is_ordinal']['en']
+        self.assertEqual((is_ordinal['errors'], is_ordinal['fallbacks']),
+                         (1, 0))
+
+        # nice_duration pronounced "one" minute and "thirty" seconds
+        self.assertEqual(len(exported), 7)
+        name, lang, seconds, error = exported[-1]
+        self.assertEqual((name, lang, error),
+                         ('parse.extract_number', 'es', None))
+        self.assertIsInstance(
+            [call for call in exported if call[0] == 'parse.is_ordinal'][0][3],
+            lingua_franca.internal.FunctionNotLocalizedError)
+        self.assertEqual(lingua_franca.stats(), {})
+
+        lingua_franca.disable_stats()
+        lingua_franca.parse.extract_number('one')
+        self.assertEqual(lingua_franca.stats(), {})
+
+    def test_stats_analyze(self):
+        lingua_franca.load_language('en')
+        lingua_franca.enable_stats()
+        analysis = lingua_franca.parse.analyze('twenty minutes')
+        analysis.number
+        analysis.duration
+        analysis.duration
+        lingua_franca.config.load_langs_on_demand = True
+        lingua_franca.parse.analyze('veinte minutos', lang='es').number
+
+        stats = lingua_franca.stats()
+        self.assertEqual(stats['parse.extract_number']['en']['calls'], 1)
+        self.assertEqual(stats['parse.extract_duration']['en']['calls'], 1)
+        self.assertEqual(
+            stats['parse.extract_number']['es']['on_demand_loads'], 1)
+
+    def test_stats_date_parse_context(self):
+        lingua_franca.load_language('en')
+        lingua_franca.enable_stats()
+        context = lingua_franca.parse.DateParseContext(lang='en')
+        context.extract_datetime('next friday')
+        context.extract_datetime('in two weeks')
+
+        stats = lingua_franca.stats()
+        self.assertEqual(stats['parse.extract_datetime']['en']['calls'], 2)
+
+    def test_stats_auto_lang(self):
+        lingua_franca.load_languages(['en', 'es'])
+        lingua_franca.enable_stats()
+        lingua_franca.parse.extract_number('diez minutos', lang='auto')
+        lingua_franca.parse.extract_number('diez minutos', True, False,
+                                           'auto')
+        stats = lingua_franca.stats()
+        self.assertEqual(stats['parse.extract_number']['es']['calls'], 2)
+        self.assertEqual(list(stats['parse.extract_number']), ['es'])
+
+
+class TestSlowCallLog(unittest.TestCase):
+    def tearDown(self):
+        lingua_franca.disable_slow_call_log()
+        lingua_franca.slow_calls(clear=True)
+        unload_all_languages()
+
+    def test_slow_calls(self):
+        lingua_franca.load_language('en')
+        lingua_franca.enable_slow_call_log(threshold_ms=0, max_entries=2)
+        lingua_franca.parse.extract_number('one')
+        lingua_franca.parse.extract_number('two', lang='en-us')
+        lingua_franca.parse.extract_numbers('three four')
+        calls = lingua_franca.slow_calls()
+        self.assertEqual([call['args'] for call in calls],
+                         [['two'], ['three four']])
+        self.assertEqual(calls[0]['kwargs'], {'lang': 'en-us'})
+        self.assertEqual(calls[0]['function'], 'parse.extract_number')
+        self.assertEqual(calls[0]['lang'], 'en')
+        self.assertIsNone(calls[0]['error'])
+        self.assertIsNone(calls[0]['profile'])
+
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal('twelve')
+        self.assertIn('FunctionNotLocalizedError',
+                      lingua_franca.slow_calls()[-1]['error'])
+
+        with TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'slow_calls.jsonl')
+            self.assertEqual(lingua_franca.dump_slow_calls(filename,
+                                                           clear=True), 2)
+            with open(filename) as f:
+                dumped = [json.loads(line) for line in f]
+        self.assertEqual(dumped[0]['args'], ['three four'])
+        self.assertEqual(lingua_franca.slow_calls(), [])
+
+        lingua_franca.enable_slow_call_log(threshold_ms=0, profile=True)
+        lingua_franca.parse.extract_number('one')
+        profile = lingua_franca.slow_calls()[-1]['profile']
+        self.assertTrue(any('extract_number_en' in row['function']
+                            for row in profile))
+
+        lingua_franca.enable_slow_call_log(threshold_ms=10000)
+        lingua_franca.parse.extract_number('one')
+        lingua_franca.disable_slow_call_log()
+        lingua_franca.parse.extract_number('one', lang='en', ordinals=True)
+        self.assertEqual(len(lingua_franca.slow_calls()), 1)
+
+
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
         unload_all_languages()
@@ -20,12 +20,15 @@ from dateutil import tz
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.time import default_timezone
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, DateParseContext
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import fuzzy_match
+from lingua_franca.parse import IncrementalParser
+from lingua_franca.parse import analyze
+from lingua_franca.parse import FuzzyIndex
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import match_one
+from lingua_franca.parse import match_one, match_many, rank
 from lingua_franca.parse import normalize
 
 
@@ -60,6 +63,71 @@ class TestFuzzyMatch(unittest.TestCase):
         self.assertEqual(match_one('frank', choices)[0], 1)
         self.assertEqual(match_one('enry', choices)[0], 4)
 
+    def test_rank(self):
+        choices = ['frank', 'kate', 'harry', 'henry']
+        self.assertEqual(rank('fran', choices, k=1)[0],
+                         match_one('fran', choices))
+        self.assertEqual([m for m, _ in rank('henri', choices, k=2)],
+                         ['henry', 'harry'])
+        self.assertEqual(len(rank('henri', choices, k=10)), 4)
+        choices = {'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4}
+        self.assertEqual(rank('enry', choices)[0], (4, fuzzy_match('enry',
+                                                                   'henry')))
+
+    def test_match_many(self):
+        choices = ['frank', 'kate', 'harry', 'henry', 'frankie', 'kathy']
+        queries = ['frank', 'fran', 'enry', 'katt', 'xyz']
+        self.assertEqual([r[0] for r in match_many(queries, choices)],
+                         [match_one(q, choices) for q in queries])
+        for query, ranked in zip(queries, match_many(queries, choices, k=3)):
+            expected = sorted(((c, fuzzy_match(query, c)) for c in choices),
+                              key=lambda x: -x[1])[:3]
+            self.assertEqual(ranked, expected)
+        self.assertEqual(match_many(queries, choices, k=2, processes=2),
+                         match_many(queries, choices, k=2))
+        with self.assertRaises(ValueError):
+            match_many(queries, 'frank')
+        # no matches asked for
+        for k in (0, -1):
+            self.assertEqual(match_many(queries, choices, k=k),
+                             [[] for _ in queries])
+            self.assertEqual(match_many(queries, choices, k=k, processes=2),
+                             [[] for _ in queries])
+            self.assertEqual(rank('fran', choices, k=k), [])
+            self.assertEqual(FuzzyIndex(choices).match('fran', k=k), [])
+
+    def test_fuzzy_index(self):
+        choices = ['frank', 'kate', 'harry', 'henry']
+        index = FuzzyIndex(choices)
+        for query in ('frank', 'fran', 'enry', 'katt', 'xyz'):
+            self.assertEqual(index.match_one(query), match_one(query, choices))
+        self.assertEqual([m for m, _ in index.match('henri', k=2)],
+                         ['henry', 'harry'])
+        choices = {'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4}
+        index = FuzzyIndex(choices)
+        self.assertEqual(index.match_one('enry'), match_one('enry', choices))
+        index.remove('henry')
+        self.assertNotIn('henry', index)
+        self.assertEqual(index.match_one('enry')[0], 3)
+        index.add('henry', 5)
+        self.assertEqual(index.match_one('enry')[0], 5)
+        index.add('henry', None)
+        self.assertEqual(index.match_one('enry'),
+                         (None, fuzzy_match('enry', 'henry')))
+        index.update({'kate': None})
+        self.assertIsNone(index.match_one('kate')[0])
+        with self.assertRaises(ValueError):
+            FuzzyIndex().match_one('frank')
+
+    def test_fuzzy_index_shortlist(self):
+        choices = ['contact number {}'.format(i) for i in range(500)]
+        choices += ['frank sinatra', 'frankie valli', 'kate bush']
+        index = FuzzyIndex(choices, shortlist_size=10, exact_threshold=0)
+        self.assertEqual(index.match_one('frank sinatr'),
+                         match_one('frank sinatr', choices))
+        self.assertEqual(index.match_one('kate bosh')[0], 'kate bush')
+        self.assertEqual(len(index.match('contact', k=5)), 5)
+
 
 class TestNormalize(unittest.TestCase):
     def test_articles(self):
@@ -714,6 +782,153 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_datetime('in 2007', date)[0],
                          datetime(2007, 6, 27, tzinfo=date.tzinfo))
 
+    def test_date_parse_context(self):
+        date = datetime(2017, 6, 27, 13, 4)
+        default_time = time(15, 4)
+        context = DateParseContext(date, lang="en-us",
+                                   default_time=default_time)
+        self.assertEqual(context.weekday, 2)
+        self.assertEqual(context.year, 2017)
+        self.assertEqual(context.weekday_offsets, (6, 0, 1, 2, 3, 4, 5))
+        self.assertEqual(context.month_dates,
+                         {1: datetime(2017, 7, 27).date(),
+                          -1: datetime(2017, 5, 27).date()})
+        load_language("de-de")
+        texts = {"en-us": ["remind me next tuesday at 5 pm",
+                           "what's the weather like on friday",
+                           "in 2007", "in a couple of weeks",
+                           "set an alarm for tomorrow morning",
+                           "what happened last month",
+                           "remind me next month",
+                           "in 3 months", "next monday",
+                           "3 days after sunday",
+                           "nothing to see here"],
+                 "de-de": ["erinnere mich nächsten dienstag um 5 uhr",
+                           "wie ist das wetter am freitag",
+                           "nächsten monat", "letzten monat",
+                           "in 3 monaten", "von montag",
+                           "übermorgen", "nichts zu sehen"]}
+        # sunday, the last day of a month, the 31st before a 30 day month
+        for date in (datetime(2017, 6, 27, 13, 4), datetime(2017, 6, 25),
+                     datetime(2017, 1, 31, 8), datetime(2016, 3, 31)):
+            for lang in texts:
+                context = DateParseContext(date, lang=lang,
+                                           default_time=default_time)
+                for text in texts[lang]:
+                    self.assertEqual(
+                        context.extract_datetime(text),
+                        extract_datetime(text, date, lang=lang,
+                                         default_time=default_time))
+        unload_language("de-de")
+        # calls go through extract_datetime(), loaded check included
+        context = DateParseContext(date, lang="hu")
+        with self.assertRaises(ModuleNotFoundError):
+            context.extract_datetime("holnap")
+        load_language("hu")
+        with self.assertRaises(FunctionNotLocalizedError):
+            context.extract_datetime("holnap")
+        unload_language("hu")
+
+    def test_incremental_parser(self):
+        date = datetime(2017, 6, 27, 13, 4)
+        load_language("de-de")
+        for lang in ("en-us", "de-de"):
+            parser = IncrementalParser(lang=lang)
+            hypotheses = ["set", "set a timer", "set a timer for twenty",
+                          "set a timer for twenty five minutes",
+                          "set a timer for twenty five minutes and a half",
+                          "set a timer for twenty five minutes and the",
+                          "set a timer for twenty five minutes and then "
+                          "two point five hours", "set a time",
+                          "remind me tomorrow at 5th one",
+                          "two thousand five hundred apples",
+                          "two thousand five hundred apples and one",
+                          "two thousand five hundred apples and one million",
+                          "two thousand five hundred apples and one million "
+                          "pears", ""]
+            for text in hypotheses:
+                self.assertEqual(parser.feed(text),
+                                 extract_numbers(text, lang=lang))
+                self.assertEqual(parser.extract_number(),
+                                 extract_number(text, lang=lang))
+                self.assertEqual(parser.extract_duration(),
+                                 extract_duration(text, lang=lang))
+                self.assertEqual(parser.extract_datetime(date),
+                                 extract_datetime(text, date, lang=lang))
+        unload_language("de-de")
+
+    def test_analyze(self):
+        date = datetime(2017, 6, 27, 13, 4)
+        default_time = time(15, 4)
+        load_language("de-de")
+        for lang, texts in (
+                ("en-us", ["set a timer for Twenty five minutes",
+                           "what's the weather like next Friday at 3",
+                           "I'd like two and a half cups of the flour",
+                           "the third one in 2 hours",
+                           "ninety nine bottles of beer",
+                           "remind me tomorrow", "nothing to see here",
+                           ""]),
+                ("de-de", ["stelle einen Timer für fünf Minuten",
+                           "erinnere mich morgen um 3 uhr", ""])):
+            for text in texts:
+                analysis = analyze(text, lang, date, default_time)
+                self.assertEqual(analysis.datetime,
+                                 extract_datetime(text, date, lang=lang,
+                                                  default_time=default_time))
+                self.assertEqual(analysis.numbers,
+                                 extract_numbers(text, lang=lang))
+                self.assertEqual(analysis.number,
+                                 extract_number(text, lang=lang))
+                self.assertEqual(analysis.duration,
+                                 extract_duration(text, lang=lang))
+                self.assertEqual(analysis.normalized,
+                                 normalize(text, lang=lang))
+        unload_language("de-de")
+
+        # the parse functions take the shared work, and ignore it when it
+        # is of another text
+        text = "set a timer for twenty five minutes"
+        shared = analyze(text, "en-us").analysis
+        self.assertIsNotNone(shared)
+        self.assertEqual(extract_number(text, analysis=shared), 25)
+        self.assertEqual(extract_duration(text, analysis=shared),
+                         extract_duration(text))
+        self.assertEqual(extract_number("ten", analysis=shared), 10)
+        self.assertEqual(normalize("one two", analysis=shared), "1 2")
+
+        # checked like the parse functions check their lang
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(analyze("twenty", "xx").number,
+                             extract_number("twenty"))
+        unload_language("en")
+        with self.assertRaises(ModuleNotFoundError):
+            analyze("twenty", "en").number
+        load_language("en")
+        set_default_lang("en")
+
+    def test_auto_lang(self):
+        date = datetime(2017, 6, 27, 13, 4)
+        load_language("es-es")
+        load_language("de-de")
+        self.assertEqual(extract_number("set a timer for ten minutes",
+                                        lang="auto"), 10)
+        self.assertEqual(extract_number("pon un temporizador de diez minutos",
+                                        True, False, "auto"), 10)
+        self.assertEqual(extract_duration("wecke mich in zwanzig minuten",
+                                          lang="auto"),
+                         extract_duration("wecke mich in zwanzig minuten",
+                                          lang="de"))
+        self.assertEqual(extract_datetime("mañana a las 5", date,
+                                          lang="auto"),
+                         extract_datetime("mañana a las 5", date, lang="es"))
+        # nothing tells, the default language is used
+        self.assertEqual(extract_numbers("1 2 3", lang="auto"), [1, 2, 3])
+        analysis = analyze("pon un temporizador de diez minutos", "auto")
+        self.assertEqual(analysis.lang, "es")
+        self.assertEqual(analysis.number, 10)
+        unload_language("es-es")
+        unload_language("de-de")
 
     def test_extractdatetime_with_default_time_en(self):
         def extractWithFormat(text):
@@ -995,6 +1210,23 @@ class TestNormalize(unittest.TestCase):
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
+    def test_scale_word_lookahead(self):
+        # a scale word only looks ahead for a larger one within its own
+        # number, these used to give 200500
+        text = "two thousand five hundred apples and one million pears"
+        self.assertEqual(extract_number(text), 2500)
+        self.assertEqual(extract_numbers(text), [2500, 1e6])
+        self.assertEqual(extract_duration(text),
+                         (None, "2500 apples and 1000000 pears"))
+        self.assertEqual(extract_duration("wait two thousand five hundred "
+                                          "seconds and one million pears"),
+                         (timedelta(seconds=2500),
+                          "wait  and 1000000 pears"))
+        self.assertEqual(normalize(text), "2500 apples and 1000000 pears")
+        # within one number it still does, as before
+        self.assertEqual(extract_number("two thousand five hundred "
+                                        "million"), 200500e6)
+
     def test_contractions(self):
         self.assertEqual(normalize("ain't"), "is not")
         self.assertEqual(normalize("aren't"), "are not")
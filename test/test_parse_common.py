@@ -13,9 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
+import copy
+import os
+import pickle
 import unittest
+from collections import Counter
+from datetime import datetime
+from glob import glob
+from importlib import import_module
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from lingua_franca import config
+from lingua_franca.lang.parse_common import tokenize, Token, \
+    ReplaceableNumber, replace_number_tokens, CompoundSegmenter, \
+    WordParser, packrat, Prefilter, LanguageRouter
+
+_PARSER_LANGS = sorted(
+    os.path.basename(path)[6:-3] for path in
+    glob(os.path.join(os.path.dirname(__file__), "..", "lingua_franca",
+                      "lang", "parse_*.py"))
+    if not path.endswith("parse_common.py"))
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +50,225 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+    def test_replaceable_number(self):
+        tokens = tokenize('two hundred apples')
+        number = ReplaceableNumber(200, tokens[:2])
+        self.assertEqual(number.value, 200)
+        self.assertEqual(number.text, 'two hundred')
+        self.assertEqual((number.start_index, number.end_index), (0, 1))
+        self.assertTrue(number)
+        self.assertFalse(ReplaceableNumber(None, []))
+        with self.assertRaises(Exception):
+            number.value = 3
+        with self.assertRaises(Exception):
+            number.other = 3
+
+    def test_replaceable_number_copies(self):
+        number = ReplaceableNumber(200, tokenize('two hundred apples')[:2])
+        for copied in (copy.copy(number), copy.deepcopy(number),
+                       pickle.loads(pickle.dumps(number))):
+            self.assertIsInstance(copied, ReplaceableNumber)
+            self.assertEqual(copied.value, 200)
+            self.assertEqual(copied.tokens, number.tokens)
+            with self.assertRaises(Exception):
+                copied.value = 3
+
+    def test_replace_number_tokens(self):
+        tokens = tokenize('I have two hundred apples')[2:]
+        replace_number_tokens(tokens,
+                              ReplaceableNumber(200, tokens[:2]), '_')
+        self.assertEqual(tokens,
+                         [Token('_', 2), Token('_', 3), Token('apples', 4)])
+
+    def test_compound_segmenter(self):
+        segmenter = CompoundSegmenter({'cento': 100, 'cent': 100,
+                                       'otto': 8, 'tre': 3})
+        self.assertEqual(segmenter.segment('centotre'), [100, 3])
+        # the longest morpheme is only taken if the rest can be split
+        self.assertEqual(segmenter.segment('centotto'), [100, 8])
+        self.assertIsNone(segmenter.segment('centottox'))
+        self.assertIsNone(segmenter.segment(''))
+
+    def test_packrat(self):
+        calls = []
+
+        class Parser(WordParser):
+            __slots__ = ()
+
+            @packrat
+            def one(self, i):
+                calls.append(i)
+                return self.constant(i, 'one')
+
+        parser = Parser(['one', 'two'])
+        self.assertEqual(parser.one(0), ('one', 1))
+        self.assertEqual(parser.one(0), ('one', 1))
+        self.assertIsNone(parser.one(1))
+        self.assertIsNone(parser.one(1))
+        self.assertIsNone(parser.one(2))
+        self.assertEqual(calls, [0, 1, 2])
+
+
+class TestPrefilter(unittest.TestCase):
+    def tearDown(self):
+        config.prefilter = True
+
+    def test_search(self):
+        prefilter = Prefilter(("lingua_franca.lang.common_data_en",),
+                              context_words=("and",))
+        self.assertTrue(prefilter.search("Seventy apples"))
+        self.assertTrue(prefilter.search("room 101"))
+        self.assertTrue(prefilter.search("inf"))
+        # long words may be part of a word, short ones must start one and
+        # those of one or two letters must be whole
+        self.assertTrue(prefilter.search("seventyfold"))
+        self.assertTrue(prefilter.search("one-way"))
+        self.assertTrue(prefilter.search("ones"))
+        self.assertFalse(prefilter.search("someone"))
+        self.assertFalse(prefilter.search("stop"))
+        self.assertFalse(prefilter.search("salt and pepper"))
+        self.assertFalse(prefilter.search(""))
+
+        config.prefilter = False
+        self.assertTrue(prefilter.search("salt and pepper"))
+
+    def test_stems(self):
+        config.prefilter = True
+        prefilter = Prefilter(("lingua_franca.lang.common_data_cs",),
+                              stem_length=1)
+        self.assertTrue(prefilter.search("dvě pětiny"))
+        self.assertFalse(prefilter.search("dobrý večer"))
+        prefilter = Prefilter(("lingua_franca.lang.parse_es",),
+                              translation=str.maketrans("áéó", "aeo"))
+        self.assertTrue(prefilter.search("el juevés"))
+        self.assertFalse(prefilter.search("buenas"))
+
+    def test_messages(self):
+        """ The words of messages and keyword arguments are no triggers """
+        words = Prefilter(("lingua_franca.lang.parse_nl",
+                           "lingua_franca.lang.format_nl")).words()
+        # raise ValueError('dt.hour is bigger than 24')
+        self.assertNotIn("bigger", words)
+        # date.replace(tzinfo=...)
+        self.assertNotIn("tzinfo", words)
+        self.assertIn("dertien", words)
+        # _FUNCTION_NOT_IMPLEMENTED_WARNING
+        words = Prefilter(("lingua_franca.lang.common_data_en",)).words()
+        self.assertNotIn("implemented", words)
+        self.assertIn("seventeen", words)
+
+    def assert_unchanged(self, lang, texts):
+        """ The parsers of lang return the same with the prefilter off """
+        module = import_module("lingua_franca.lang.parse_" + lang)
+        prefilter = getattr(module, "_PREFILTER_" + lang.upper(), None)
+        if prefilter is None:
+            return
+        anchor = datetime(2017, 6, 27, 13, 4)
+        functions = ("extract_number", "extract_numbers",
+                     "extract_duration", "extract_datetime")
+        # the prefilter only changes the result of texts it rejects
+        texts = sorted(text for text in texts if not prefilter.search(text))
+        for name in functions:
+            function = getattr(module, name + "_" + lang, None)
+            if function is None:
+                continue
+            for text in texts:
+                args = (text, anchor) if name == "extract_datetime" \
+                    else (text,)
+                config.prefilter = False
+                try:
+                    expected = function(*args)
+                except Exception:
+                    continue
+                config.prefilter = True
+                self.assertEqual(function(*args), expected,
+                                 (lang, name, text))
+
+    def test_test_corpus(self):
+        """ The prefilter doesn't change what the parsers return """
+        test_dir = os.path.dirname(__file__)
+        for lang in _PARSER_LANGS:
+            test_files = glob(os.path.join(test_dir, "test_*_%s.py" % lang))
+            if lang == "en":
+                test_files += [os.path.join(test_dir, "test_parse.py"),
+                               os.path.join(test_dir, "test_format.py")]
+            texts = set()
+            for test_file in test_files:
+                with open(test_file, encoding="utf-8") as f:
+                    tree = ast.parse(f.read())
+                texts.update(node.value for node in ast.walk(tree)
+                             if isinstance(node, ast.Constant) and
+                             isinstance(node.value, str))
+            self.assert_unchanged(lang, texts)
+
+    def test_inflections(self):
+        """ Nor for single words, inflected or with other endings """
+        self.assert_unchanged("cs", ["pětiny", "třetiny", "poloviny"])
+        self.assert_unchanged("ca", ["cinquens", "sisens", "novens",
+                                     "dinovens", "cinquena", "migs"])
+        self.assert_unchanged("it", ["noni", "interi", "tredue"])
+        self.assert_unchanged("es", ["juevés", "mayó"])
+        self.assert_unchanged("ru", ["пятого", "двенадцатого"])
+        self.assert_unchanged("da", ["ente", "tidel", "syvnde"])
+        self.assert_unchanged("de", ["einte", "elften"])
+        self.assert_unchanged("en", ["infst", "nanth"])
+        for lang in _PARSER_LANGS:
+            module = import_module("lingua_franca.lang.parse_" + lang)
+            prefilter = getattr(module, "_PREFILTER_" + lang.upper(), None)
+            if prefilter is None:
+                continue
+            words = prefilter.words()
+            # each word, cut by up to two letters, with the most common
+            # endings of the words of the language
+            endings = Counter(word[-length:] for word in words
+                              for length in (1, 2) if len(word) > length + 2)
+            endings = [""] + [ending for ending, _ in endings.most_common(8)]
+            self.assert_unchanged(lang, {
+                word[:len(word) - cut] + ending for word in words
+                for cut in (0, 1, 2) if len(word) - cut >= 2
+                for ending in endings})
+
+
+class TestLanguageRouter(unittest.TestCase):
+    def test_route(self):
+        router = LanguageRouter(("en", "es", "de", "fr", "ru", "fa"))
+        self.assertEqual(router.route("set a timer for ten minutes"), "en")
+        self.assertEqual(router.route("pon un temporizador de diez minutos"),
+                         "es")
+        self.assertEqual(router.route("wecke mich in zwanzig minuten"), "de")
+        self.assertEqual(router.route("réveille-moi dans vingt minutes"),
+                         "fr")
+        self.assertEqual(router.route("через двадцать минут"), "ru")
+        self.assertEqual(router.route("بیست دقیقه"), "fa")
+        # nothing tells, the default or the first language
+        self.assertEqual(router.route("42", default="de"), "de")
+        self.assertEqual(router.route("42", default="pt"), "en")
+        self.assertEqual(router.route(""), "en")
+
+        scores = router.scores("twenty")
+        self.assertEqual(len(scores), 6)
+        self.assertEqual(max(scores), scores[0])
+
+    def test_test_corpus(self):
+        """ Most texts the parsers are tested with are routed to them """
+        test_dir = os.path.dirname(__file__)
+        langs = ("ca", "cs", "da", "de", "en", "es", "eu", "fa", "fr", "it",
+                 "nl", "pl", "pt", "ru", "sv")
+        router = LanguageRouter(langs)
+        routed = total = 0
+        for lang in langs:
+            test_file = "test_parse.py" if lang == "en" else \
+                "test_parse_%s.py" % lang
+            with open(os.path.join(test_dir, test_file),
+                      encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+            texts = {node.args[0].value for node in ast.walk(tree)
+                     if isinstance(node, ast.Call) and node.args and
+                     isinstance(node.args[0], ast.Constant) and
+                     isinstance(node.args[0].value, str) and
+                     getattr(node.func, "id", "").startswith(
+                         ("extract_", "normalize"))}
+            routed += sum(router.route(text) == lang for text in texts)
+            total += len(texts)
+        self.assertGreater(routed / total, 0.75)
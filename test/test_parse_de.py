@@ -82,6 +82,13 @@ class TestNormalize(unittest.TestCase):
                          3.0 / 4.0)
         self.assertEqual(extract_number("Drei Viertel Tassen", lang="de-de"),
                          3.0 / 4.0)
+        self.assertEqual(extract_number("zweihundertdreiundvierzig Tassen",
+                                        lang="de-de"), 243)
+        self.assertEqual(extract_number("eintausendeins Nächte",
+                                        lang="de-de"), 1001)
+        self.assertEqual(extract_number("der hundertste Test",
+                                        lang="de-de"), 100)
+        self.assertFalse(extract_number("zweizwei Tassen", lang="de-de"))
 
     def test_extractdatetime_de(self):
         def extractWithFormat(text):
@@ -19,7 +19,8 @@ import unittest
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (normalize, extract_numbers, extract_number,
                                  extract_datetime)
-from lingua_franca.lang.parse_es import extract_datetime_es, is_fractional_es
+from lingua_franca.lang.parse_es import extract_datetime_es, \
+    is_fractional_es, _es_number_parse, _NumberParserES
 from lingua_franca.time import default_timezone
 
 
@@ -90,6 +91,30 @@ class TestNormalize(unittest.TestCase):
             lang="es"),
             "999999")
 
+    def test_number_parser_es(self):
+        # (number, next word index) at each index, as parsed before the
+        # grammar was memoized
+        expected = {
+            "había doscientos treinta y cuatro mil y cinco vacas":
+                [None, (234000, 6), (34000, 6), None, (4000, 6), None, None,
+                 (5, 8), None, None],
+            "novecientos noventa y nueve mil novecientos noventa y nueve":
+                [(999999, 9), (99999, 9), None, (9999, 9), None, (999, 9),
+                 (99, 9), None, (9, 9), None],
+            "dos millones trescientos mil cien":
+                [(2, 1), None, (300100, 5), None, (100, 5), None],
+            "quinientas veinticinco mil y veinte":
+                [(525000, 3), (25000, 3), None, None, (20, 5), None],
+            "un millón de dólares":
+                [(1, 1), None, None, None, None]
+        }
+        for sentence, results in expected.items():
+            words = sentence.split()
+            parser = _NumberParserES(words)
+            for i, result in enumerate(results):
+                self.assertEqual(parser.number(i), result)
+                self.assertEqual(_es_number_parse(words, i), result)
+
     def test_extract_number_es(self):
         self.assertEqual(sorted(extract_numbers(
             "1 7 cuatro catorce ocho 157", lang='es')), [1, 4, 7, 8, 14, 157])
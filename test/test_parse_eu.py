@@ -19,7 +19,8 @@ import unittest
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (normalize, extract_numbers, extract_number,
                                  extract_datetime)
-from lingua_franca.lang.parse_eu import is_fractional_eu
+from lingua_franca.lang.parse_eu import is_fractional_eu, eu_number_parse, \
+    _NumberParserEU
 
 
 
@@ -90,6 +91,31 @@ class TestNormalize(unittest.TestCase):
             lang="eu"),
             "999999")
 
+    def test_number_parser_eu(self):
+        # (number, next word index) at each index, as parsed before the
+        # grammar was memoized
+        expected = {
+            "berrehun eta hogeita hiru mila eta bost behi":
+                [(223000, 5), None, (23000, 5), (3000, 5), None, None,
+                 (5, 7), None, None],
+            "bederatzirehun eta laurogeita hemeretzi mila bederatzirehun "
+            "eta laurogeita hemeretzi":
+                [(999999, 9), None, (99999, 9), (19999, 9), None, (999, 9),
+                 None, (99, 9), (19, 9), None],
+            "bi milioi hirurehun mila eta ehun":
+                [(2, 1), None, (300000, 4), None, None, (100, 6), None],
+            "mila eta bederatziehun eta laurogeita zortzi":
+                [None, None, None, None, (88, 6), (8, 6), None]
+        }
+        for sentence, results in expected.items():
+            words = sentence.split()
+            parser = _NumberParserEU(words)
+            for i, result in enumerate(results):
+                self.assertEqual(parser.number(i), result)
+                self.assertEqual(eu_number_parse(words, i), result)
+            # the words are left as they were
+            self.assertEqual(words, sentence.split())
+
     def test_extract_number_eu(self):
         self.assertEqual(sorted(extract_numbers(
             "1 7 lau hamalau zortzi 157", lang='eu')), [1, 4, 7, 8, 14, 157])
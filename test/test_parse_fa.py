@@ -25,6 +25,7 @@ from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_fa import is_fractional_fa
 
 
 def setUpModule():
@@ -38,6 +39,11 @@ def tearDownModule():
 
 class TestNormalize(unittest.TestCase):
 
+    def test_is_fractional(self):
+        self.assertEqual(is_fractional_fa("سوم"), 1.0 / 3)
+        self.assertEqual(is_fractional_fa("بیستم"), 1.0 / 20)
+        self.assertEqual(is_fractional_fa("فنجان"), False)
+
     def test_extract_number(self):
         #self.assertEqual(extract_number("این تست اول است",
         #                                ordinals=True), 1)
@@ -162,6 +168,10 @@ class TestNormalize(unittest.TestCase):
                          [1.0, 2.0, 3.0])
         self.assertEqual(extract_numbers("ده بیست سه پونزده هزار و شصت و شونزده"),
                          [10, 20, 3, 15060, 16])
+        # formal spellings, and "ده" as ten rather than a tens digit
+        self.assertEqual(
+            extract_numbers("هفده سیب و پانزده گلابی و ده هزار و سیصد و هجده"),
+            [17, 15, 10318])
         
         
 
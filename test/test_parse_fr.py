@@ -444,6 +444,11 @@ class TestNormalize_fr(unittest.TestCase):
                          "1000e millésime")
         self.assertEqual(normalize("le trentième anniversaire", lang="fr-fr"),
                          "30e anniversaire")
+        self.assertEqual(normalize("c'est le trentième", lang="fr-fr"),
+                         "c'est 30e")
+        self.assertEqual(normalize("le vingt-et-unième siècle",
+                                   lang="fr-fr"),
+                         "21e siècle")
 
     # TODO function not localized
     def test_gender_fr(self):
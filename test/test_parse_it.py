@@ -116,6 +116,10 @@ class TestNormalize(unittest.TestCase):
                                         short_scale=False), 1000000100)
         self.assertEqual(extract_number('duemiliardiunmilionecentotrentadue',
                                         lang='it'), 2001000132)
+        self.assertEqual(extract_number('centottomiladuecentotredici',
+                                        lang='it'), 108213)
+        self.assertEqual(extract_number('trentotto', lang='it'), 38)
+        self.assertEqual(extract_number('ventitré', lang='it'), 23)
         self.assertEqual(extract_number('venti diciassettesimi',
                                         lang='it'), 20.0/17.0)
         self.assertEqual(extract_number('uno punto cinque', lang='it'), 1.5)
@@ -714,6 +718,12 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(normalize('questo   è  un    test   ', lang='it',
                                    remove_articles=False), 'questo è 1 test')
 
+    def test_long_text_it(self):
+        text = 'ho comprato tre mele e un chilo di pere '
+        self.assertEqual(normalize(text * 200, lang='it'),
+                         ' '.join(['ho comprato 3 mele e 1 chilo di pere'] *
+                                  200))
+
     def test_numbers_it(self):
         """
         Test cases for Italian normalize lang='it'
@@ -737,6 +747,10 @@ class TestNormalize(unittest.TestCase):
                                    lang='it'), 'test 20 e 1')
         self.assertEqual(normalize('test ventuno e ventisette',
                                    lang='it'), 'test 21 e 27')
+        self.assertEqual(normalize('cinque milioni, grazie', lang='it'),
+                         '5 1000000 grazie')
+        self.assertEqual(normalize('tremila? duecentomila, ciao',
+                                   lang='it'), '3000 200000 ciao')
 
     def test_multiple_numbers_it(self):
         self.assertEqual(extract_numbers('questo è il test uno due tre',
@@ -775,6 +789,8 @@ class TestNormalize(unittest.TestCase):
                                          short_scale=False), [6e6])
         self.assertEqual(extract_numbers('dodici maiali accompagnano \
          seimiliardi di batteri', lang='it', short_scale=True), [6e9, 12])
+        self.assertEqual(extract_numbers('cinque miliardi,', lang='it'),
+                         [1000000000, 5])
 
         # TODO case when pronounced/extracted number don't match
         # fractional numbers often fail
@@ -496,6 +496,14 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(normalize("to jest jeden i pół i pięć sześć"),
                          "to jest 1 pół 5 6")
 
+    def test_normalize_words(self):
+        self.assertEqual(normalize("jutra w następną środę wieczorem"),
+                         "jutro w następny środę wieczór")
+        self.assertEqual(normalize("trzecia godzina"), "3 godzina")
+        text = "to jest jeden i pół i pięć sześć jutra "
+        self.assertEqual(normalize(text * 500),
+                         " ".join(["to jest 1 pół 5 6 jutro"] * 500))
+
     def test_multiple_numbers(self):
         self.assertEqual(extract_numbers("to jest jeden dwa trzy  test"),
                          [1.0, 2.0, 3.0])
@@ -124,6 +124,11 @@ class TestNormalize(unittest.TestCase):
                                    remove_articles=False),
                          "isto 1 teste")
 
+    def test_symbols_pt(self):
+        self.assertEqual(normalize("isto (é) um teste!", lang="pt"),
+                         "isto é 1 teste")
+        self.assertEqual(normalize("", lang="pt"), "")
+
     def test_numbers_pt(self):
         self.assertEqual(normalize("isto e o um dois três teste", lang="pt"),
                          "isto 1 2 3 teste")
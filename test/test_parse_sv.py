@@ -158,6 +158,13 @@ class TestExtractDuration(unittest.TestCase):
         self.assertEqual(td, timedelta(minutes=30))
         self.assertEqual(remains, "om")
         
+    def test_long_extract_duration(self):
+        td, remains = extract_duration(
+            "om två timmar och en kvart " * 100 + "och en halvtimme",
+            lang='sv-se')
+        self.assertEqual(td, timedelta(hours=225, minutes=30))
+        self.assertEqual(remains, "om och " * 100 + "och")
+
     def test_invalid_extract_duration(self):
         """No duration in sentence."""
         res = extract_duration("vad är en myrslok", lang='sv-se')
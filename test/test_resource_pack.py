@@ -0,0 +1,127 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import tempfile
+import unittest
+
+from lingua_franca.format import DateTimeFormat
+from lingua_franca.internal import read_resource_file, \
+    resolve_resource_file, clear_resource_cache
+from lingua_franca.resource_pack import build_resource_pack, ResourcePack, \
+    DEFAULT_RES_DIR
+
+
+class TestResourcePack(unittest.TestCase):
+    def test_pack(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "res.pack")
+            build_resource_pack(DEFAULT_RES_DIR, filename)
+            pack = ResourcePack(filename)
+            self.assertIn("text/en-us/day.word", pack)
+            self.assertNotIn("text/en-us/nothing.word", pack)
+            for res_name in pack.names():
+                with open(os.path.join(DEFAULT_RES_DIR, res_name),
+                          "rb") as f:
+                    self.assertEqual(pack.read(res_name), f.read())
+            with self.assertRaises(KeyError):
+                pack.read("text/en-us/nothing.word")
+
+            with open(filename, "wb") as f:
+                f.write(b"not a pack")
+            with self.assertRaises(ValueError):
+                ResourcePack(filename)
+
+    def test_is_stale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            res_dir = os.path.join(tmp, "res")
+            os.makedirs(os.path.join(res_dir, "text"))
+            word = os.path.join(res_dir, "text", "day.word")
+            with open(word, "w") as f:
+                f.write("day\n")
+            filename = os.path.join(tmp, "res.pack")
+            build_resource_pack(res_dir, filename)
+            self.assertFalse(ResourcePack(filename).is_stale(res_dir))
+
+            # edited
+            with open(word, "w") as f:
+                f.write("days\n")
+            self.assertTrue(ResourcePack(filename).is_stale(res_dir))
+            build_resource_pack(res_dir, filename)
+            self.assertFalse(ResourcePack(filename).is_stale(res_dir))
+            # touched
+            stat = os.stat(word)
+            os.utime(word, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertTrue(ResourcePack(filename).is_stale(res_dir))
+            build_resource_pack(res_dir, filename)
+            # added
+            with open(os.path.join(res_dir, "text", "night.word"), "w") as f:
+                f.write("night\n")
+            self.assertTrue(ResourcePack(filename).is_stale(res_dir))
+            build_resource_pack(res_dir, filename)
+            # removed
+            os.remove(word)
+            self.assertTrue(ResourcePack(filename).is_stale(res_dir))
+
+    def test_date_time_format(self):
+        date_time_format = DateTimeFormat(os.path.join(DEFAULT_RES_DIR,
+                                                       "text"))
+        date_time_format.cache("en-us")
+        with open(os.path.join(DEFAULT_RES_DIR, "text", "en-us",
+                               "date_time.json"), encoding="utf8") as f:
+            config = json.load(f)
+        self.assertEqual(date_time_format.lang_config["en-us"]["number"],
+                         config["number"])
+        # unknown languages fall back on english
+        date_time_format.cache("xx-xx")
+        self.assertEqual(date_time_format.lang_config["xx-xx"]["number"],
+                         config["number"])
+
+    def test_read_resource_file(self):
+        res_name = os.path.join("text", "en-us", "day.word")
+        with open(resolve_resource_file(res_name), encoding="utf8") as f:
+            self.assertEqual(read_resource_file(res_name), f.read())
+        self.assertIsNone(read_resource_file("text/en-us/nothing.word"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "text", "en-us"))
+            with open(os.path.join(tmp, res_name), "w") as f:
+                f.write("sol\n")
+            self.assertEqual(read_resource_file(res_name, data_dir=tmp),
+                             "sol\n")
+        # cached, the override is gone but wasn't looked up again
+        self.assertEqual(read_resource_file(res_name, data_dir=tmp),
+                         "sol\n")
+        clear_resource_cache()
+        with open(resolve_resource_file(res_name), encoding="utf8") as f:
+            self.assertEqual(read_resource_file(res_name, data_dir=tmp),
+                             f.read())
+
+    def test_missing_resource(self):
+        """ Resources not found are looked up again on the next read """
+        res_name = os.path.join("text", "xx-xx", "day.word")
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(read_resource_file(res_name, data_dir=tmp))
+            os.makedirs(os.path.join(tmp, "text", "xx-xx"))
+            with open(os.path.join(tmp, res_name), "w") as f:
+                f.write("dia\n")
+            self.assertEqual(read_resource_file(res_name, data_dir=tmp),
+                             "dia\n")
+        clear_resource_cache()
+
+
+if __name__ == "__main__":
+    unittest.main()
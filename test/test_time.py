@@ -0,0 +1,54 @@
+#
+# Copyright 2020 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+
+from dateutil.tz import gettz, tzlocal
+
+from lingua_franca.time import default_timezone, get_timezone, \
+    set_default_tz, to_local, to_utc
+
+
+class TestTimezones(unittest.TestCase):
+    def tearDown(self):
+        set_default_tz(None)
+
+    def test_get_timezone(self):
+        self.assertEqual(get_timezone("Europe/Lisbon"),
+                         gettz("Europe/Lisbon"))
+        self.assertIs(get_timezone("Europe/Lisbon"),
+                      get_timezone("Europe/Lisbon"))
+        self.assertIsNone(get_timezone("Not/A_Timezone"))
+
+    def test_default_timezone(self):
+        self.assertEqual(default_timezone(), tzlocal())
+        self.assertIs(default_timezone(), default_timezone())
+        set_default_tz("America/New_York")
+        self.assertEqual(default_timezone(), gettz("America/New_York"))
+        set_default_tz(None)
+        self.assertEqual(default_timezone(), tzlocal())
+
+    def test_conversions(self):
+        set_default_tz("America/New_York")
+        dt = datetime(2020, 6, 1, 12, 0)
+        self.assertEqual(to_utc(dt), dt.replace(tzinfo=gettz("UTC")))
+        self.assertEqual(to_local(dt).tzinfo, gettz("America/New_York"))
+        self.assertEqual(to_local(dt).hour, 8)
+        self.assertEqual(to_utc(to_local(dt)), to_utc(dt))
+
+
+if __name__ == "__main__":
+    unittest.main()